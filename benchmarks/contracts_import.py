@@ -0,0 +1,73 @@
+"""
+Бенчмарк холодного старта воркера: импорт контрактов целиком против ленивого реестра.
+
+Каждый сценарий выполняется в новом интерпретаторе (как при запуске воркера),
+из времени вычитается запуск пустого интерпретатора с импортом grpc и protobuf:
+
+- eager — импорт всех *_pb2 / *_pb2_grpc модулей contracts/services (так стартует
+  воркер, импортирующий все gateway-клиенты);
+- eager_users — импорт stub'а и сообщений одного сервиса (UsersGatewayService);
+- lazy_index — создание ContractsRegistry и построение индекса, без импорта контрактов;
+- lazy_users — реестр + stub и классы сообщений метода GetUser по полным именам.
+
+Запуск:
+
+    python -m benchmarks.contracts_import --repeat 10
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+BASELINE = "import grpc, google.protobuf.message"
+
+SCENARIOS = {
+    "eager": """
+import pathlib, importlib
+for path in sorted(pathlib.Path("contracts/services").rglob("*_pb2*.py")):
+    importlib.import_module(".".join(path.with_suffix("").parts))
+""",
+    "eager_users": """
+from contracts.services.gateway.users.users_gateway_service_pb2_grpc import UsersGatewayServiceStub
+from contracts.services.gateway.users.rpc_get_user_pb2 import GetUserRequest, GetUserResponse
+""",
+    "lazy_index": """
+from clients.grpc.contracts import get_contracts_registry
+get_contracts_registry().index()
+""",
+    "lazy_users": """
+from clients.grpc.contracts import get_contracts_registry
+registry = get_contracts_registry()
+registry.stub("contracts.services.gateway.users.UsersGatewayService")
+registry.method_types("/contracts.services.gateway.users.UsersGatewayService/GetUser")
+""",
+}
+
+
+def measure(code: str, repeat: int) -> float:
+    """
+    :return: Медианное время запуска интерпретатора с кодом, секунды.
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", f"{BASELINE}\n{code}"], check=True)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=10, help="Запусков на сценарий")
+    args = parser.parse_args()
+
+    baseline = measure("", args.repeat)
+    print(f"baseline (python + grpc + protobuf): {baseline * 1000:.1f} ms")
+    print(f"{'scenario':<16}{'extra, ms':>12}")
+    for name, code in SCENARIOS.items():
+        print(f"{name:<16}{(measure(code, args.repeat) - baseline) * 1000:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
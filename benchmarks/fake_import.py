@@ -0,0 +1,82 @@
+"""
+Бенчмарк холодного старта воркера: импорт tools.fakers и создание Faker.
+
+Каждый сценарий выполняется в новом интерпретаторе (как при запуске воркера),
+из времени вычитается запуск пустого интерпретатора:
+
+- faker_default — Faker() со всеми стандартными провайдерами (так fakers.py
+  создавал общий экземпляр при импорте);
+- faker_restricted — build_faker(): только провайдеры из FAKER_PROVIDERS;
+- fakers_import — импорт tools.fakers (Faker не создаётся);
+- fakers_email — импорт и первый fake.email() без пула (restricted Faker
+  и набор локальных частей email'ов);
+- fakers_snapshot — импорт и первый fake.email() с заранее сохранённым пулом
+  (FAKE_POOL_FILE): Faker не импортируется вовсе.
+
+Основную часть стоимости Faker составляет импорт пакета (faker.config ищет все локали),
+поэтому выигрыш дают ленивое создание и сохранённый пул. Отдельно в текущем процессе
+измеряется создание одного экземпляра — его платит каждый Fake.for_user() без пула.
+
+Запуск:
+
+    python -m benchmarks.fake_import --repeat 10
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+
+SCENARIOS = {
+    "faker_default": ("from faker import Faker\nFaker()", False),
+    "faker_restricted": ("from tools.fakers import build_faker\nbuild_faker()", False),
+    "fakers_import": ("import tools.fakers", False),
+    "fakers_email": ("from tools.fakers import fake\nfake.email()", False),
+    "fakers_snapshot": ("from tools.fakers import fake\nfake.email()", True),
+}
+
+
+def measure(code: str, repeat: int, env: dict[str, str] | None = None) -> float:
+    """
+    :return: Медианное время запуска интерпретатора с кодом, секунды.
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True, env=env)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=10, help="Запусков на сценарий")
+    parser.add_argument("--pool-size", type=int, default=10_000, help="Размер сохранённого пула")
+    args = parser.parse_args()
+
+    from faker import Faker
+
+    from tools.fakers import FakePool, build_faker
+
+    with tempfile.TemporaryDirectory() as directory:
+        snapshot = os.path.join(directory, "fake_pool.json")
+        FakePool.generate(build_faker(), args.pool_size).dump(snapshot)
+        snapshot_env = {**os.environ, "FAKE_POOL_FILE": snapshot}
+
+        baseline = measure("", args.repeat)
+        print(f"baseline (python): {baseline * 1000:.1f} ms")
+        print(f"{'scenario':<20}{'extra, ms':>12}")
+        for name, (code, with_snapshot) in SCENARIOS.items():
+            elapsed = measure(code, args.repeat, snapshot_env if with_snapshot else None)
+            print(f"{name:<20}{(elapsed - baseline) * 1000:>12.1f}")
+
+    print(f"{'instance':<20}{'create, ms':>12}")
+    for name, factory in {"Faker()": Faker, "build_faker()": build_faker}.items():
+        print(f"{name:<20}{min(timeit.repeat(factory, number=20, repeat=3)) / 20 * 1000:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Бенчмарк генерации тестовых данных для тел запросов.
+
+Сравнивает стоимость полей Fake и целых MakePurchaseOperationRequestSchema
+(status, amount и category заполняются через default_factory) в трёх режимах:
+
+- faker — каждое значение генерируется провайдерами Faker;
+- pool — имена, телефоны и email'ы из FakePool;
+- batches — пул плюс пакетная генерация сумм, категорий и enum (BatchSampler).
+
+Fake.email() ни в одном режиме не вызывает Faker на каждый email: он выбирает готовую
+пару (локальная часть, домен) из EmailParts и добавляет уникальный суффикс. Поэтому
+строка «email (parts + unique id)» измеряет именно эту схему, а стоимость генерации
+email'а провайдером Faker показана отдельной строкой «faker.email()».
+
+Запуск:
+
+    python -m benchmarks.fake_payloads --number 20000
+"""
+import argparse
+import timeit
+from typing import Any, Callable
+
+from clients.http.gateway.operations.schema import MakePurchaseOperationRequestSchema, OperationStatus
+from tools.fakers import FakePool, fake
+
+
+def build_calls() -> dict[str, Callable[[], Any]]:
+    return {
+        "amount": fake.amount,
+        "category": fake.category,
+        "enum(OperationStatus)": lambda: fake.enum(OperationStatus),
+        "last_name": fake.last_name,
+        "faker.email()": lambda: fake.faker.email(),
+        "email (parts + unique id)": fake.email,
+        "make_purchase_operation": lambda: MakePurchaseOperationRequestSchema(cardId="card", accountId="account"),
+    }
+
+
+def measure(func: Callable[[], Any], number: int) -> float:
+    """
+    :return: Среднее время одного вызова в микросекундах (лучший из трёх прогонов).
+    """
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=20_000, help="Вызовов на замер")
+    parser.add_argument("--pool-size", type=int, default=10_000)
+    parser.add_argument("--batch-size", type=int, default=4096)
+    args = parser.parse_args()
+
+    report: dict[str, dict[str, float]] = {}
+
+    fake.use_pool(None)
+    fake.use_batches(None)
+    report["faker"] = {name: measure(call, args.number) for name, call in build_calls().items()}
+
+    fake.use_pool(FakePool.generate(fake.faker, args.pool_size))
+    report["pool"] = {name: measure(call, args.number) for name, call in build_calls().items()}
+
+    fake.use_batches(args.batch_size)
+    report["batches"] = {name: measure(call, args.number) for name, call in build_calls().items()}
+
+    print(f"{'call':<28}" + "".join(f"{mode + ', us':>14}" for mode in report))
+    for name in report["faker"]:
+        print(f"{name:<28}" + "".join(f"{results[name]:>14.2f}" for results in report.values()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Локальная заглушка http-gateway для бенчмарков клиентов.
+
+ASGI-приложение без зависимостей, которое отдаёт заранее сериализованные ответы
+для эндпоинтов /api/v1/operations. Запускается через hypercorn, который умеет
+HTTP/1.1 и HTTP/2 (в том числе h2c с prior knowledge):
+
+    python -m hypercorn benchmarks.gateway_standin:app --bind 127.0.0.1:8013
+"""
+import json
+import uuid
+
+OPERATION = {
+    "id": str(uuid.uuid4()),
+    "type": "TOP_UP",
+    "status": "COMPLETED",
+    "amount": 100.5,
+    "cardId": str(uuid.uuid4()),
+    "category": "taxi",
+    "createdAt": "2025-01-01T00:00:00",
+    "accountId": str(uuid.uuid4()),
+}
+
+
+def build_operations_payload(count: int) -> bytes:
+    """
+    Формирует тело ответа GET /api/v1/operations с заданным количеством операций.
+
+    :param count: Количество операций в списке.
+    :return: JSON в виде байтов.
+    """
+    return json.dumps({"operations": [{**OPERATION, "id": str(uuid.uuid4())} for _ in range(count)]}).encode()
+
+
+OPERATIONS_BODY = build_operations_payload(50)
+OPERATION_BODY = json.dumps({"operation": OPERATION}).encode()
+RECEIPT_BODY = json.dumps({"receipt": {"url": "http://localhost/receipt.pdf", "document": "receipt"}}).encode()
+SUMMARY_BODY = json.dumps(
+    {"summary": {"spentAmount": 10.0, "receivedAmount": 20.0, "cashbackAmount": 1.0}}
+).encode()
+
+
+def route(method: str, path: str) -> bytes | None:
+    """
+    Сопоставляет запрос с заготовленным ответом.
+
+    :return: Тело ответа или None, если маршрут неизвестен.
+    """
+    if method == "POST" and path.startswith("/api/v1/operations/make-"):
+        return OPERATION_BODY
+    if method != "GET":
+        return None
+    if path == "/api/v1/operations":
+        return OPERATIONS_BODY
+    if path == "/api/v1/operations/operations-summary":
+        return SUMMARY_BODY
+    if path.startswith("/api/v1/operations/operation-receipt/"):
+        return RECEIPT_BODY
+    if path.startswith("/api/v1/operations/"):
+        return OPERATION_BODY
+    return None
+
+
+async def app(scope, receive, send):
+    if scope["type"] != "http":
+        return
+
+    # Дочитываем тело запроса, чтобы соединение оставалось в корректном состоянии
+    more_body = True
+    while more_body:
+        message = await receive()
+        more_body = message.get("more_body", False)
+
+    body = route(scope["method"], scope["path"])
+    status = 200 if body is not None else 404
+    body = body or b'{"detail": "Not Found"}'
+
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+    })
+    await send({"type": "http.response.body", "body": body})
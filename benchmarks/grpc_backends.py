@@ -0,0 +1,174 @@
+"""
+Бенчмарк бэкендов конкурентности gRPC-клиентов: gevent, потоки и asyncio.
+
+Поднимает заглушку grpc-gateway (benchmarks.grpc_gateway_standin) и для каждого
+бэкенда запускает отдельный процесс (инициализация gevent необратима), в котором
+concurrency виртуальных пользователей вызывают OperationsGatewayGRPCClient.get_operation_api
+(для asyncio — AsyncOperationsGatewayGRPCClient). Печатает rps и p50/p99.
+
+Запуск:
+
+    python -m benchmarks.grpc_backends --requests 20000 --concurrency 100
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+# Модули gRPC импортируются внутри функций: под gevent сначала должен выполниться monkey.patch_all()
+BACKENDS = ["gevent", "threads", "asyncio"]
+
+
+def summarize(latencies: list[float], elapsed: float) -> dict:
+    percentiles = statistics.quantiles(latencies, n=100)
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50_ms": percentiles[49] * 1000,
+        "p99_ms": percentiles[98] * 1000,
+    }
+
+
+def run_sync(backend: str, target: str, requests: int, concurrency: int) -> dict:
+    """
+    Синхронный клиент: concurrency greenlet'ов (gevent) или потоков (threads).
+    """
+    if backend == "gevent":
+        from gevent import monkey
+        monkey.patch_all()
+
+    import grpc
+
+    from clients.grpc.backend import configure_grpc_backend
+    from clients.grpc.gateway.operations.client import OperationsGatewayGRPCClient
+    from clients.grpc.options import GRPCClientOptions
+    from contracts.services.gateway.operations.rpc_get_operation_pb2 import GetOperationRequest
+
+    configure_grpc_backend(backend)
+
+    channel = grpc.insecure_channel(target)
+    grpc.channel_ready_future(channel).result(timeout=10)
+    client = OperationsGatewayGRPCClient(channel=channel, options=GRPCClientOptions())
+    request = GetOperationRequest(id="operation")
+
+    latencies: list[float] = []
+    remaining = iter(range(requests))
+
+    def user() -> None:
+        for _ in remaining:
+            started = time.perf_counter()
+            client.get_operation_api(request)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    if backend == "gevent":
+        import gevent
+        gevent.joinall([gevent.spawn(user) for _ in range(concurrency)], raise_error=True)
+    else:
+        import threading
+        threads = [threading.Thread(target=user) for _ in range(concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    elapsed = time.perf_counter() - started
+
+    channel.close()
+    return summarize(latencies, elapsed)
+
+
+def run_asyncio(target: str, requests: int, concurrency: int) -> dict:
+    """
+    Асинхронный клиент grpc.aio: concurrency задач в одном event loop.
+    """
+    import asyncio
+
+    from grpc import aio
+
+    from clients.grpc.backend import configure_grpc_backend
+    from clients.grpc.gateway.operations.aio import AsyncOperationsGatewayGRPCClient
+    from clients.grpc.options import GRPCClientOptions
+    from contracts.services.gateway.operations.rpc_get_operation_pb2 import GetOperationRequest
+
+    configure_grpc_backend("asyncio")
+
+    async def run() -> dict:
+        channel = aio.insecure_channel(target)
+        await channel.channel_ready()
+        client = AsyncOperationsGatewayGRPCClient(channel=channel, options=GRPCClientOptions())
+        request = GetOperationRequest(id="operation")
+
+        latencies: list[float] = []
+        remaining = iter(range(requests))
+
+        async def user() -> None:
+            for _ in remaining:
+                started = time.perf_counter()
+                await client.get_operation_api(request)
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(user() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+        await client.close()
+        return summarize(latencies, elapsed)
+
+    return asyncio.run(run())
+
+
+def run_worker(backend: str, target: str, requests: int, concurrency: int) -> None:
+    """
+    Точка входа процесса-исполнителя: печатает результат одной строкой JSON.
+    """
+    if backend == "asyncio":
+        result = run_asyncio(target, requests, concurrency)
+    else:
+        run_sync(backend, target, min(requests, concurrency * 10), concurrency)  # прогрев
+        result = run_sync(backend, target, requests, concurrency)
+    print(json.dumps(result))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20_000, help="Вызовов на бэкенд")
+    parser.add_argument("--concurrency", type=int, default=100, help="Виртуальных пользователей")
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=BACKENDS)
+    parser.add_argument("--port", type=int, default=9013)
+    parser.add_argument("--worker", choices=BACKENDS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    target = f"127.0.0.1:{args.port}"
+    if args.worker:
+        run_worker(args.worker, target, args.requests, args.concurrency)
+        return
+
+    server = subprocess.Popen([
+        sys.executable, "-m", "benchmarks.grpc_gateway_standin", "--port", str(args.port),
+    ])
+    try:
+        report = {}
+        for backend in args.backends:
+            output = subprocess.run(
+                [
+                    sys.executable, "-m", "benchmarks.grpc_backends", "--worker", backend,
+                    "--requests", str(args.requests), "--concurrency", str(args.concurrency),
+                    "--port", str(args.port),
+                ],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            report[backend] = json.loads(output.strip().splitlines()[-1])
+    finally:
+        server.terminate()
+        server.wait()
+
+    print(f"{'backend':<12}{'rps':>10}{'p50, ms':>10}{'p99, ms':>10}")
+    for backend, row in report.items():
+        print(f"{backend:<12}{row['rps']:>10.0f}{row['p50_ms']:>10.2f}{row['p99_ms']:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Бенчмарк пула gRPC-каналов: как пропускная способность зависит от размера пула.
+
+Поднимает заглушку grpc-gateway (benchmarks.grpc_gateway_standin) отдельным
+процессом и для каждого размера пула выполняет одинаковое число вызовов
+GetOperation через ChannelPool, удерживая concurrency вызовов «в полёте» (future API).
+
+Эффект пула виден, когда concurrency больше лимита потоков одного соединения
+(--max-streams): на одном канале лишние вызовы ждут свободного потока или отклоняются
+сервером (RST_STREAM REFUSED_STREAM -> UNAVAILABLE), а пул из size каналов вмещает
+size * max_streams вызовов. Ошибки не прерывают прогон, а считаются по кодам.
+
+Печатает rps и p50/p99 успешных вызовов, ошибки, пиковое число вызовов в полёте
+по каждому каналу (равномерность раздачи) и отметку, превышает ли concurrency
+суммарный лимит потоков пула.
+
+Запуск:
+
+    python -m benchmarks.grpc_channel_pool --requests 20000 --concurrency 200 --max-streams 50 --sizes 1 2 4 8
+"""
+import argparse
+import collections
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+import grpc
+
+from clients.grpc.pool import ChannelPool
+from contracts.services.gateway.operations.operations_gateway_service_pb2_grpc import OperationsGatewayServiceStub
+from contracts.services.gateway.operations.rpc_get_operation_pb2 import GetOperationRequest
+
+
+def run_pool(target: str, size: int, requests: int, concurrency: int) -> dict:
+    """
+    Выполняет requests вызовов через пул из size каналов.
+
+    :return: rps, p50/p99 успешных вызовов в миллисекундах, ошибки по кодам
+             и пиковое число вызовов в полёте по каждому каналу.
+    """
+    pool = ChannelPool(size, factory=lambda options: grpc.insecure_channel(target, options=options))
+    stub = OperationsGatewayServiceStub(pool)
+    request = GetOperationRequest(id="operation")
+
+    for channel in pool.channels:
+        grpc.channel_ready_future(channel).result(timeout=10)
+
+    slots = threading.BoundedSemaphore(concurrency)
+    latencies: list[float] = []
+    peak_in_flight = [0] * size
+    errors: collections.Counter[str] = collections.Counter()
+
+    def on_done(future: grpc.Future, started: float) -> None:
+        error = future.exception()
+        if error is None:
+            latencies.append(time.perf_counter() - started)
+        else:
+            errors[error.code().name if isinstance(error, grpc.RpcError) else type(error).__name__] += 1
+        slots.release()
+
+    started = time.perf_counter()
+    for index in range(requests):
+        slots.acquire()
+        call_started = time.perf_counter()
+        stub.GetOperation.future(request).add_done_callback(lambda f, s=call_started: on_done(f, s))
+        if index % 10 == 0:
+            peak_in_flight = [max(peak, current) for peak, current in zip(peak_in_flight, pool.in_flight())]
+
+    for _ in range(concurrency):
+        slots.acquire()  # дожидаемся завершения всех вызовов
+    elapsed = time.perf_counter() - started
+    pool.close()
+
+    percentiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else [float("nan")] * 99
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50_ms": percentiles[49] * 1000,
+        "p99_ms": percentiles[98] * 1000,
+        "errors": dict(errors),
+        "peak_in_flight": peak_in_flight,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20_000, help="Вызовов на размер пула")
+    parser.add_argument("--concurrency", type=int, default=200, help="Вызовов в полёте")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 2, 4, 8], help="Размеры пула")
+    parser.add_argument("--max-streams", type=int, default=50, help="Лимит потоков на соединение у заглушки")
+    parser.add_argument("--port", type=int, default=9013)
+    args = parser.parse_args()
+
+    target = f"127.0.0.1:{args.port}"
+    server = subprocess.Popen([
+        sys.executable, "-m", "benchmarks.grpc_gateway_standin",
+        "--port", str(args.port), "--max-streams", str(args.max_streams),
+    ])
+    try:
+        report = {size: run_pool(target, size, args.requests, args.concurrency) for size in args.sizes}
+    finally:
+        server.terminate()
+        server.wait()
+
+    print(f"{'pool size':<12}{'over limit':>12}{'rps':>10}{'p50, ms':>10}{'p99, ms':>10}  {'errors':<24}peak in-flight per channel")
+    for size, row in report.items():
+        over_limit = "yes" if args.concurrency > size * args.max_streams else "no"
+        errors = ", ".join(f"{code}={count}" for code, count in row["errors"].items()) or "-"
+        print(
+            f"{size:<12}{over_limit:>12}{row['rps']:>10.0f}{row['p50_ms']:>10.2f}{row['p99_ms']:>10.2f}"
+            f"  {errors:<24}{row['peak_in_flight']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Локальная заглушка grpc-gateway для бенчмарков gRPC-клиентов.
+
+Поднимает OperationsGatewayService с заранее подготовленными ответами на
+GetOperation, GetOperations и MakeTopUpOperation. Запускается отдельным процессом,
+чтобы сервер не делил GIL с генератором нагрузки:
+
+    python -m benchmarks.grpc_gateway_standin --port 9013 --max-streams 100
+
+--max-streams ограничивает число одновременных потоков на одно HTTP/2-соединение,
+как это делают реальные gateway и прокси перед ними.
+"""
+import argparse
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import grpc
+
+from contracts.services.gateway.operations.operations_gateway_service_pb2_grpc import (
+    OperationsGatewayServiceServicer,
+    add_OperationsGatewayServiceServicer_to_server,
+)
+from contracts.services.gateway.operations.rpc_get_operation_pb2 import GetOperationResponse
+from contracts.services.gateway.operations.rpc_get_operations_pb2 import GetOperationsResponse
+from contracts.services.gateway.operations.rpc_make_top_up_operation_pb2 import MakeTopUpOperationResponse
+from contracts.services.operations.operation_pb2 import Operation, OperationStatus, OperationType
+
+OPERATION = Operation(
+    id=str(uuid.uuid4()),
+    type=OperationType.OPERATION_TYPE_TOP_UP,
+    status=OperationStatus.OPERATION_STATUS_COMPLETED,
+    amount=100.5,
+    card_id=str(uuid.uuid4()),
+    category="taxi",
+    created_at="2025-01-01T00:00:00",
+    account_id=str(uuid.uuid4()),
+)
+
+
+class OperationsGatewayStandin(OperationsGatewayServiceServicer):
+    """
+    Отвечает заготовленными сообщениями, не обращаясь к хранилищу.
+    """
+
+    def GetOperation(self, request, context):
+        return GetOperationResponse(operation=OPERATION)
+
+    def GetOperations(self, request, context):
+        return GetOperationsResponse(operations=[OPERATION] * 50)
+
+    def MakeTopUpOperation(self, request, context):
+        return MakeTopUpOperationResponse(operation=OPERATION)
+
+
+def build_server(port: int, max_streams: int, workers: int) -> grpc.Server:
+    """
+    :param port: Порт на 127.0.0.1.
+    :param max_streams: Лимит одновременных потоков на соединение.
+    :param workers: Количество потоков-обработчиков.
+    :return: Настроенный, но ещё не запущенный сервер.
+    """
+    server = grpc.server(
+        ThreadPoolExecutor(max_workers=workers),
+        options=[("grpc.max_concurrent_streams", max_streams)]
+    )
+    add_OperationsGatewayServiceServicer_to_server(OperationsGatewayStandin(), server)
+    server.add_insecure_port(f"127.0.0.1:{port}")
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=9013)
+    parser.add_argument("--max-streams", type=int, default=100, help="Лимит потоков на соединение")
+    parser.add_argument("--workers", type=int, default=64, help="Потоков-обработчиков")
+    args = parser.parse_args()
+
+    server = build_server(args.port, args.max_streams, args.workers)
+    server.start()
+    server.wait_for_termination()
+
+
+if __name__ == "__main__":
+    main()
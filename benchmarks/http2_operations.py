@@ -0,0 +1,141 @@
+"""
+Бенчмарк HTTP/1.1 против HTTP/2 для эндпоинтов /api/v1/operations.
+
+Поднимает локальную заглушку gateway (benchmarks.gateway_standin) под hypercorn,
+после чего прогоняет одинаковую асинхронную нагрузку через
+AsyncOperationsGatewayHTTPClient в двух режимах транспорта и печатает
+пропускную способность и p50/p99 по каждому эндпоинту.
+
+Запуск (нужны пакеты hypercorn и h2):
+
+    python -m benchmarks.http2_operations --requests 20000 --concurrency 500
+"""
+import argparse
+import asyncio
+import statistics
+import subprocess
+import sys
+import time
+from typing import Awaitable, Callable
+
+from httpx import AsyncClient, ConnectError
+
+from clients.http.gateway.client import build_gateway_async_http_transport
+from clients.http.gateway.config import GatewayHTTPConfig
+from clients.http.gateway.operations.client import AsyncOperationsGatewayHTTPClient
+from clients.http.gateway.operations.schema import (
+    GetOperationsQuerySchema,
+    GetOperationsSummaryQuerySchema,
+    MakeTopUpOperationRequestSchema,
+)
+
+
+def build_endpoints(client: AsyncOperationsGatewayHTTPClient) -> dict[str, Callable[[], Awaitable]]:
+    """
+    Набор низкоуровневых вызовов, которые сравниваются между протоколами.
+    Используются *_api методы, чтобы в замер не попадала валидация ответа.
+    """
+    return {
+        "get_operations": lambda: client.get_operations_api(GetOperationsQuerySchema(accountId="account")),
+        "get_operation": lambda: client.get_operation_api("operation"),
+        "get_operation_receipt": lambda: client.get_operation_receipt_api("operation"),
+        "get_operations_summary": lambda: client.get_operations_summary_api(
+            GetOperationsSummaryQuerySchema(accountId="account")
+        ),
+        "make_top_up_operation": lambda: client.make_top_up_operation_api(
+            MakeTopUpOperationRequestSchema(cardId="card", accountId="account")
+        ),
+    }
+
+
+async def run_endpoint(call: Callable[[], Awaitable], requests: int, concurrency: int) -> tuple[float, list[float]]:
+    """
+    Выполняет requests вызовов с заданной конкурентностью.
+
+    :return: Общее время прогона и список задержек отдельных запросов (секунды).
+    """
+    latencies: list[float] = []
+    remaining = iter(range(requests))
+
+    async def worker():
+        for _ in remaining:
+            started = time.perf_counter()
+            response = await call()
+            latencies.append(time.perf_counter() - started)
+            response.raise_for_status()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - started, latencies
+
+
+async def run_mode(base_url: str, http2: bool, requests: int, concurrency: int) -> dict[str, dict]:
+    config = GatewayHTTPConfig(base_url=base_url, http2=http2, max_connections=concurrency)
+    client = AsyncOperationsGatewayHTTPClient(
+        client=AsyncClient(
+            base_url=config.base_url,
+            timeout=config.to_timeout(),
+            transport=build_gateway_async_http_transport(config)
+        )
+    )
+
+    results = {}
+    try:
+        for name, call in build_endpoints(client).items():
+            await run_endpoint(call, min(requests, concurrency * 2), concurrency)  # прогрев соединений
+            elapsed, latencies = await run_endpoint(call, requests, concurrency)
+            percentiles = statistics.quantiles(latencies, n=100)
+            results[name] = {
+                "rps": requests / elapsed,
+                "p50_ms": percentiles[49] * 1000,
+                "p99_ms": percentiles[98] * 1000,
+            }
+    finally:
+        await client.aclose()
+    return results
+
+
+async def wait_for_server(base_url: str, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with AsyncClient(base_url=base_url) as client:
+        while True:
+            try:
+                await client.get("/api/v1/operations/operations-summary")
+                return
+            except ConnectError:
+                if time.monotonic() > deadline:
+                    raise
+                await asyncio.sleep(0.1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=10_000, help="Запросов на эндпоинт")
+    parser.add_argument("--concurrency", type=int, default=200, help="Одновременных запросов")
+    parser.add_argument("--port", type=int, default=8013)
+    args = parser.parse_args()
+
+    base_url = f"http://127.0.0.1:{args.port}"
+    server = subprocess.Popen([
+        sys.executable, "-m", "hypercorn", "benchmarks.gateway_standin:app",
+        "--bind", f"127.0.0.1:{args.port}", "--log-level", "warning",
+    ])
+    try:
+        asyncio.run(wait_for_server(base_url))
+        report = {
+            "HTTP/1.1": asyncio.run(run_mode(base_url, False, args.requests, args.concurrency)),
+            "HTTP/2": asyncio.run(run_mode(base_url, True, args.requests, args.concurrency)),
+        }
+    finally:
+        server.terminate()
+        server.wait()
+
+    print(f"{'endpoint':<26}{'protocol':<10}{'rps':>10}{'p50, ms':>10}{'p99, ms':>10}")
+    for name in report["HTTP/1.1"]:
+        for protocol, results in report.items():
+            row = results[name]
+            print(f"{name:<26}{protocol:<10}{row['rps']:>10.0f}{row['p50_ms']:>10.2f}{row['p99_ms']:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Бенчмарк кодеков JSON для тел запросов и ответов gateway-клиентов.
+
+Сравнивает по каждому эндпоинту стоимость кодирования тела запроса и разбора тела
+ответа на стороне генератора нагрузки (сеть не участвует):
+
+- legacy — прежний путь: model_dump(by_alias=True) → json= в httpx (json.dumps) / response.json();
+- stdlib — StdlibJSONCodec: сериализатор pydantic напрямую в байты / json.loads;
+- orjson — OrjsonJSONCodec (если установлен orjson).
+
+Запуск:
+
+    python -m benchmarks.json_codec --number 20000
+"""
+import argparse
+import json
+import timeit
+from typing import Any, Callable
+
+from benchmarks.gateway_standin import OPERATION_BODY, OPERATIONS_BODY, RECEIPT_BODY, SUMMARY_BODY
+from clients.http.codecs import JSON_CODECS, JSONCodec
+from clients.http.gateway.operations.schema import (
+    MakeFeeOperationRequestSchema,
+    MakePurchaseOperationRequestSchema,
+    MakeTopUpOperationRequestSchema,
+)
+from pydantic import BaseModel
+
+
+def legacy_encode(value: Any) -> bytes:
+    """
+    Повторяет прежний путь: dict из модели, затем json.dumps внутри httpx.
+    """
+    if isinstance(value, BaseModel):
+        value = value.model_dump(by_alias=True)
+    return json.dumps(value).encode("utf-8")
+
+
+def build_request_bodies() -> dict[str, Any]:
+    return {
+        "create_user": {
+            "email": "user@example.com",
+            "lastName": "Ivanov",
+            "firstName": "Ivan",
+            "middleName": "Ivanovich",
+            "phoneNumber": "+70000000000",
+        },
+        "make_fee_operation": MakeFeeOperationRequestSchema(cardId="card", accountId="account"),
+        "make_top_up_operation": MakeTopUpOperationRequestSchema(cardId="card", accountId="account"),
+        "make_purchase_operation": MakePurchaseOperationRequestSchema(cardId="card", accountId="account"),
+    }
+
+
+def build_response_bodies() -> dict[str, bytes]:
+    return {
+        "get_operation": OPERATION_BODY,
+        "get_operations": OPERATIONS_BODY,
+        "get_operation_receipt": RECEIPT_BODY,
+        "get_operations_summary": SUMMARY_BODY,
+    }
+
+
+def measure(func: Callable[[], Any], number: int) -> float:
+    """
+    :return: Среднее время одного вызова в микросекундах (лучший из трёх прогонов).
+    """
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=20_000, help="Вызовов на замер")
+    args = parser.parse_args()
+
+    codecs: dict[str, JSONCodec] = {}
+    for name, codec in JSON_CODECS.items():
+        try:
+            codecs[name] = codec()
+        except ImportError:
+            print(f"skip {name}: not installed")
+
+    print(f"{'encode request':<28}{'legacy, us':>12}" + "".join(f"{name + ', us':>14}" for name in codecs))
+    for endpoint, body in build_request_bodies().items():
+        row = f"{endpoint:<28}{measure(lambda: legacy_encode(body), args.number):>12.2f}"
+        for codec in codecs.values():
+            row += f"{measure(lambda: codec.encode(body), args.number):>14.2f}"
+        print(row)
+
+    print()
+    print(f"{'decode response':<28}{'legacy, us':>12}" + "".join(f"{name + ', us':>14}" for name in codecs))
+    for endpoint, content in build_response_bodies().items():
+        # response.json() в httpx — это json.loads(response.content)
+        row = f"{endpoint:<28}{measure(lambda: json.loads(content), args.number):>12.2f}"
+        for codec in codecs.values():
+            row += f"{measure(lambda: codec.decode(content), args.number):>14.2f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import json
+import os
+from pathlib import Path
+from typing import ClassVar, Self
+
+from pydantic import BaseModel, ConfigDict
+
+
+class EnvConfig(BaseModel):
+    """
+    Базовый класс настроек, которые читаются из JSON-файла и переменных окружения.
+
+    Переменная окружения для поля строится как <env_prefix><ИМЯ_ПОЛЯ>, например
+    GATEWAY_HTTP_MAX_CONNECTIONS. Значения-словари и списки задаются в JSON:
+    GATEWAY_GRPC_METHOD_DEADLINES='{"GetOperations": 10}'.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    env_prefix: ClassVar[str] = ""
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> Self:
+        """
+        Загружает настройки из JSON-файла.
+
+        :param path: Путь к JSON-файлу с настройками.
+        :return: Экземпляр настроек.
+        """
+        return cls.model_validate(json.loads(Path(path).read_text()))
+
+    @classmethod
+    def from_env(cls, prefix: str | None = None) -> Self:
+        """
+        Загружает настройки из переменных окружения.
+
+        Если задана переменная <prefix>CONFIG_FILE, сначала читается файл,
+        а переменные окружения переопределяют значения из него.
+
+        :param prefix: Префикс переменных окружения; по умолчанию env_prefix класса.
+        :return: Экземпляр настроек.
+        """
+        prefix = cls.env_prefix if prefix is None else prefix
+
+        values = {}
+        config_file = os.environ.get(f"{prefix}CONFIG_FILE")
+        if config_file:
+            values.update(json.loads(Path(config_file).read_text()))
+
+        for name in cls.model_fields:
+            value = os.environ.get(f"{prefix}{name.upper()}")
+            if value is None:
+                continue
+            if value.lower() in ("", "none", "null"):
+                values[name] = None
+            elif value.lstrip().startswith(("{", "[")):
+                values[name] = json.loads(value)
+            else:
+                values[name] = value
+
+        return cls.model_validate(values)
@@ -0,0 +1,160 @@
+import asyncio
+from typing import Any, Callable, Hashable, Iterable
+
+from google.protobuf.message import Message
+from grpc import aio
+
+from clients.grpc.options import GRPCClientOptions, build_grpc_retry_condition
+from clients.grpc.serialized import build_serialized_multicallable
+from clients.retry import acall_hedged, acall_with_retry
+
+
+class AsyncGRPCClient:
+    """
+    Базовый класс асинхронного gRPC-клиента на grpc.aio.
+
+    Работает поверх asyncio без gevent: один event loop держит в полёте тысячи
+    RPC-вызовов. Соответствует бэкенду GRPCBackend.ASYNCIO (см. clients.grpc.backend).
+    Наследники создают self.stub (и self.service для call_serialized()) и выполняют вызовы через call().
+    """
+
+    def __init__(self, channel: aio.Channel, options: GRPCClientOptions | None = None):
+        """
+        Конструктор базового асинхронного клиента.
+
+        :param channel: Асинхронный gRPC-канал (grpc.aio.Channel).
+        :param options: Настройки клиента (метрики, повторы, хеджирование).
+        """
+        self.channel = channel
+        self.options = options or GRPCClientOptions()
+        self.serialized_multicallables: dict[str, Any] = {}
+
+    async def call(
+            self,
+            method: str,
+            request: Any,
+            idempotent: bool = False,
+            cache_key: Hashable | None = None
+    ) -> Any:
+        """
+        Вызывает метод stub'а с учётом политик повторов и хеджирования.
+
+        :param method: Имя метода stub'а, например GetUser.
+        :param request: gRPC-запрос.
+        :param idempotent: Можно ли безопасно повторять и хеджировать вызов (Get*-методы).
+        :param cache_key: Ключ запроса для call_serialized(); если задан, повторные
+                          запросы с тем же ключом не сериализуются заново.
+        :return: Ответ сервиса.
+        """
+        if cache_key is not None:
+            return await self.call_serialized(method, cache_key, lambda: request, idempotent)
+
+        return await self.invoke(method, getattr(self.stub, method), request, idempotent)
+
+    async def call_serialized(
+            self,
+            method: str,
+            key: Hashable,
+            build_request: Callable[[], Message],
+            idempotent: bool = False
+    ) -> Any:
+        """
+        Вызывает метод с запросом из кэша сериализованных запросов (options.serialized_requests).
+
+        Запрос создаётся и сериализуется только при первом обращении по ключу, дальше
+        отправляются готовые байты через multicallable без сериализатора. Наследник
+        должен задать self.service — дескриптор gRPC-сервиса. Если кэш не настроен,
+        выполняется обычный call().
+
+        :param method: Имя метода, например GetUser.
+        :param key: Ключ запроса в пределах метода, например ID пользователя.
+        :param build_request: Функция, создающая protobuf-запрос при промахе кэша.
+        :param idempotent: Можно ли безопасно повторять и хеджировать вызов.
+        :return: Ответ сервиса.
+        """
+        cache = self.options.serialized_requests
+        if cache is None:
+            return await self.call(method, build_request(), idempotent)
+
+        payload = cache.get((self.service.full_name, method, key), build_request)
+
+        multicallable = self.serialized_multicallables.get(method)
+        if multicallable is None:
+            multicallable = build_serialized_multicallable(self.channel, self.service, method)
+            self.serialized_multicallables[method] = multicallable
+
+        return await self.invoke(method, multicallable, payload, idempotent)
+
+    async def invoke(self, method: str, multicallable: Any, request: Any, idempotent: bool = False) -> Any:
+        """
+        Выполняет вызов multicallable с учётом политик повторов и хеджирования.
+
+        :param method: Имя метода (для дедлайнов и тегов метрик).
+        :param multicallable: Multicallable stub'а или канала.
+        :param request: gRPC-запрос (сообщение или сериализованные байты).
+        :param idempotent: Можно ли безопасно повторять и хеджировать вызов.
+        :return: Ответ сервиса.
+        """
+        options = self.options
+        kwargs = options.call_kwargs(method)
+        if options.retry is None and options.hedge is None:
+            return await multicallable(request, **kwargs)
+
+        tags = {"method": method}
+        options.retry_budget.deposit()
+
+        async def call() -> Any:
+            return await multicallable(request, **kwargs)
+
+        if options.hedge is not None and idempotent:
+            single_call = call
+
+            async def call() -> Any:
+                return await acall_hedged(
+                    single_call,
+                    options.hedge,
+                    options.retry_budget,
+                    on_hedge=lambda: options.metrics.increment("grpc.hedge", tags)
+                )
+
+        if options.retry is None:
+            return await call()
+
+        return await acall_with_retry(
+            call,
+            options.retry,
+            options.retry_budget,
+            build_grpc_retry_condition(idempotent, options.retry),
+            on_retry=lambda: options.metrics.increment("grpc.retry", tags)
+        )
+
+    async def call_many(
+            self,
+            method: str,
+            requests: Iterable[Any],
+            idempotent: bool = False,
+            depth: int | None = None
+    ) -> list[Any]:
+        """
+        Выполняет серию вызовов одного метода конкурентно, не больше depth одновременно.
+        Каждый вызов проходит через call() с повторами и хеджированием.
+
+        :param method: Имя метода stub'а, например GetOperation.
+        :param requests: gRPC-запросы.
+        :param idempotent: Можно ли безопасно повторять и хеджировать вызовы.
+        :param depth: Сколько вызовов держать в полёте; по умолчанию options.pipeline_depth.
+        :return: Список ответов в порядке запросов.
+        """
+        semaphore = asyncio.Semaphore(depth or self.options.pipeline_depth)
+
+        async def call(request: Any) -> Any:
+            async with semaphore:
+                return await self.call(method, request, idempotent)
+
+        return list(await asyncio.gather(*(call(request) for request in requests)))
+
+    async def close(self) -> None:
+        """
+        Закрывает канал, отменяя незавершённые вызовы.
+        """
+        await self.channel.close()
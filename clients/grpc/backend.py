@@ -0,0 +1,84 @@
+import os
+import sys
+import threading
+from enum import StrEnum
+
+
+class GRPCBackend(StrEnum):
+    """
+    Модель конкурентности, под которую инициализируется gRPC в процессе.
+
+    GEVENT — синхронные клиенты под gevent (например, Locust): вызовы отдают управление hub'у.
+    THREADS — синхронные клиенты в обычных потоках, gRPC работает в своей модели по умолчанию.
+    ASYNCIO — асинхронные клиенты grpc.aio (clients.grpc.aio) в event loop.
+    """
+    GEVENT = "gevent"
+    THREADS = "threads"
+    ASYNCIO = "asyncio"
+
+
+_backend: GRPCBackend | None = None
+_backend_lock = threading.Lock()
+
+
+def configure_grpc_backend(backend: GRPCBackend | str) -> GRPCBackend:
+    """
+    Настраивает gRPC под выбранный бэкенд. Вызывается генератором нагрузки при старте,
+    до создания каналов.
+
+    Для GEVENT выполняется grpc_gevent.init_gevent(). Это обязательно для gevent-фреймворков
+    (например, Locust): без инициализации gRPC использует потоковую модель (threading),
+    что блокирует greenlet'ы и нарушает конкурентное выполнение. Инициализация позволяет
+    gRPC использовать совместимую с gevent реализацию сокетов, таймеров и I/O.
+    Её нельзя отменить, поэтому после GEVENT другой бэкенд выбрать нельзя.
+
+    :param backend: Бэкенд или его имя (gevent, threads, asyncio).
+    :return: Выбранный бэкенд.
+    :raises RuntimeError: Если gRPC уже инициализирован под gevent, а выбран другой бэкенд.
+    """
+    global _backend
+    backend = GRPCBackend(backend)
+
+    with _backend_lock:
+        if _backend == backend:
+            return backend
+        if _backend == GRPCBackend.GEVENT:
+            raise RuntimeError(f"gRPC is already initialized for gevent, cannot switch to {backend}")
+
+        if backend == GRPCBackend.GEVENT:
+            # Импорт только здесь: без gevent-бэкенда пакет gevent не нужен
+            import grpc.experimental.gevent as grpc_gevent
+            grpc_gevent.init_gevent()
+
+        _backend = backend
+        return backend
+
+
+def detect_grpc_backend() -> GRPCBackend:
+    """
+    Выбирает бэкенд, если генератор нагрузки не настроил его явно.
+
+    Порядок: переменная окружения GRPC_BACKEND; gevent, если сокеты уже пропатчены
+    gevent.monkey (так делает Locust при старте); иначе потоки.
+
+    :return: Бэкенд по умолчанию.
+    """
+    name = os.environ.get("GRPC_BACKEND")
+    if name:
+        return GRPCBackend(name.lower())
+
+    monkey = sys.modules.get("gevent.monkey")
+    if monkey is not None and monkey.is_module_patched("socket"):
+        return GRPCBackend.GEVENT
+    return GRPCBackend.THREADS
+
+
+def get_grpc_backend() -> GRPCBackend:
+    """
+    Возвращает бэкенд процесса; если он ещё не настроен — настраивает бэкенд из detect_grpc_backend().
+
+    :return: Текущий бэкенд.
+    """
+    if _backend is not None:
+        return _backend
+    return configure_grpc_backend(detect_grpc_backend())
@@ -1,16 +1,13 @@
-# Импортируем поддержку работы gRPC с потоками (greenlets)
-import grpc.experimental.gevent as grpc_gevent
+from collections import deque
+from typing import Any, Callable, Hashable, Iterable
 
 # Импортируем тип канала связи (channel), через который будем общаться с сервером
-from grpc import Channel
+from grpc import Channel, RpcError
+from google.protobuf.message import Message
 
-# Инициализируем поддержку gevent в gRPC.
-# Это обязательно, если вы используете gevent-базированный фреймворк (например, Locust).
-# Без этой инициализации gRPC будет использовать потоковую модель (threading),
-# что приведёт к блокировке greenlet'ов и нарушит конкурентное выполнение.
-# Инициализация позволяет gRPC использовать совместимую с gevent реализацию
-# для работы с сокетами, таймерами и I/O, даже если код написан в синхронном стиле.
-grpc_gevent.init_gevent()
+from clients.grpc.options import GRPCClientOptions, build_grpc_retry_condition
+from clients.grpc.serialized import build_serialized_multicallable
+from clients.retry import call_hedged, call_with_retry
 
 
 class GRPCClient:
@@ -19,13 +16,174 @@ class GRPCClient:
 
     Этот класс хранит общий канал (Channel) для связи с gRPC-сервером.
     От него будут наследоваться все остальные специфические клиенты.
+    Модель конкурентности (gevent или потоки) выбирается при старте прогона
+    через clients.grpc.backend.configure_grpc_backend().
+    Наследники создают self.stub (и self.service для call_serialized()) и выполняют вызовы через call().
     """
 
-    def __init__(self, channel: Channel):
+    def __init__(self, channel: Channel, options: GRPCClientOptions | None = None):
         """
         Конструктор базового клиента.
 
         :param channel: gRPC-канал, через который происходит подключение к серверу.
                         Обычно создаётся один раз и переиспользуется.
+        :param options: Настройки клиента (метрики, повторы, хеджирование).
         """
         self.channel = channel  # Сохраняем канал внутри объекта для последующего использования
+        self.options = options or GRPCClientOptions()
+        self.serialized_multicallables: dict[str, Any] = {}
+
+    def call(
+            self,
+            method: str,
+            request: Any,
+            idempotent: bool = False,
+            cache_key: Hashable | None = None
+    ) -> Any:
+        """
+        Вызывает метод stub'а с учётом политик повторов и хеджирования.
+
+        :param method: Имя метода stub'а, например GetUser.
+        :param request: gRPC-запрос.
+        :param idempotent: Можно ли безопасно повторять и хеджировать вызов (Get*-методы).
+        :param cache_key: Ключ запроса для call_serialized(); если задан, повторные
+                          запросы с тем же ключом не сериализуются заново.
+        :return: Ответ сервиса.
+        """
+        if cache_key is not None:
+            return self.call_serialized(method, cache_key, lambda: request, idempotent)
+
+        return self.invoke(method, getattr(self.stub, method), request, idempotent)
+
+    def call_serialized(
+            self,
+            method: str,
+            key: Hashable,
+            build_request: Callable[[], Message],
+            idempotent: bool = False
+    ) -> Any:
+        """
+        Вызывает метод с запросом из кэша сериализованных запросов (options.serialized_requests).
+
+        Запрос создаётся и сериализуется только при первом обращении по ключу, дальше
+        отправляются готовые байты через multicallable без сериализатора. Наследник
+        должен задать self.service — дескриптор gRPC-сервиса. Если кэш не настроен,
+        выполняется обычный call().
+
+        :param method: Имя метода, например GetUser.
+        :param key: Ключ запроса в пределах метода, например ID пользователя.
+        :param build_request: Функция, создающая protobuf-запрос при промахе кэша.
+        :param idempotent: Можно ли безопасно повторять и хеджировать вызов.
+        :return: Ответ сервиса.
+        """
+        cache = self.options.serialized_requests
+        if cache is None:
+            return self.call(method, build_request(), idempotent)
+
+        payload = cache.get((self.service.full_name, method, key), build_request)
+
+        multicallable = self.serialized_multicallables.get(method)
+        if multicallable is None:
+            multicallable = build_serialized_multicallable(self.channel, self.service, method)
+            self.serialized_multicallables[method] = multicallable
+
+        return self.invoke(method, multicallable, payload, idempotent)
+
+    def invoke(self, method: str, multicallable: Any, request: Any, idempotent: bool = False) -> Any:
+        """
+        Выполняет вызов multicallable с учётом политик повторов и хеджирования.
+
+        :param method: Имя метода (для дедлайнов и тегов метрик).
+        :param multicallable: Multicallable stub'а или канала.
+        :param request: gRPC-запрос (сообщение или сериализованные байты).
+        :param idempotent: Можно ли безопасно повторять и хеджировать вызов.
+        :return: Ответ сервиса.
+        """
+        options = self.options
+        kwargs = options.call_kwargs(method)
+        if options.retry is None and options.hedge is None:
+            return multicallable(request, **kwargs)
+
+        tags = {"method": method}
+        options.retry_budget.deposit()
+
+        def call() -> Any:
+            return multicallable(request, **kwargs)
+
+        if options.hedge is not None and idempotent:
+            single_call = call
+
+            def call() -> Any:
+                return call_hedged(
+                    single_call,
+                    options.hedge,
+                    options.retry_budget,
+                    on_hedge=lambda: options.metrics.increment("grpc.hedge", tags)
+                )
+
+        if options.retry is None:
+            return call()
+
+        return call_with_retry(
+            call,
+            options.retry,
+            options.retry_budget,
+            build_grpc_retry_condition(idempotent, options.retry),
+            on_retry=lambda: options.metrics.increment("grpc.retry", tags)
+        )
+
+    def call_many(
+            self,
+            method: str,
+            requests: Iterable[Any],
+            idempotent: bool = False,
+            depth: int | None = None
+    ) -> list[Any]:
+        """
+        Выполняет серию вызовов одного метода конвейером через stub.Method.future().
+
+        Одновременно в полёте держится не больше depth вызовов: когда окно заполнено,
+        клиент дожидается самого старого. Ответы возвращаются в порядке запросов.
+        Хеджирование к конвейерным вызовам не применяется; вызов, упавший с повторяемой
+        ошибкой, повторяется синхронно через call() по политике повторов.
+
+        :param method: Имя метода stub'а, например GetOperation.
+        :param requests: gRPC-запросы.
+        :param idempotent: Можно ли безопасно повторять вызовы.
+        :param depth: Глубина конвейера; по умолчанию options.pipeline_depth.
+        :return: Список ответов в порядке запросов.
+        :raises grpc.RpcError: Ошибка первого неудачного вызова; оставшиеся вызовы отменяются.
+        """
+        multicallable = getattr(self.stub, method)
+
+        options = self.options
+        kwargs = options.call_kwargs(method)
+        depth = depth or options.pipeline_depth
+        should_retry = build_grpc_retry_condition(idempotent, options.retry) if options.retry is not None else None
+
+        responses = []
+        in_flight: deque[tuple[Any, Any]] = deque()
+
+        def collect() -> None:
+            request, future = in_flight.popleft()
+            try:
+                responses.append(future.result())
+            except RpcError as error:
+                if should_retry is None or not should_retry(None, error):
+                    raise
+                responses.append(self.call(method, request, idempotent))
+
+        try:
+            for request in requests:
+                if len(in_flight) >= depth:
+                    collect()
+                in_flight.append((request, multicallable.future(request, **kwargs)))
+
+            while in_flight:
+                collect()
+        except BaseException:
+            for _, future in in_flight:
+                future.cancel()
+            raise
+
+        return responses
@@ -0,0 +1,171 @@
+import importlib
+import os
+import re
+import threading
+from functools import lru_cache
+from importlib.util import find_spec
+from types import ModuleType
+from typing import Any
+
+from google.protobuf.descriptor import MethodDescriptor, ServiceDescriptor
+from google.protobuf.message import Message
+from google.protobuf.message_factory import GetMessageClass
+
+CONTRACTS_PACKAGE = "contracts.services"
+
+
+def to_snake_case(name: str) -> str:
+    """
+    :return: Имя в snake_case, например UsersGatewayService -> users_gateway_service.
+    """
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+
+class ContractsRegistry:
+    """
+    Ленивый реестр сгенерированных модулей contracts/services/**.
+
+    Импорт одного stub'а тянет за собой все rpc_*_pb2 модули сервиса, и для каждого
+    сразу строятся дескрипторы. Реестр при создании только обходит файлы пакета
+    (без импорта) и строит индекс «имя файла -> модули», а сами *_pb2 / *_pb2_grpc
+    модули импортирует при первом обращении к сообщению, сервису или stub'у.
+    Так воркер платит только за те сервисы, которые действительно вызывает.
+
+    Расположение модулей выводится из соглашений protoc: пакет proto совпадает
+    с путём каталога, сервис Xxx лежит в xxx_pb2 / xxx_pb2_grpc, а запрос и ответ
+    метода Yyy — в rpc_yyy_pb2.
+    """
+
+    def __init__(self, package: str = CONTRACTS_PACKAGE):
+        """
+        :param package: Корневой пакет сгенерированных контрактов.
+        """
+        self.package = package
+
+        self._lock = threading.Lock()
+        self._index: dict[str, list[str]] | None = None
+
+    def index(self) -> dict[str, list[str]]:
+        """
+        Индекс модулей по имени файла, например
+        {"rpc_get_user_pb2": ["contracts.services.gateway.users.rpc_get_user_pb2", ...]}.
+        Строится один раз обходом файловой системы, модули при этом не импортируются.
+
+        :return: Словарь «имя файла без .py -> полные имена модулей».
+        """
+        if self._index is not None:
+            return self._index
+
+        with self._lock:
+            if self._index is None:
+                index: dict[str, list[str]] = {}
+                for location in find_spec(self.package).submodule_search_locations:
+                    for directory, _, files in os.walk(location):
+                        relative = os.path.relpath(directory, location)
+                        prefix = self.package if relative == "." else f"{self.package}.{relative.replace(os.sep, '.')}"
+                        for file in files:
+                            if file.endswith(("_pb2.py", "_pb2_grpc.py")):
+                                index.setdefault(file[:-3], []).append(f"{prefix}.{file[:-3]}")
+                self._index = index
+        return self._index
+
+    def module(self, name: str) -> ModuleType:
+        """
+        Импортирует модуль контрактов при первом обращении.
+
+        :param name: Полное имя модуля или имя файла (rpc_get_user_pb2), если оно однозначно.
+        :return: Модуль.
+        :raises LookupError: Если модуль не найден или имя файла неоднозначно.
+        """
+        if name.startswith(f"{self.package}."):
+            if name not in self.index().get(name.rsplit(".", 1)[-1], []):
+                raise LookupError(f"Contracts module {name!r} is not found")
+            return importlib.import_module(name)
+
+        modules = self.index().get(name, [])
+        if len(modules) != 1:
+            raise LookupError(f"Contracts module {name!r} is {'ambiguous' if modules else 'not found'}: {modules}")
+        return importlib.import_module(modules[0])
+
+    def service(self, full_name: str) -> ServiceDescriptor:
+        """
+        :param full_name: Полное имя сервиса, например contracts.services.gateway.users.UsersGatewayService.
+        :return: Дескриптор сервиса.
+        """
+        package, name = full_name.rsplit(".", 1)
+        module = self.module(f"{package}.{to_snake_case(name)}_pb2")
+        descriptor = module.DESCRIPTOR.services_by_name.get(name)
+        if descriptor is None:
+            raise LookupError(f"Contracts service {full_name!r} is not found")
+        return descriptor
+
+    def stub(self, full_name: str) -> type:
+        """
+        :param full_name: Полное имя сервиса.
+        :return: Класс stub'а, например UsersGatewayServiceStub.
+        """
+        package, name = full_name.rsplit(".", 1)
+        module = self.module(f"{package}.{to_snake_case(name)}_pb2_grpc")
+        return getattr(module, f"{name}Stub")
+
+    def method(self, full_method: str) -> MethodDescriptor:
+        """
+        :param full_method: Полное имя метода в формате gRPC, например
+                            /contracts.services.gateway.users.UsersGatewayService/GetUser.
+        :return: Дескриптор метода.
+        :raises LookupError: Если имя метода некорректно или у сервиса нет такого метода.
+        """
+        service, _, method = full_method.lstrip("/").partition("/")
+        descriptor = self.service(service).methods_by_name.get(method) if method else None
+        if descriptor is None:
+            raise LookupError(f"Contracts method {full_method!r} is not found")
+        return descriptor
+
+    def message(self, full_name: str) -> type[Message]:
+        """
+        Класс сообщения по полному имени, например contracts.services.gateway.users.GetUserRequest.
+
+        Сначала проверяются модули по соглашению (rpc_get_user_pb2 для GetUserRequest,
+        operation_pb2 для Operation), затем — все *_pb2 модули пакета.
+
+        :param full_name: Полное имя сообщения.
+        :return: Класс сообщения.
+        :raises LookupError: Если сообщение не найдено.
+        """
+        package, name = full_name.rsplit(".", 1)
+
+        candidates = [f"{package}.{to_snake_case(name)}_pb2"]
+        rpc = re.fullmatch(r"(.+?)(Request|Response)", name)
+        if rpc is not None:
+            candidates.insert(0, f"{package}.rpc_{to_snake_case(rpc.group(1))}_pb2")
+        candidates += [
+            module
+            for modules in self.index().values()
+            for module in modules
+            if module.rsplit(".", 1)[0] == package and module.endswith("_pb2") and module not in candidates
+        ]
+
+        known = {module for modules in self.index().values() for module in modules}
+        for candidate in candidates:
+            if candidate not in known:
+                continue
+            message: Any = getattr(self.module(candidate), name, None)
+            if message is not None:
+                return message
+        raise LookupError(f"Contracts message {full_name!r} is not found")
+
+    def method_types(self, full_method: str) -> tuple[type[Message], type[Message]]:
+        """
+        :param full_method: Полное имя метода в формате gRPC.
+        :return: Классы запроса и ответа метода.
+        """
+        descriptor = self.method(full_method)
+        return GetMessageClass(descriptor.input_type), GetMessageClass(descriptor.output_type)
+
+
+@lru_cache(maxsize=None)
+def get_contracts_registry() -> ContractsRegistry:
+    """
+    :return: Реестр контрактов процесса.
+    """
+    return ContractsRegistry()
@@ -0,0 +1,140 @@
+from grpc import aio
+
+from clients.grpc.aio import AsyncGRPCClient
+from clients.grpc.gateway.client import build_gateway_async_grpc_client, build_gateway_grpc_client_options
+from clients.grpc.options import GRPCClientOptions
+from contracts.services.gateway.accounts.rpc_get_accounts_pb2 import GetAccountsRequest, GetAccountsResponse
+from contracts.services.gateway.accounts.rpc_open_credit_card_account_pb2 import OpenCreditCardAccountRequest, OpenCreditCardAccountResponse
+from contracts.services.gateway.accounts.rpc_open_debit_card_account_pb2 import OpenDebitCardAccountRequest, OpenDebitCardAccountResponse
+from contracts.services.gateway.accounts.rpc_open_deposit_account_pb2 import OpenDepositAccountRequest, OpenDepositAccountResponse
+from contracts.services.gateway.accounts.rpc_open_savings_account_pb2 import OpenSavingsAccountRequest, OpenSavingsAccountResponse
+from contracts.services.gateway.accounts.accounts_gateway_service_pb2 import DESCRIPTOR
+from contracts.services.gateway.accounts.accounts_gateway_service_pb2_grpc import AccountsGatewayServiceStub
+
+
+class AsyncAccountsGatewayGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент (grpc.aio) для взаимодействия с AccountsGatewayService.
+    Предоставляет высокоуровневые методы для открытия и получения счетов.
+    """
+
+    def __init__(self, channel: aio.Channel, options: GRPCClientOptions | None = None):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: Асинхронный gRPC-канал для подключения к AccountsGatewayService.
+        :param options: Настройки клиента (метрики, повторы, хеджирование).
+        """
+        super().__init__(channel, options)
+
+        self.stub = AccountsGatewayServiceStub(channel)  # gRPC-стаб, сгенерированный из .proto
+        self.service = DESCRIPTOR.services_by_name["AccountsGatewayService"]  # для call_serialized()
+
+    async def get_accounts_api(self, request: GetAccountsRequest, cache_key: str | None = None) -> GetAccountsResponse:
+        """
+        Низкоуровневый вызов метода GetAccounts через gRPC.
+
+        :param request: gRPC-запрос получения списка счетов пользователя.
+        :param cache_key: Ключ кэша сериализованных запросов (см. AsyncGRPCClient.call).
+        :return: Ответ от сервиса.
+        """
+        return await self.call("GetAccounts", request, idempotent=True, cache_key=cache_key)
+
+    async def open_deposit_account_api(self, request: OpenDepositAccountRequest) -> OpenDepositAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenDepositAccount через gRPC.
+
+        :param request: gRPC-запрос открытия депозитного счёта.
+        :return: Ответ от сервиса.
+        """
+        return await self.call("OpenDepositAccount", request)
+
+    async def open_savings_account_api(self, request: OpenSavingsAccountRequest) -> OpenSavingsAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenSavingsAccount через gRPC.
+
+        :param request: gRPC-запрос открытия сберегательного счёта.
+        :return: Ответ от сервиса.
+        """
+        return await self.call("OpenSavingsAccount", request)
+
+    async def open_debit_card_account_api(self, request: OpenDebitCardAccountRequest) -> OpenDebitCardAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenDebitCardAccount через gRPC.
+
+        :param request: gRPC-запрос открытия дебетового счёта.
+        :return: Ответ от сервиса.
+        """
+        return await self.call("OpenDebitCardAccount", request)
+
+    async def open_credit_card_account_api(self, request: OpenCreditCardAccountRequest) -> OpenCreditCardAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenCreditCardAccount через gRPC.
+
+        :param request: gRPC-запрос открытия кредитного счёта.
+        :return: Ответ от сервиса.
+        """
+        return await self.call("OpenCreditCardAccount", request)
+
+    async def get_accounts(self, user_id: str) -> GetAccountsResponse:
+        """
+        Получение списка счетов пользователя.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ от сервиса.
+        """
+        return await self.get_accounts_api(GetAccountsRequest(user_id=user_id), cache_key=user_id)
+
+    async def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponse:
+        """
+        Открытие депозитного счёта.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ от сервиса.
+        """
+        request = OpenDepositAccountRequest(user_id=user_id)
+        return await self.open_deposit_account_api(request)
+
+    async def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponse:
+        """
+        Открытие сберегательного счёта.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ от сервиса.
+        """
+        request = OpenSavingsAccountRequest(user_id=user_id)
+        return await self.open_savings_account_api(request)
+
+    async def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponse:
+        """
+        Открытие дебетового счёта.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ от сервиса.
+        """
+        request = OpenDebitCardAccountRequest(user_id=user_id)
+        return await self.open_debit_card_account_api(request)
+
+    async def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponse:
+        """
+        Открытие кредитного счёта.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ от сервиса.
+        """
+        request = OpenCreditCardAccountRequest(user_id=user_id)
+        return await self.open_credit_card_account_api(request)
+
+
+def build_async_accounts_gateway_grpc_client() -> AsyncAccountsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncAccountsGatewayGRPCClient.
+
+    Вызывается внутри запущенного event loop.
+
+    :return: Инициализированный клиент для AccountsGatewayService.
+    """
+    return AsyncAccountsGatewayGRPCClient(
+        channel=build_gateway_async_grpc_client(),
+        options=build_gateway_grpc_client_options()
+    )
@@ -0,0 +1,136 @@
+from grpc import Channel
+from clients.grpc.client import GRPCClient, GRPCClientOptions
+from clients.grpc.gateway.client import build_gateway_grpc_client, build_gateway_grpc_client_options
+from contracts.services.gateway.accounts.rpc_get_accounts_pb2 import GetAccountsRequest, GetAccountsResponse
+from contracts.services.gateway.accounts.rpc_open_credit_card_account_pb2 import OpenCreditCardAccountRequest, OpenCreditCardAccountResponse
+from contracts.services.gateway.accounts.rpc_open_debit_card_account_pb2 import OpenDebitCardAccountRequest, OpenDebitCardAccountResponse
+from contracts.services.gateway.accounts.rpc_open_deposit_account_pb2 import OpenDepositAccountRequest, OpenDepositAccountResponse
+from contracts.services.gateway.accounts.rpc_open_savings_account_pb2 import OpenSavingsAccountRequest, OpenSavingsAccountResponse
+from contracts.services.gateway.accounts.accounts_gateway_service_pb2 import DESCRIPTOR
+from contracts.services.gateway.accounts.accounts_gateway_service_pb2_grpc import AccountsGatewayServiceStub
+
+
+class AccountsGatewayGRPCClient(GRPCClient):
+    """
+    gRPC-клиент для взаимодействия с AccountsGatewayService.
+    Предоставляет высокоуровневые методы для открытия и получения счетов.
+    """
+
+    def __init__(self, channel: Channel, options: GRPCClientOptions | None = None):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: gRPC-канал для подключения к AccountsGatewayService.
+        :param options: Настройки клиента (метрики, повторы, хеджирование).
+        """
+        super().__init__(channel, options)
+
+        self.stub = AccountsGatewayServiceStub(channel)  # gRPC-стаб, сгенерированный из .proto
+        self.service = DESCRIPTOR.services_by_name["AccountsGatewayService"]  # для call_serialized()
+
+    def get_accounts_api(self, request: GetAccountsRequest, cache_key: str | None = None) -> GetAccountsResponse:
+        """
+        Низкоуровневый вызов метода GetAccounts через gRPC.
+
+        :param request: gRPC-запрос получения списка счетов пользователя.
+        :param cache_key: Ключ кэша сериализованных запросов (см. GRPCClient.call).
+        :return: Ответ от сервиса.
+        """
+        return self.call("GetAccounts", request, idempotent=True, cache_key=cache_key)
+
+    def open_deposit_account_api(self, request: OpenDepositAccountRequest) -> OpenDepositAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenDepositAccount через gRPC.
+
+        :param request: gRPC-запрос открытия депозитного счёта.
+        :return: Ответ от сервиса.
+        """
+        return self.call("OpenDepositAccount", request)
+
+    def open_savings_account_api(self, request: OpenSavingsAccountRequest) -> OpenSavingsAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenSavingsAccount через gRPC.
+
+        :param request: gRPC-запрос открытия сберегательного счёта.
+        :return: Ответ от сервиса.
+        """
+        return self.call("OpenSavingsAccount", request)
+
+    def open_debit_card_account_api(self, request: OpenDebitCardAccountRequest) -> OpenDebitCardAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenDebitCardAccount через gRPC.
+
+        :param request: gRPC-запрос открытия дебетового счёта.
+        :return: Ответ от сервиса.
+        """
+        return self.call("OpenDebitCardAccount", request)
+
+    def open_credit_card_account_api(self, request: OpenCreditCardAccountRequest) -> OpenCreditCardAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenCreditCardAccount через gRPC.
+
+        :param request: gRPC-запрос открытия кредитного счёта.
+        :return: Ответ от сервиса.
+        """
+        return self.call("OpenCreditCardAccount", request)
+
+    def get_accounts(self, user_id: str) -> GetAccountsResponse:
+        """
+        Получение списка счетов пользователя.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ от сервиса.
+        """
+        return self.get_accounts_api(GetAccountsRequest(user_id=user_id), cache_key=user_id)
+
+    def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponse:
+        """
+        Открытие депозитного счёта.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ от сервиса.
+        """
+        request = OpenDepositAccountRequest(user_id=user_id)
+        return self.open_deposit_account_api(request)
+
+    def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponse:
+        """
+        Открытие сберегательного счёта.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ от сервиса.
+        """
+        request = OpenSavingsAccountRequest(user_id=user_id)
+        return self.open_savings_account_api(request)
+
+    def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponse:
+        """
+        Открытие дебетового счёта.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ от сервиса.
+        """
+        request = OpenDebitCardAccountRequest(user_id=user_id)
+        return self.open_debit_card_account_api(request)
+
+    def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponse:
+        """
+        Открытие кредитного счёта.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ от сервиса.
+        """
+        request = OpenCreditCardAccountRequest(user_id=user_id)
+        return self.open_credit_card_account_api(request)
+
+
+def build_accounts_gateway_grpc_client() -> AccountsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AccountsGatewayGRPCClient.
+
+    :return: Инициализированный клиент для AccountsGatewayService.
+    """
+    return AccountsGatewayGRPCClient(
+        channel=build_gateway_grpc_client(),
+        options=build_gateway_grpc_client_options()
+    )
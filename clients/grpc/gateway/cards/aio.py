@@ -0,0 +1,80 @@
+from grpc import aio
+
+from clients.grpc.aio import AsyncGRPCClient
+from clients.grpc.gateway.client import build_gateway_async_grpc_client, build_gateway_grpc_client_options
+from clients.grpc.options import GRPCClientOptions
+from contracts.services.gateway.cards.rpc_issue_physical_card_pb2 import IssuePhysicalCardRequest, IssuePhysicalCardResponse
+from contracts.services.gateway.cards.rpc_issue_virtual_card_pb2 import IssueVirtualCardRequest, IssueVirtualCardResponse
+from contracts.services.gateway.cards.cards_gateway_service_pb2_grpc import CardsGatewayServiceStub
+
+
+class AsyncCardsGatewayGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент (grpc.aio) для взаимодействия с CardsGatewayService.
+    Предоставляет высокоуровневые методы для выпуска карт.
+    """
+
+    def __init__(self, channel: aio.Channel, options: GRPCClientOptions | None = None):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: Асинхронный gRPC-канал для подключения к CardsGatewayService.
+        :param options: Настройки клиента (метрики, повторы, хеджирование).
+        """
+        super().__init__(channel, options)
+
+        self.stub = CardsGatewayServiceStub(channel)  # gRPC-стаб, сгенерированный из .proto
+
+    async def issue_virtual_card_api(self, request: IssueVirtualCardRequest) -> IssueVirtualCardResponse:
+        """
+        Низкоуровневый вызов метода IssueVirtualCard через gRPC.
+
+        :param request: gRPC-запрос выпуска виртуальной карты.
+        :return: Ответ от сервиса.
+        """
+        return await self.call("IssueVirtualCard", request)
+
+    async def issue_physical_card_api(self, request: IssuePhysicalCardRequest) -> IssuePhysicalCardResponse:
+        """
+        Низкоуровневый вызов метода IssuePhysicalCard через gRPC.
+
+        :param request: gRPC-запрос выпуска физической карты.
+        :return: Ответ от сервиса.
+        """
+        return await self.call("IssuePhysicalCard", request)
+
+    async def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponse:
+        """
+        Выпуск виртуальной карты.
+
+        :param user_id: Идентификатор пользователя.
+        :param account_id: Идентификатор счёта.
+        :return: Ответ от сервиса.
+        """
+        request = IssueVirtualCardRequest(user_id=user_id, account_id=account_id)
+        return await self.issue_virtual_card_api(request)
+
+    async def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponse:
+        """
+        Выпуск физической карты.
+
+        :param user_id: Идентификатор пользователя.
+        :param account_id: Идентификатор счёта.
+        :return: Ответ от сервиса.
+        """
+        request = IssuePhysicalCardRequest(user_id=user_id, account_id=account_id)
+        return await self.issue_physical_card_api(request)
+
+
+def build_async_cards_gateway_grpc_client() -> AsyncCardsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncCardsGatewayGRPCClient.
+
+    Вызывается внутри запущенного event loop.
+
+    :return: Инициализированный клиент для CardsGatewayService.
+    """
+    return AsyncCardsGatewayGRPCClient(
+        channel=build_gateway_async_grpc_client(),
+        options=build_gateway_grpc_client_options()
+    )
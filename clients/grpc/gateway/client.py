@@ -1,11 +1,124 @@
-from grpc import Channel, insecure_channel
+import os
+import threading
+from functools import lru_cache
+
+from grpc import Channel, aio, insecure_channel, intercept_channel
+
+from clients.grpc.backend import get_grpc_backend
+from clients.grpc.gateway.config import get_gateway_grpc_config
+from clients.grpc.interceptors import AsyncMetricsClientInterceptor, MetricsClientInterceptor
+from clients.grpc.options import GRPCClientOptions
+from clients.grpc.pool import ChannelPool
+from clients.grpc.serialized import SerializedRequestCache
+from clients.http.gateway.config import get_gateway_http_config, get_gateway_retry_budget
+from clients.metrics import get_metrics_sink
+
+
+_channel_pools: dict[int, ChannelPool] = {}
+_channel_pools_lock = threading.Lock()
+
+
+def build_gateway_grpc_channel_pool() -> ChannelPool:
+    """
+    Создаёт пул gRPC-каналов к сервису grpc-gateway.
+
+    Размер пула, опции каналов и сжатие берутся из GatewayGRPCConfig.
+    Если приёмник метрик включён, на каждый канал ставится MetricsClientInterceptor;
+    поэтому set_metrics_sink() нужно вызывать до построения клиентов.
+    Если бэкенд gRPC ещё не выбран, он определяется автоматически (см. clients.grpc.backend).
+
+    :return: Новый пул каналов.
+    """
+    get_grpc_backend()
+
+    config = get_gateway_grpc_config()
+    metrics = get_metrics_sink()
+
+    def build_channel(options) -> Channel:
+        channel = insecure_channel(config.target, options=options, compression=config.to_compression())
+        if metrics.enabled:
+            channel = intercept_channel(channel, MetricsClientInterceptor(metrics))
+        return channel
+
+    return ChannelPool(
+        size=config.channel_pool_size,
+        factory=build_channel,
+        options=config.to_channel_options()
+    )
 
 
 def build_gateway_grpc_client() -> Channel:
     """
-    Фабричная функция (билдер) для создания gRPC-канала к сервису grpc-gateway.
+    Фабричная функция (билдер), возвращающая gRPC-канал к сервису grpc-gateway.
+
+    Все клиенты процесса получают один и тот же пул каналов: вызовы распределяются
+    по channel_pool_size соединениям по кругу. После fork дочерний процесс
+    создаёт собственный пул, соединения родителя не переиспользуются.
+
+    :return: Пул каналов (ChannelPool), реализующий интерфейс grpc.Channel.
+    """
+    pid = os.getpid()
+    with _channel_pools_lock:
+        pool = _channel_pools.get(pid)
+        if pool is None:
+            pool = _channel_pools[pid] = build_gateway_grpc_channel_pool()
+        return pool
+
 
-    :return: gRPC-канал (Channel), настроенный на адрес localhost:9003.
+def build_gateway_async_grpc_client() -> aio.Channel:
     """
-    # Создаём небезопасное (без TLS) соединение с gRPC-сервером по адресу localhost:9003
-    return insecure_channel("localhost:9003")
\ No newline at end of file
+    Фабричная функция (билдер) для создания асинхронного gRPC-канала (grpc.aio) к сервису grpc-gateway.
+
+    Канал нужно создавать внутри запущенного event loop. Если приёмник метрик включён,
+    на канал ставится AsyncMetricsClientInterceptor.
+
+    :return: Асинхронный gRPC-канал, настроенный на адрес target из GatewayGRPCConfig (по умолчанию localhost:9003).
+    """
+    config = get_gateway_grpc_config()
+    metrics = get_metrics_sink()
+    return aio.insecure_channel(
+        config.target,
+        options=config.to_channel_options(),
+        compression=config.to_compression(),
+        interceptors=[AsyncMetricsClientInterceptor(metrics)] if metrics.enabled else None
+    )
+
+
+@lru_cache(maxsize=None)
+def get_gateway_serialized_request_cache() -> SerializedRequestCache | None:
+    """
+    Общий для gRPC-клиентов процесса кэш сериализованных запросов на чтение.
+
+    :return: Экземпляр SerializedRequestCache или None, если кэш выключен в GatewayGRPCConfig.
+    """
+    size = get_gateway_grpc_config().serialized_request_cache_size
+    return SerializedRequestCache(maxsize=size) if size > 0 else None
+
+
+def build_gateway_grpc_client_options() -> GRPCClientOptions:
+    """
+    Функция собирает настройки для gRPC-клиентов gateway.
+
+    Политики повторов и хеджирования те же, что у HTTP-клиентов,
+    бюджет повторов — общий с ними. Дедлайны и wait_for_ready берутся из GatewayGRPCConfig.
+    Действующие настройки записываются в приёмник метрик и попадают в отчёт о прогоне.
+
+    :return: Объект GRPCClientOptions.
+    """
+    http_config = get_gateway_http_config()
+    grpc_config = get_gateway_grpc_config()
+
+    metrics = get_metrics_sink()
+    metrics.annotate("grpc.config", grpc_config.model_dump(mode="json"))
+
+    return GRPCClientOptions(
+        metrics=metrics,
+        retry=http_config.to_retry_policy(),
+        hedge=http_config.to_hedge_policy(),
+        retry_budget=get_gateway_retry_budget(),
+        timeout=grpc_config.default_deadline,
+        method_timeouts=grpc_config.method_deadlines,
+        wait_for_ready=grpc_config.wait_for_ready,
+        pipeline_depth=grpc_config.pipeline_depth,
+        serialized_requests=get_gateway_serialized_request_cache(),
+    )
@@ -0,0 +1,91 @@
+from functools import lru_cache
+from typing import ClassVar, Literal
+
+from grpc import Compression
+
+from clients.config import EnvConfig
+
+COMPRESSIONS = {
+    "none": Compression.NoCompression,
+    "gzip": Compression.Gzip,
+    "deflate": Compression.Deflate,
+}
+
+
+class GatewayGRPCConfig(EnvConfig):
+    """
+    Настройки каналов и вызовов для подключения к grpc-gateway.
+
+    Значения читаются из переменных окружения с префиксом GATEWAY_GRPC_
+    (например, GATEWAY_GRPC_DEFAULT_DEADLINE=5) и/или из JSON-файла,
+    путь к которому задаётся через GATEWAY_GRPC_CONFIG_FILE.
+    Политики повторов и хеджирования общие с HTTP-клиентами (GatewayHTTPConfig).
+
+    :param target: Адрес grpc-gateway (host:port).
+    :param channel_pool_size: Количество каналов (HTTP/2-соединений) в пуле процесса.
+    :param idle_timeout: Через сколько секунд простоя канал закрывает соединение; None — по умолчанию gRPC.
+    :param keepalive_time: Интервал keepalive-пингов, секунды; None — без пингов.
+                           Сервер должен разрешать такую частоту, иначе закроет соединение (too_many_pings).
+    :param keepalive_timeout: Сколько ждать ответа на keepalive-пинг, секунды.
+    :param keepalive_permit_without_calls: Отправлять ли пинги, когда нет активных вызовов.
+    :param compression: Сжатие сообщений канала: none, gzip или deflate.
+    :param max_send_message_length: Максимальный размер отправляемого сообщения, байты; None — по умолчанию gRPC.
+    :param max_receive_message_length: Максимальный размер принимаемого сообщения, байты; None — по умолчанию gRPC (4 МБ).
+    :param default_deadline: Дедлайн вызова по умолчанию, секунды; None — без дедлайна.
+    :param method_deadlines: Дедлайны для отдельных методов, например {"GetOperations": 10}.
+    :param wait_for_ready: Ждать готовности канала вместо немедленной ошибки UNAVAILABLE (в пределах дедлайна).
+    :param pipeline_depth: Сколько вызовов в полёте держат конвейерные методы клиентов (call_many).
+    :param serialized_request_cache_size: Сколько сериализованных запросов на чтение кэшировать; 0 — без кэша.
+    """
+    env_prefix: ClassVar[str] = "GATEWAY_GRPC_"
+
+    target: str = "localhost:9003"
+    channel_pool_size: int = 4
+    idle_timeout: float | None = 30.0
+
+    keepalive_time: float | None = None
+    keepalive_timeout: float = 20.0
+    keepalive_permit_without_calls: bool = False
+
+    compression: Literal["none", "gzip", "deflate"] = "none"
+    max_send_message_length: int | None = None
+    max_receive_message_length: int | None = None
+
+    default_deadline: float | None = 30.0
+    method_deadlines: dict[str, float] = {}
+    wait_for_ready: bool = False
+    pipeline_depth: int = 32
+    serialized_request_cache_size: int = 10_000
+
+    def to_channel_options(self) -> list[tuple[str, int]]:
+        """
+        :return: Опции gRPC-канала.
+        """
+        options = []
+        if self.idle_timeout is not None:
+            options.append(("grpc.client_idle_timeout_ms", int(self.idle_timeout * 1000)))
+        if self.keepalive_time is not None:
+            options.append(("grpc.keepalive_time_ms", int(self.keepalive_time * 1000)))
+            options.append(("grpc.keepalive_timeout_ms", int(self.keepalive_timeout * 1000)))
+            options.append(("grpc.keepalive_permit_without_calls", int(self.keepalive_permit_without_calls)))
+        if self.max_send_message_length is not None:
+            options.append(("grpc.max_send_message_length", self.max_send_message_length))
+        if self.max_receive_message_length is not None:
+            options.append(("grpc.max_receive_message_length", self.max_receive_message_length))
+        return options
+
+    def to_compression(self) -> Compression:
+        """
+        :return: Алгоритм сжатия канала.
+        """
+        return COMPRESSIONS[self.compression]
+
+
+@lru_cache(maxsize=None)
+def get_gateway_grpc_config() -> GatewayGRPCConfig:
+    """
+    Возвращает настройки grpc-gateway для текущего процесса (читаются один раз).
+
+    :return: Экземпляр GatewayGRPCConfig.
+    """
+    return GatewayGRPCConfig.from_env()
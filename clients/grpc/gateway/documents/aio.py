@@ -0,0 +1,80 @@
+from grpc import aio
+
+from clients.grpc.aio import AsyncGRPCClient
+from clients.grpc.gateway.client import build_gateway_async_grpc_client, build_gateway_grpc_client_options
+from clients.grpc.options import GRPCClientOptions
+from contracts.services.gateway.documents.rpc_get_contract_document_pb2 import GetContractDocumentRequest, GetContractDocumentResponse
+from contracts.services.gateway.documents.rpc_get_tariff_document_pb2 import GetTariffDocumentRequest, GetTariffDocumentResponse
+from contracts.services.gateway.documents.documents_gateway_service_pb2 import DESCRIPTOR
+from contracts.services.gateway.documents.documents_gateway_service_pb2_grpc import DocumentsGatewayServiceStub
+
+
+class AsyncDocumentsGatewayGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент (grpc.aio) для взаимодействия с DocumentsGatewayService.
+    Предоставляет высокоуровневые методы для получения документов по счёту.
+    """
+
+    def __init__(self, channel: aio.Channel, options: GRPCClientOptions | None = None):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: Асинхронный gRPC-канал для подключения к DocumentsGatewayService.
+        :param options: Настройки клиента (метрики, повторы, хеджирование).
+        """
+        super().__init__(channel, options)
+
+        self.stub = DocumentsGatewayServiceStub(channel)  # gRPC-стаб, сгенерированный из .proto
+        self.service = DESCRIPTOR.services_by_name["DocumentsGatewayService"]  # для call_serialized()
+
+    async def get_tariff_document_api(self, request: GetTariffDocumentRequest, cache_key: str | None = None) -> GetTariffDocumentResponse:
+        """
+        Низкоуровневый вызов метода GetTariffDocument через gRPC.
+
+        :param request: gRPC-запрос получения тарифа по счёту.
+        :param cache_key: Ключ кэша сериализованных запросов (см. AsyncGRPCClient.call).
+        :return: Ответ от сервиса.
+        """
+        return await self.call("GetTariffDocument", request, idempotent=True, cache_key=cache_key)
+
+    async def get_contract_document_api(self, request: GetContractDocumentRequest, cache_key: str | None = None) -> GetContractDocumentResponse:
+        """
+        Низкоуровневый вызов метода GetContractDocument через gRPC.
+
+        :param request: gRPC-запрос получения договора по счёту.
+        :param cache_key: Ключ кэша сериализованных запросов (см. AsyncGRPCClient.call).
+        :return: Ответ от сервиса.
+        """
+        return await self.call("GetContractDocument", request, idempotent=True, cache_key=cache_key)
+
+    async def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponse:
+        """
+        Получение тарифа по счёту.
+
+        :param account_id: Идентификатор счёта.
+        :return: Ответ от сервиса.
+        """
+        return await self.get_tariff_document_api(GetTariffDocumentRequest(account_id=account_id), cache_key=account_id)
+
+    async def get_contract_document(self, account_id: str) -> GetContractDocumentResponse:
+        """
+        Получение договора по счёту.
+
+        :param account_id: Идентификатор счёта.
+        :return: Ответ от сервиса.
+        """
+        return await self.get_contract_document_api(GetContractDocumentRequest(account_id=account_id), cache_key=account_id)
+
+
+def build_async_documents_gateway_grpc_client() -> AsyncDocumentsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncDocumentsGatewayGRPCClient.
+
+    Вызывается внутри запущенного event loop.
+
+    :return: Инициализированный клиент для DocumentsGatewayService.
+    """
+    return AsyncDocumentsGatewayGRPCClient(
+        channel=build_gateway_async_grpc_client(),
+        options=build_gateway_grpc_client_options()
+    )
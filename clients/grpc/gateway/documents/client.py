@@ -0,0 +1,76 @@
+from grpc import Channel
+from clients.grpc.client import GRPCClient, GRPCClientOptions
+from clients.grpc.gateway.client import build_gateway_grpc_client, build_gateway_grpc_client_options
+from contracts.services.gateway.documents.rpc_get_contract_document_pb2 import GetContractDocumentRequest, GetContractDocumentResponse
+from contracts.services.gateway.documents.rpc_get_tariff_document_pb2 import GetTariffDocumentRequest, GetTariffDocumentResponse
+from contracts.services.gateway.documents.documents_gateway_service_pb2 import DESCRIPTOR
+from contracts.services.gateway.documents.documents_gateway_service_pb2_grpc import DocumentsGatewayServiceStub
+
+
+class DocumentsGatewayGRPCClient(GRPCClient):
+    """
+    gRPC-клиент для взаимодействия с DocumentsGatewayService.
+    Предоставляет высокоуровневые методы для получения документов по счёту.
+    """
+
+    def __init__(self, channel: Channel, options: GRPCClientOptions | None = None):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: gRPC-канал для подключения к DocumentsGatewayService.
+        :param options: Настройки клиента (метрики, повторы, хеджирование).
+        """
+        super().__init__(channel, options)
+
+        self.stub = DocumentsGatewayServiceStub(channel)  # gRPC-стаб, сгенерированный из .proto
+        self.service = DESCRIPTOR.services_by_name["DocumentsGatewayService"]  # для call_serialized()
+
+    def get_tariff_document_api(self, request: GetTariffDocumentRequest, cache_key: str | None = None) -> GetTariffDocumentResponse:
+        """
+        Низкоуровневый вызов метода GetTariffDocument через gRPC.
+
+        :param request: gRPC-запрос получения тарифа по счёту.
+        :param cache_key: Ключ кэша сериализованных запросов (см. GRPCClient.call).
+        :return: Ответ от сервиса.
+        """
+        return self.call("GetTariffDocument", request, idempotent=True, cache_key=cache_key)
+
+    def get_contract_document_api(self, request: GetContractDocumentRequest, cache_key: str | None = None) -> GetContractDocumentResponse:
+        """
+        Низкоуровневый вызов метода GetContractDocument через gRPC.
+
+        :param request: gRPC-запрос получения договора по счёту.
+        :param cache_key: Ключ кэша сериализованных запросов (см. GRPCClient.call).
+        :return: Ответ от сервиса.
+        """
+        return self.call("GetContractDocument", request, idempotent=True, cache_key=cache_key)
+
+    def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponse:
+        """
+        Получение тарифа по счёту.
+
+        :param account_id: Идентификатор счёта.
+        :return: Ответ от сервиса.
+        """
+        return self.get_tariff_document_api(GetTariffDocumentRequest(account_id=account_id), cache_key=account_id)
+
+    def get_contract_document(self, account_id: str) -> GetContractDocumentResponse:
+        """
+        Получение договора по счёту.
+
+        :param account_id: Идентификатор счёта.
+        :return: Ответ от сервиса.
+        """
+        return self.get_contract_document_api(GetContractDocumentRequest(account_id=account_id), cache_key=account_id)
+
+
+def build_documents_gateway_grpc_client() -> DocumentsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра DocumentsGatewayGRPCClient.
+
+    :return: Инициализированный клиент для DocumentsGatewayService.
+    """
+    return DocumentsGatewayGRPCClient(
+        channel=build_gateway_grpc_client(),
+        options=build_gateway_grpc_client_options()
+    )
@@ -0,0 +1,34 @@
+from clients.grpc.gateway.client import (
+    build_gateway_async_grpc_client,
+    build_gateway_grpc_client,
+    build_gateway_grpc_client_options,
+)
+from clients.grpc.invoker import AsyncGRPCInvoker, GRPCInvoker
+
+
+def build_gateway_grpc_invoker() -> GRPCInvoker:
+    """
+    Фабрика универсального клиента для вызова методов grpc-gateway по полному имени.
+
+    Использует общий пул каналов и настройки gateway-клиентов.
+
+    :return: Инициализированный GRPCInvoker.
+    """
+    return GRPCInvoker(
+        channel=build_gateway_grpc_client(),
+        options=build_gateway_grpc_client_options()
+    )
+
+
+def build_async_gateway_grpc_invoker() -> AsyncGRPCInvoker:
+    """
+    Фабрика асинхронного универсального клиента для grpc-gateway.
+
+    Вызывается внутри запущенного event loop.
+
+    :return: Инициализированный AsyncGRPCInvoker.
+    """
+    return AsyncGRPCInvoker(
+        channel=build_gateway_async_grpc_client(),
+        options=build_gateway_grpc_client_options()
+    )
@@ -0,0 +1,323 @@
+from typing import Iterable
+
+from grpc import Channel
+from clients.grpc.client import GRPCClient, GRPCClientOptions
+from clients.grpc.gateway.client import build_gateway_grpc_client, build_gateway_grpc_client_options
+from contracts.services.gateway.operations.rpc_get_operation_pb2 import GetOperationRequest, GetOperationResponse
+from contracts.services.gateway.operations.rpc_get_operation_receipt_pb2 import GetOperationReceiptRequest, GetOperationReceiptResponse
+from contracts.services.gateway.operations.rpc_get_operations_pb2 import GetOperationsRequest, GetOperationsResponse
+from contracts.services.gateway.operations.rpc_get_operations_summary_pb2 import GetOperationsSummaryRequest, GetOperationsSummaryResponse
+from contracts.services.gateway.operations.rpc_make_bill_payment_operation_pb2 import MakeBillPaymentOperationRequest, MakeBillPaymentOperationResponse
+from contracts.services.gateway.operations.rpc_make_cash_withdrawal_operation_pb2 import MakeCashWithdrawalOperationRequest, MakeCashWithdrawalOperationResponse
+from contracts.services.gateway.operations.rpc_make_cashback_operation_pb2 import MakeCashbackOperationRequest, MakeCashbackOperationResponse
+from contracts.services.gateway.operations.rpc_make_fee_operation_pb2 import MakeFeeOperationRequest, MakeFeeOperationResponse
+from contracts.services.gateway.operations.rpc_make_purchase_operation_pb2 import MakePurchaseOperationRequest, MakePurchaseOperationResponse
+from contracts.services.gateway.operations.rpc_make_top_up_operation_pb2 import MakeTopUpOperationRequest, MakeTopUpOperationResponse
+from contracts.services.gateway.operations.rpc_make_transfer_operation_pb2 import MakeTransferOperationRequest, MakeTransferOperationResponse
+from contracts.services.gateway.operations.operations_gateway_service_pb2 import DESCRIPTOR
+from contracts.services.gateway.operations.operations_gateway_service_pb2_grpc import OperationsGatewayServiceStub
+from contracts.services.operations.operation_pb2 import OperationStatus
+from tools.fakers import fake
+
+
+class OperationsGatewayGRPCClient(GRPCClient):
+    """
+    gRPC-клиент для взаимодействия с OperationsGatewayService.
+    Предоставляет высокоуровневые методы для получения и создания операций.
+    """
+
+    def __init__(self, channel: Channel, options: GRPCClientOptions | None = None):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: gRPC-канал для подключения к OperationsGatewayService.
+        :param options: Настройки клиента (метрики, повторы, хеджирование).
+        """
+        super().__init__(channel, options)
+
+        self.stub = OperationsGatewayServiceStub(channel)  # gRPC-стаб, сгенерированный из .proto
+        self.service = DESCRIPTOR.services_by_name["OperationsGatewayService"]  # для call_serialized()
+
+    def get_operation_api(self, request: GetOperationRequest, cache_key: str | None = None) -> GetOperationResponse:
+        """
+        Низкоуровневый вызов метода GetOperation через gRPC.
+
+        :param request: gRPC-запрос получения операции.
+        :param cache_key: Ключ кэша сериализованных запросов (см. GRPCClient.call).
+        :return: Ответ от сервиса.
+        """
+        return self.call("GetOperation", request, idempotent=True, cache_key=cache_key)
+
+    def get_operation_receipt_api(self, request: GetOperationReceiptRequest, cache_key: str | None = None) -> GetOperationReceiptResponse:
+        """
+        Низкоуровневый вызов метода GetOperationReceipt через gRPC.
+
+        :param request: gRPC-запрос получения чека по операции.
+        :param cache_key: Ключ кэша сериализованных запросов (см. GRPCClient.call).
+        :return: Ответ от сервиса.
+        """
+        return self.call("GetOperationReceipt", request, idempotent=True, cache_key=cache_key)
+
+    def get_operations_api(self, request: GetOperationsRequest, cache_key: str | None = None) -> GetOperationsResponse:
+        """
+        Низкоуровневый вызов метода GetOperations через gRPC.
+
+        :param request: gRPC-запрос получения списка операций по счёту.
+        :param cache_key: Ключ кэша сериализованных запросов (см. GRPCClient.call).
+        :return: Ответ от сервиса.
+        """
+        return self.call("GetOperations", request, idempotent=True, cache_key=cache_key)
+
+    def get_operations_summary_api(self, request: GetOperationsSummaryRequest, cache_key: str | None = None) -> GetOperationsSummaryResponse:
+        """
+        Низкоуровневый вызов метода GetOperationsSummary через gRPC.
+
+        :param request: gRPC-запрос получения статистики операций по счёту.
+        :param cache_key: Ключ кэша сериализованных запросов (см. GRPCClient.call).
+        :return: Ответ от сервиса.
+        """
+        return self.call("GetOperationsSummary", request, idempotent=True, cache_key=cache_key)
+
+    def make_fee_operation_api(self, request: MakeFeeOperationRequest) -> MakeFeeOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeFeeOperation через gRPC.
+
+        :param request: gRPC-запрос создания операции комиссии.
+        :return: Ответ от сервиса.
+        """
+        return self.call("MakeFeeOperation", request)
+
+    def make_top_up_operation_api(self, request: MakeTopUpOperationRequest) -> MakeTopUpOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeTopUpOperation через gRPC.
+
+        :param request: gRPC-запрос создания операции пополнения.
+        :return: Ответ от сервиса.
+        """
+        return self.call("MakeTopUpOperation", request)
+
+    def make_cashback_operation_api(self, request: MakeCashbackOperationRequest) -> MakeCashbackOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeCashbackOperation через gRPC.
+
+        :param request: gRPC-запрос создания операции кэшбэка.
+        :return: Ответ от сервиса.
+        """
+        return self.call("MakeCashbackOperation", request)
+
+    def make_transfer_operation_api(self, request: MakeTransferOperationRequest) -> MakeTransferOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeTransferOperation через gRPC.
+
+        :param request: gRPC-запрос создания операции перевода.
+        :return: Ответ от сервиса.
+        """
+        return self.call("MakeTransferOperation", request)
+
+    def make_purchase_operation_api(self, request: MakePurchaseOperationRequest) -> MakePurchaseOperationResponse:
+        """
+        Низкоуровневый вызов метода MakePurchaseOperation через gRPC.
+
+        :param request: gRPC-запрос создания операции покупки.
+        :return: Ответ от сервиса.
+        """
+        return self.call("MakePurchaseOperation", request)
+
+    def make_bill_payment_operation_api(self, request: MakeBillPaymentOperationRequest) -> MakeBillPaymentOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeBillPaymentOperation через gRPC.
+
+        :param request: gRPC-запрос создания операции оплаты по счёту.
+        :return: Ответ от сервиса.
+        """
+        return self.call("MakeBillPaymentOperation", request)
+
+    def make_cash_withdrawal_operation_api(self, request: MakeCashWithdrawalOperationRequest) -> MakeCashWithdrawalOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeCashWithdrawalOperation через gRPC.
+
+        :param request: gRPC-запрос создания операции снятия наличных.
+        :return: Ответ от сервиса.
+        """
+        return self.call("MakeCashWithdrawalOperation", request)
+
+    def get_operation(self, operation_id: str) -> GetOperationResponse:
+        """
+        Получение операции по её ID.
+
+        :param operation_id: Идентификатор операции.
+        :return: Ответ от сервиса.
+        """
+        return self.get_operation_api(GetOperationRequest(id=operation_id), cache_key=operation_id)
+
+    def get_operation_receipt(self, operation_id: str) -> GetOperationReceiptResponse:
+        """
+        Получение чека по операции.
+
+        :param operation_id: Идентификатор операции.
+        :return: Ответ от сервиса.
+        """
+        return self.get_operation_receipt_api(GetOperationReceiptRequest(operation_id=operation_id), cache_key=operation_id)
+
+    def get_operations_by_ids(self, operation_ids: Iterable[str]) -> list[GetOperationResponse]:
+        """
+        Получение нескольких операций конвейером: до pipeline_depth вызовов GetOperation в полёте.
+
+        :param operation_ids: Идентификаторы операций.
+        :return: Ответы от сервиса в порядке идентификаторов.
+        """
+        requests = (GetOperationRequest(id=operation_id) for operation_id in operation_ids)
+        return self.call_many("GetOperation", requests, idempotent=True)
+
+    def get_operation_receipts(self, operation_ids: Iterable[str]) -> list[GetOperationReceiptResponse]:
+        """
+        Получение чеков по нескольким операциям конвейером: до pipeline_depth вызовов в полёте.
+
+        :param operation_ids: Идентификаторы операций.
+        :return: Ответы от сервиса в порядке идентификаторов.
+        """
+        requests = (GetOperationReceiptRequest(operation_id=operation_id) for operation_id in operation_ids)
+        return self.call_many("GetOperationReceipt", requests, idempotent=True)
+
+    def get_operations(self, account_id: str) -> GetOperationsResponse:
+        """
+        Получение списка операций по счёту.
+
+        :param account_id: Идентификатор счёта.
+        :return: Ответ от сервиса.
+        """
+        return self.get_operations_api(GetOperationsRequest(account_id=account_id), cache_key=account_id)
+
+    def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponse:
+        """
+        Получение статистики операций по счёту.
+
+        :param account_id: Идентификатор счёта.
+        :return: Ответ от сервиса.
+        """
+        return self.get_operations_summary_api(GetOperationsSummaryRequest(account_id=account_id), cache_key=account_id)
+
+    def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponse:
+        """
+        Создание операции комиссии со случайными статусом и суммой.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счёта.
+        :return: Ответ от сервиса.
+        """
+        request = MakeFeeOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id
+        )
+        return self.make_fee_operation_api(request)
+
+    def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponse:
+        """
+        Создание операции пополнения со случайными статусом и суммой.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счёта.
+        :return: Ответ от сервиса.
+        """
+        request = MakeTopUpOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id
+        )
+        return self.make_top_up_operation_api(request)
+
+    def make_cashback_operation(self, card_id: str, account_id: str) -> MakeCashbackOperationResponse:
+        """
+        Создание операции кэшбэка со случайными статусом и суммой.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счёта.
+        :return: Ответ от сервиса.
+        """
+        request = MakeCashbackOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id
+        )
+        return self.make_cashback_operation_api(request)
+
+    def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponse:
+        """
+        Создание операции перевода со случайными статусом и суммой.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счёта.
+        :return: Ответ от сервиса.
+        """
+        request = MakeTransferOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id
+        )
+        return self.make_transfer_operation_api(request)
+
+    def make_purchase_operation(self, card_id: str, account_id: str) -> MakePurchaseOperationResponse:
+        """
+        Создание операции покупки со случайными статусом и суммой.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счёта.
+        :return: Ответ от сервиса.
+        """
+        request = MakePurchaseOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            category=fake.category(),
+            account_id=account_id
+        )
+        return self.make_purchase_operation_api(request)
+
+    def make_bill_payment_operation(self, card_id: str, account_id: str) -> MakeBillPaymentOperationResponse:
+        """
+        Создание операции оплаты по счёту со случайными статусом и суммой.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счёта.
+        :return: Ответ от сервиса.
+        """
+        request = MakeBillPaymentOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id
+        )
+        return self.make_bill_payment_operation_api(request)
+
+    def make_cash_withdrawal_operation(self, card_id: str, account_id: str) -> MakeCashWithdrawalOperationResponse:
+        """
+        Создание операции снятия наличных со случайными статусом и суммой.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счёта.
+        :return: Ответ от сервиса.
+        """
+        request = MakeCashWithdrawalOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id
+        )
+        return self.make_cash_withdrawal_operation_api(request)
+
+
+def build_operations_gateway_grpc_client() -> OperationsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра OperationsGatewayGRPCClient.
+
+    :return: Инициализированный клиент для OperationsGatewayService.
+    """
+    return OperationsGatewayGRPCClient(
+        channel=build_gateway_grpc_client(),
+        options=build_gateway_grpc_client_options()
+    )
@@ -1,8 +1,9 @@
 from grpc import Channel
-from clients.grpc.client import GRPCClient
-from clients.grpc.gateway.client import build_gateway_grpc_client
+from clients.grpc.client import GRPCClient, GRPCClientOptions
+from clients.grpc.gateway.client import build_gateway_grpc_client, build_gateway_grpc_client_options
 from contracts.services.gateway.users.rpc_create_user_pb2 import CreateUserRequest, CreateUserResponse
 from contracts.services.gateway.users.rpc_get_user_pb2 import GetUserRequest, GetUserResponse
+from contracts.services.gateway.users.users_gateway_service_pb2 import DESCRIPTOR
 from contracts.services.gateway.users.users_gateway_service_pb2_grpc import UsersGatewayServiceStub
 from tools.fakers import fake
 
@@ -13,24 +14,27 @@ class UsersGatewayGRPCClient(GRPCClient):
     Предоставляет высокоуровневые методы для получения и создания пользователей.
     """
 
-    def __init__(self, channel: Channel):
+    def __init__(self, channel: Channel, options: GRPCClientOptions | None = None):
         """
         Инициализация клиента с указанным gRPC-каналом.
 
         :param channel: gRPC-канал для подключения к UsersGatewayService.
+        :param options: Настройки клиента (метрики, повторы, хеджирование).
         """
-        super().__init__(channel)
+        super().__init__(channel, options)
 
         self.stub = UsersGatewayServiceStub(channel)  # gRPC-стаб, сгенерированный из .proto
+        self.service = DESCRIPTOR.services_by_name["UsersGatewayService"]  # для call_serialized()
 
-    def get_user_api(self, request: GetUserRequest) -> GetUserResponse:
+    def get_user_api(self, request: GetUserRequest, cache_key: str | None = None) -> GetUserResponse:
         """
         Низкоуровневый вызов метода GetUser через gRPC.
 
         :param request: gRPC-запрос с ID пользователя.
+        :param cache_key: Ключ кэша сериализованных запросов (см. GRPCClient.call).
         :return: Ответ от сервиса с данными пользователя.
         """
-        return self.stub.GetUser(request)
+        return self.call("GetUser", request, idempotent=True, cache_key=cache_key)
 
     def create_user_api(self, request: CreateUserRequest) -> CreateUserResponse:
         """
@@ -39,7 +43,7 @@ class UsersGatewayGRPCClient(GRPCClient):
         :param request: gRPC-запрос с данными нового пользователя.
         :return: Ответ от сервиса с данными созданного пользователя.
         """
-        return self.stub.CreateUser(request)
+        return self.call("CreateUser", request)
 
     def get_user(self, user_id: str) -> GetUserResponse:
         """
@@ -48,8 +52,7 @@ class UsersGatewayGRPCClient(GRPCClient):
         :param user_id: Идентификатор пользователя.
         :return: Ответ с информацией о пользователе.
         """
-        request = GetUserRequest(id=user_id)
-        return self.get_user_api(request)
+        return self.get_user_api(GetUserRequest(id=user_id), cache_key=user_id)
 
     def create_user(self) -> CreateUserResponse:
         """
@@ -73,4 +76,7 @@ def build_users_gateway_grpc_client() -> UsersGatewayGRPCClient:
 
     :return: Инициализированный клиент для UsersGatewayService.
     """
-    return UsersGatewayGRPCClient(channel=build_gateway_grpc_client())
+    return UsersGatewayGRPCClient(
+        channel=build_gateway_grpc_client(),
+        options=build_gateway_grpc_client_options()
+    )
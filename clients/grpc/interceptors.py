@@ -0,0 +1,112 @@
+import time
+from typing import Any
+
+import grpc
+from grpc import aio
+
+from clients.metrics import MetricsSink
+
+
+def message_size(message: Any) -> int:
+    """
+    Размер сериализованного сообщения в байтах.
+
+    :param message: Protobuf-сообщение или уже сериализованные байты.
+    :return: Размер в байтах; 0, если размер неизвестен.
+    """
+    if isinstance(message, (bytes, bytearray, memoryview)):
+        return len(message)
+    byte_size = getattr(message, "ByteSize", None)
+    return byte_size() if byte_size is not None else 0
+
+
+def method_name(client_call_details: grpc.ClientCallDetails) -> str:
+    """
+    :return: Полное имя метода, например /contracts.services.gateway.users.UsersGatewayService/GetUser.
+    """
+    method = client_call_details.method
+    return method.decode() if isinstance(method, bytes) else method
+
+
+def record_call(
+        metrics: MetricsSink,
+        method: str,
+        code: grpc.StatusCode,
+        request: Any,
+        response: Any,
+        started: float
+) -> None:
+    """
+    Отправляет метрики одного вызова в приёмник:
+
+    - grpc.request.total — длительность вызова;
+    - grpc.request.request_bytes / grpc.request.response_bytes — счётчики переданных байт
+      (средний размер сообщения — счётчик, делённый на число вызовов).
+
+    :param metrics: Приёмник метрик.
+    :param method: Полное имя метода (тег method).
+    :param code: Статус вызова (тег status).
+    :param request: Запрос.
+    :param response: Ответ или None, если вызов завершился ошибкой.
+    :param started: Время начала вызова по time.perf_counter().
+    """
+    tags = {"method": method, "status": code.name}
+    metrics.timing("grpc.request.total", time.perf_counter() - started, tags)
+    metrics.increment("grpc.request.request_bytes", tags, message_size(request))
+    if response is not None:
+        metrics.increment("grpc.request.response_bytes", tags, message_size(response))
+
+
+class MetricsClientInterceptor(grpc.UnaryUnaryClientInterceptor):
+    """
+    Интерцептор синхронного канала: замеряет unary-unary вызовы, в том числе через future().
+
+    Метрики отправляются из done-callback'а, поэтому вызов не ждёт их записи
+    и конвейерные вызовы (call_many) замеряются так же, как блокирующие.
+    """
+
+    def __init__(self, metrics: MetricsSink):
+        """
+        :param metrics: Приёмник метрик, общий с HTTP-клиентами.
+        """
+        self.metrics = metrics
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        started = time.perf_counter()
+        method = method_name(client_call_details)
+
+        outcome = continuation(client_call_details, request)
+
+        def on_done(future: grpc.Future) -> None:
+            code = future.code()
+            response = future.result() if code == grpc.StatusCode.OK else None
+            record_call(self.metrics, method, code, request, response, started)
+
+        outcome.add_done_callback(on_done)
+        return outcome
+
+
+class AsyncMetricsClientInterceptor(aio.UnaryUnaryClientInterceptor):
+    """
+    Интерцептор асинхронного канала (grpc.aio) с теми же метриками, что и MetricsClientInterceptor.
+    """
+
+    def __init__(self, metrics: MetricsSink):
+        """
+        :param metrics: Приёмник метрик, общий с HTTP-клиентами.
+        """
+        self.metrics = metrics
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        started = time.perf_counter()
+        method = method_name(client_call_details)
+
+        call = await continuation(client_call_details, request)
+        try:
+            response = await call
+        except aio.AioRpcError as error:
+            record_call(self.metrics, method, error.code(), request, None, started)
+            raise
+
+        record_call(self.metrics, method, grpc.StatusCode.OK, request, response, started)
+        return call
@@ -0,0 +1,162 @@
+from dataclasses import dataclass
+from typing import Any, Mapping
+
+from google.protobuf.message import Message
+from grpc import Channel, aio
+
+from clients.grpc.aio import AsyncGRPCClient
+from clients.grpc.client import GRPCClient
+from clients.grpc.contracts import ContractsRegistry, get_contracts_registry
+from clients.grpc.options import GRPCClientOptions
+
+# Запрос: protobuf-сообщение или словарь с полями сообщения
+Request = Message | Mapping[str, Any]
+
+
+@dataclass(frozen=True, slots=True)
+class MethodHandle:
+    """
+    Разрешённый метод gRPC: всё, что нужно для вызова без рефлексии.
+
+    :param full_name: Полное имя метода, например /contracts.services.gateway.users.UsersGatewayService/GetUser.
+    :param name: Короткое имя метода (для дедлайнов и тегов метрик), например GetUser.
+    :param request_type: Класс запроса.
+    :param multicallable: Unary-unary multicallable канала.
+    :param idempotent: Можно ли повторять и хеджировать вызов (по умолчанию — для Get*-методов).
+    """
+    full_name: str
+    name: str
+    request_type: type[Message]
+    multicallable: Any
+    idempotent: bool
+
+    def build_request(self, request: Request) -> Message:
+        """
+        :param request: Сообщение или словарь с полями сообщения (вложенные сообщения — тоже словари).
+        :return: Сообщение типа request_type.
+        """
+        if isinstance(request, Message):
+            return request
+        return self.request_type(**request)
+
+
+def build_method_handle(channel: Any, registry: ContractsRegistry, full_name: str) -> MethodHandle:
+    """
+    Разрешает метод по полному имени через реестр контрактов и создаёт для него multicallable.
+
+    :param channel: Синхронный или асинхронный канал (в том числе ChannelPool).
+    :param registry: Реестр контрактов.
+    :param full_name: Полное имя метода.
+    :return: MethodHandle.
+    :raises ValueError: Если метод потоковый — поддерживаются только unary-unary методы.
+    """
+    descriptor = registry.method(full_name)
+    if descriptor.client_streaming or descriptor.server_streaming:
+        raise ValueError(f"Only unary-unary methods are supported, got streaming {full_name}")
+
+    request_type, response_type = registry.method_types(full_name)
+    return MethodHandle(
+        full_name=full_name,
+        name=descriptor.name,
+        request_type=request_type,
+        multicallable=channel.unary_unary(
+            full_name,
+            request_serializer=request_type.SerializeToString,
+            response_deserializer=response_type.FromString,
+        ),
+        idempotent=descriptor.name.startswith("Get"),
+    )
+
+
+class GRPCInvoker(GRPCClient):
+    """
+    Универсальный gRPC-клиент: вызывает любой unary-unary метод из contracts/services
+    по полному имени, без написанного вручную клиента для сервиса.
+
+    Метод разрешается через ContractsRegistry один раз, дальше вызов — это поиск
+    MethodHandle в словаре и обращение к закэшированному multicallable. Повторы,
+    хеджирование, дедлайны и метрики работают так же, как у обычных клиентов.
+    """
+
+    def __init__(self, channel: Channel, options: GRPCClientOptions | None = None,
+                 registry: ContractsRegistry | None = None):
+        """
+        :param channel: gRPC-канал к сервису.
+        :param options: Настройки клиента (метрики, повторы, хеджирование, дедлайны).
+        :param registry: Реестр контрактов; по умолчанию — реестр процесса.
+        """
+        super().__init__(channel, options)
+        self.registry = registry or get_contracts_registry()
+        self.methods: dict[str, MethodHandle] = {}
+
+    def method(self, full_name: str) -> MethodHandle:
+        """
+        :param full_name: Полное имя метода.
+        :return: Закэшированный MethodHandle.
+        """
+        handle = self.methods.get(full_name)
+        if handle is None:
+            handle = self.methods[full_name] = build_method_handle(self.channel, self.registry, full_name)
+        return handle
+
+    def invoke_method(self, full_name: str, request: Request, idempotent: bool | None = None) -> Any:
+        """
+        Вызывает метод по полному имени.
+
+        :param full_name: Полное имя метода, например
+                          /contracts.services.gateway.operations.OperationsGatewayService/GetOperation.
+        :param request: Сообщение или словарь с полями запроса, например {"id": "..."}.
+        :param idempotent: Переопределяет идемпотентность метода (по умолчанию True для Get*).
+        :return: Ответ сервиса.
+        """
+        handle = self.method(full_name)
+        return self.invoke(
+            handle.name,
+            handle.multicallable,
+            handle.build_request(request),
+            handle.idempotent if idempotent is None else idempotent
+        )
+
+
+class AsyncGRPCInvoker(AsyncGRPCClient):
+    """
+    Асинхронный аналог GRPCInvoker поверх grpc.aio.
+    """
+
+    def __init__(self, channel: aio.Channel, options: GRPCClientOptions | None = None,
+                 registry: ContractsRegistry | None = None):
+        """
+        :param channel: Асинхронный gRPC-канал к сервису.
+        :param options: Настройки клиента (метрики, повторы, хеджирование, дедлайны).
+        :param registry: Реестр контрактов; по умолчанию — реестр процесса.
+        """
+        super().__init__(channel, options)
+        self.registry = registry or get_contracts_registry()
+        self.methods: dict[str, MethodHandle] = {}
+
+    def method(self, full_name: str) -> MethodHandle:
+        """
+        :param full_name: Полное имя метода.
+        :return: Закэшированный MethodHandle.
+        """
+        handle = self.methods.get(full_name)
+        if handle is None:
+            handle = self.methods[full_name] = build_method_handle(self.channel, self.registry, full_name)
+        return handle
+
+    async def invoke_method(self, full_name: str, request: Request, idempotent: bool | None = None) -> Any:
+        """
+        Вызывает метод по полному имени.
+
+        :param full_name: Полное имя метода.
+        :param request: Сообщение или словарь с полями запроса.
+        :param idempotent: Переопределяет идемпотентность метода (по умолчанию True для Get*).
+        :return: Ответ сервиса.
+        """
+        handle = self.method(full_name)
+        return await self.invoke(
+            handle.name,
+            handle.multicallable,
+            handle.build_request(request),
+            handle.idempotent if idempotent is None else idempotent
+        )
@@ -0,0 +1,65 @@
+from dataclasses import dataclass, field
+from typing import Any, Mapping
+
+from grpc import RpcError
+
+from clients.grpc.serialized import SerializedRequestCache
+from clients.metrics import MetricsSink, get_metrics_sink
+from clients.retry import HedgePolicy, RetryBudget, RetryCondition, RetryPolicy
+
+
+@dataclass
+class GRPCClientOptions:
+    """
+    Настройки поведения gRPC-клиента.
+
+    :param metrics: Приёмник метрик; по умолчанию — приёмник процесса (см. clients.metrics).
+    :param retry: Политика повторов; None — без повторов.
+    :param hedge: Политика хеджирования идемпотентных вызовов; None — без хеджирования.
+    :param retry_budget: Бюджет повторов и хеджей; чтобы он был общим, передавайте один экземпляр всем клиентам.
+    :param timeout: Дедлайн вызова по умолчанию, секунды; None — без дедлайна.
+    :param method_timeouts: Дедлайны для отдельных методов stub'а, например {"GetOperations": 10}.
+    :param wait_for_ready: Ждать готовности канала вместо немедленной ошибки UNAVAILABLE.
+    :param pipeline_depth: Сколько вызовов call_many() держит в полёте одновременно.
+    :param serialized_requests: Кэш сериализованных запросов для call_serialized(); None — кэш выключен.
+    """
+    metrics: MetricsSink = field(default_factory=get_metrics_sink)
+    retry: RetryPolicy | None = None
+    hedge: HedgePolicy | None = None
+    retry_budget: RetryBudget = field(default_factory=RetryBudget)
+    timeout: float | None = None
+    method_timeouts: Mapping[str, float] = field(default_factory=dict)
+    wait_for_ready: bool = False
+    pipeline_depth: int = 32
+    serialized_requests: SerializedRequestCache | None = None
+
+    def call_kwargs(self, method: str) -> dict[str, Any]:
+        """
+        Параметры вызова multicallable для метода.
+
+        :param method: Имя метода stub'а, например GetUser.
+        :return: Словарь с timeout и wait_for_ready.
+        """
+        return {
+            "timeout": self.method_timeouts.get(method, self.timeout),
+            "wait_for_ready": self.wait_for_ready,
+        }
+
+
+def build_grpc_retry_condition(idempotent: bool, policy: RetryPolicy) -> RetryCondition:
+    """
+    Условие повтора gRPC-вызова: ошибка RpcError с кодом из policy.retry_codes.
+    По коду gRPC нельзя понять, дошёл ли запрос до сервера, поэтому неидемпотентные
+    вызовы повторяются только при policy.retry_non_idempotent.
+
+    :param idempotent: Идемпотентен ли вызов.
+    :param policy: Политика повторов.
+    :return: Функция (response, error) -> bool.
+    """
+    if not (idempotent or policy.retry_non_idempotent):
+        return lambda response, error: False
+
+    def should_retry(response: Any, error: BaseException | None) -> bool:
+        return isinstance(error, RpcError) and error.code().name in policy.retry_codes
+
+    return should_retry
@@ -0,0 +1,175 @@
+import itertools
+import threading
+from typing import Any, Callable, Sequence
+
+import grpc
+
+# Опции канала: список пар (ключ, значение), как в grpc.insecure_channel
+ChannelOptions = Sequence[tuple[str, Any]]
+
+# Аргумент с номером канала в пуле. gRPC переиспользует одно TCP/HTTP2-соединение
+# (subchannel) для всех каналов с одинаковыми аргументами, поэтому без уникального
+# аргумента N каналов на деле сводятся к одному соединению.
+POOL_INDEX_OPTION = "grpc.channel_pool_index"
+
+
+class ChannelPool(grpc.Channel):
+    """
+    Пул gRPC-каналов с раздачей вызовов по кругу (round-robin).
+
+    Один канал — одно HTTP/2-соединение, и под нагрузкой оно упирается в лимит
+    одновременных потоков (max concurrent streams) и в окно flow control.
+    Пул держит size независимых каналов (каждый со своим соединением) и сам
+    реализует интерфейс grpc.Channel, поэтому сгенерированные stub'ы создаются
+    поверх пула без изменений: каждый вызов multicallable уходит в следующий канал.
+
+    Для unary-unary вызовов ведётся счётчик вызовов «в полёте» по каждому каналу.
+    """
+
+    def __init__(
+            self,
+            size: int,
+            factory: Callable[[ChannelOptions], grpc.Channel],
+            options: ChannelOptions = ()
+    ):
+        """
+        :param size: Количество каналов в пуле.
+        :param factory: Функция, создающая канал по списку опций, например
+                        lambda options: grpc.insecure_channel(target, options=options).
+        :param options: Общие опции каналов; к ним добавляется уникальный POOL_INDEX_OPTION.
+        """
+        if size < 1:
+            raise ValueError("Channel pool size must be at least 1")
+
+        self.channels = [
+            factory([*options, (POOL_INDEX_OPTION, index), ("grpc.use_local_subchannel_pool", 1)])
+            for index in range(size)
+        ]
+
+        self._lock = threading.Lock()
+        self._in_flight = [0] * size
+        self._next = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self.channels)
+
+    def next_index(self) -> int:
+        """
+        :return: Номер канала для очередного вызова.
+        """
+        return next(self._next) % len(self.channels)
+
+    def acquire(self, index: int) -> None:
+        with self._lock:
+            self._in_flight[index] += 1
+
+    def release(self, index: int) -> None:
+        with self._lock:
+            self._in_flight[index] -= 1
+
+    def in_flight(self) -> list[int]:
+        """
+        :return: Количество незавершённых unary-unary вызовов по каждому каналу.
+        """
+        with self._lock:
+            return list(self._in_flight)
+
+    def unary_unary(self, method, request_serializer=None, response_deserializer=None, **kwargs):
+        return PooledUnaryUnaryMultiCallable(self, [
+            channel.unary_unary(method, request_serializer, response_deserializer, **kwargs)
+            for channel in self.channels
+        ])
+
+    def unary_stream(self, method, request_serializer=None, response_deserializer=None, **kwargs):
+        return PooledMultiCallable(self, [
+            channel.unary_stream(method, request_serializer, response_deserializer, **kwargs)
+            for channel in self.channels
+        ])
+
+    def stream_unary(self, method, request_serializer=None, response_deserializer=None, **kwargs):
+        return PooledMultiCallable(self, [
+            channel.stream_unary(method, request_serializer, response_deserializer, **kwargs)
+            for channel in self.channels
+        ])
+
+    def stream_stream(self, method, request_serializer=None, response_deserializer=None, **kwargs):
+        return PooledMultiCallable(self, [
+            channel.stream_stream(method, request_serializer, response_deserializer, **kwargs)
+            for channel in self.channels
+        ])
+
+    def subscribe(self, callback, try_to_connect=False):
+        for channel in self.channels:
+            channel.subscribe(callback, try_to_connect)
+
+    def unsubscribe(self, callback):
+        for channel in self.channels:
+            channel.unsubscribe(callback)
+
+    def close(self):
+        """
+        Закрывает все каналы пула.
+        """
+        for channel in self.channels:
+            channel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class PooledMultiCallable:
+    """
+    Multicallable поверх пула: каждый вызов отправляется через следующий канал.
+    Используется для потоковых методов, счётчики «в полёте» для них не ведутся.
+    """
+
+    def __init__(self, pool: ChannelPool, multicallables: list):
+        self.pool = pool
+        self.multicallables = multicallables
+
+    def __call__(self, *args, **kwargs):
+        return self.multicallables[self.pool.next_index()](*args, **kwargs)
+
+    def with_call(self, *args, **kwargs):
+        return self.multicallables[self.pool.next_index()].with_call(*args, **kwargs)
+
+    def future(self, *args, **kwargs):
+        return self.multicallables[self.pool.next_index()].future(*args, **kwargs)
+
+
+class PooledUnaryUnaryMultiCallable(PooledMultiCallable):
+    """
+    Unary-unary multicallable поверх пула со счётчиками вызовов «в полёте».
+    Поддерживает блокирующий вызов, with_call и future.
+    """
+
+    def __call__(self, *args, **kwargs):
+        index = self.pool.next_index()
+        self.pool.acquire(index)
+        try:
+            return self.multicallables[index](*args, **kwargs)
+        finally:
+            self.pool.release(index)
+
+    def with_call(self, *args, **kwargs):
+        index = self.pool.next_index()
+        self.pool.acquire(index)
+        try:
+            return self.multicallables[index].with_call(*args, **kwargs)
+        finally:
+            self.pool.release(index)
+
+    def future(self, *args, **kwargs):
+        index = self.pool.next_index()
+        self.pool.acquire(index)
+        try:
+            future = self.multicallables[index].future(*args, **kwargs)
+        except BaseException:
+            self.pool.release(index)
+            raise
+        future.add_done_callback(lambda _: self.pool.release(index))
+        return future
@@ -0,0 +1,73 @@
+import threading
+from typing import Any, Callable, Hashable
+
+from google.protobuf.descriptor import ServiceDescriptor
+from google.protobuf.message import Message
+from google.protobuf.message_factory import GetMessageClass
+
+
+class SerializedRequestCache:
+    """
+    Кэш сериализованных gRPC-запросов (результатов SerializeToString()).
+
+    В read-heavy сценариях одни и те же GetUserRequest/GetOperationRequest отправляются
+    снова и снова. Кэш хранит готовые байты по ключу запроса, поэтому на повторном
+    вызове не выполняется сериализация (а при вызове call_serialized() с фабрикой
+    запроса не создаётся и само protobuf-сообщение).
+    При переполнении вытесняются самые старые записи.
+
+    Кэш можно разделять между клиентами и greenlet'ами процесса: попадание — это
+    чтение словаря, блокировка берётся только при добавлении записи.
+    """
+
+    def __init__(self, maxsize: int = 10_000):
+        """
+        :param maxsize: Максимальное число запросов в кэше.
+        """
+        self.maxsize = maxsize
+
+        self._lock = threading.Lock()
+        self._payloads: dict[Hashable, bytes] = {}
+
+    def __len__(self) -> int:
+        return len(self._payloads)
+
+    def get(self, key: Hashable, build_request: Callable[[], Message]) -> bytes:
+        """
+        Возвращает сериализованный запрос, создавая его при первом обращении.
+
+        :param key: Ключ запроса, например (имя метода, идентификатор).
+        :param build_request: Функция, создающая protobuf-запрос.
+        :return: Байты запроса.
+        """
+        payload = self._payloads.get(key)
+        if payload is not None:
+            return payload
+
+        payload = build_request().SerializeToString()
+        with self._lock:
+            if len(self._payloads) >= self.maxsize:
+                del self._payloads[next(iter(self._payloads))]
+            self._payloads[key] = payload
+        return payload
+
+
+def build_serialized_multicallable(channel: Any, service: ServiceDescriptor, method: str) -> Any:
+    """
+    Создаёт unary-unary multicallable, который отправляет уже сериализованные байты.
+
+    Сериализатор запроса не задаётся (identity): gRPC передаёт байты как есть.
+    Ответ разбирается классом ответа метода из дескриптора сервиса.
+
+    :param channel: Синхронный или асинхронный канал (в том числе ChannelPool).
+    :param service: Дескриптор сервиса, например
+                    users_gateway_service_pb2.DESCRIPTOR.services_by_name["UsersGatewayService"].
+    :param method: Имя метода, например GetUser.
+    :return: Multicallable, принимающий bytes.
+    """
+    descriptor = service.methods_by_name[method]
+    return channel.unary_unary(
+        f"/{service.full_name}/{method}",
+        request_serializer=None,
+        response_deserializer=GetMessageClass(descriptor.output_type).FromString,
+    )
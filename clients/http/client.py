@@ -1,31 +1,487 @@
-from typing import Any
-from httpx import Client, URL, Response, QueryParams
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Iterator, TypeVar
+from httpx import (
+    Client,
+    AsyncClient,
+    URL,
+    Response,
+    QueryParams,
+    TransportError,
+    ConnectError,
+    ConnectTimeout,
+    PoolTimeout,
+)
+from pydantic import BaseModel
+
+from clients.http.codecs import JSONCodec, StdlibJSONCodec
+from clients.http.timing import RequestTimer
+from clients.metrics import MetricsSink, get_metrics_sink
+from clients.retry import (
+    HedgePolicy,
+    RetryBudget,
+    RetryCondition,
+    RetryPolicy,
+    acall_hedged,
+    acall_with_retry,
+    call_hedged,
+    call_with_retry,
+)
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+# Методы, которые безопасно повторять после ошибки
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Методы, которые хеджируются. PUT и DELETE идемпотентны, но хедж отправляет копию записи,
+# пока исходная ещё в полёте, поэтому хеджируются только чтения
+HEDGED_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+@dataclass
+class HTTPClientOptions:
+    """
+    Настройки поведения HTTP API клиента поверх httpx.
+
+    :param metrics: Приёмник метрик; по умолчанию — приёмник процесса (см. clients.metrics).
+    :param codec: Кодек JSON для тел запросов и ответов.
+    :param retry: Политика повторов; None — без повторов.
+    :param hedge: Политика хеджирования запросов на чтение (HEDGED_METHODS); None — без хеджирования.
+    :param retry_budget: Бюджет повторов и хеджей; чтобы он был общим, передавайте один экземпляр всем клиентам.
+    :param discard_body: Режим чистой пропускной способности: тело ответа читается и выбрасывается,
+                         высокоуровневые методы вместо разобранного ответа возвращают DiscardedResponse.
+    """
+    metrics: MetricsSink = field(default_factory=get_metrics_sink)
+    codec: JSONCodec = field(default_factory=StdlibJSONCodec)
+    retry: RetryPolicy | None = None
+    hedge: HedgePolicy | None = None
+    retry_budget: RetryBudget = field(default_factory=RetryBudget)
+    discard_body: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class DiscardedResponse:
+    """
+    Облегчённый результат запроса в режиме discard_body: тело не разбирается и не хранится.
+
+    :param status_code: HTTP-статус ответа.
+    :param size: Размер тела ответа в байтах (как пришло по сети).
+    :param elapsed: Время от отправки запроса до конца чтения ответа, секунды.
+    """
+    status_code: int
+    size: int
+    elapsed: float
+
+    @classmethod
+    def from_response(cls, response: Response) -> "DiscardedResponse":
+        return cls(
+            status_code=response.status_code,
+            size=response.num_bytes_downloaded,
+            elapsed=response.elapsed.total_seconds(),
+        )
 
 
 class HTTPClient:
     """
     Базовый HTTP API клиент, принимающий объект httpx.Client.
     :param client: экземпляр httpx.Client для выполнения HTTP-запросов
+    :param options: настройки клиента (метрики, кодек JSON, повторы и т.д.)
     """
 
-    def __init__(self, client: Client):
+    def __init__(self, client: Client, options: HTTPClientOptions | None = None):
         self.client = client
+        self.options = options or HTTPClientOptions()
 
-    def get(self, url: URL | str, params: QueryParams | None = None) -> Response:
+    def get(self, url: URL | str, params: QueryParams | None = None, name: str | None = None) -> Response:
         """
         Выполняет GET-запрос.
 
         :param url: URL-адрес эндпоинта.
         :param params: GET-параметры запроса (например, ?key=value).
+        :param name: Имя эндпоинта для метрик (например, get_user); по умолчанию — URL.
         :return: Объект Response с данными ответа.
         """
-        return self.client.get(url, params=params)
+        return self.send("GET", url, name, params=params)
 
-    def post(self, url: str, json: Any | None = None) -> Response:
+    def post(self, url: str, json: Any | None = None, name: str | None = None) -> Response:
         """
         Выполняет POST-запрос.
+
+        Тело кодируется кодеком клиента и передаётся httpx уже готовыми байтами.
+        :param url: URL-адрес эндпоинта.
+        :param json: Данные для JSON: словарь или pydantic-модель (сериализуется с alias'ами).
+        :param name: Имя эндпоинта для метрик (например, create_user); по умолчанию — URL.
+        :return: Объект Response с данными ответа.
+        """
+        if json is None:
+            return self.send("POST", url, name)
+
+        codec = self.options.codec
+        return self.send(
+            "POST", url, name, content=codec.encode(json), headers={"Content-Type": codec.content_type}
+        )
+
+    def send(self, method: str, url: URL | str, name: str | None, **kwargs) -> Response:
+        """
+        Выполняет запрос с учётом политик повторов и хеджирования.
+
+        :param method: HTTP-метод.
+        :param url: URL-адрес эндпоинта.
+        :param name: Имя эндпоинта для метрик.
+        :return: Объект Response с данными ответа.
+        """
+        options = self.options
+        if options.retry is None and options.hedge is None:
+            return self.send_once(method, url, name, **kwargs)
+
+        tags = {"endpoint": name or str(url)}
+        options.retry_budget.deposit()
+
+        def call() -> Response:
+            return self.send_once(method, url, name, **kwargs)
+
+        if options.hedge is not None and method in HEDGED_METHODS:
+            single_call = call
+
+            def call() -> Response:
+                return call_hedged(
+                    single_call,
+                    options.hedge,
+                    options.retry_budget,
+                    on_hedge=lambda: options.metrics.increment("http.hedge", tags),
+                    discard=Response.close
+                )
+
+        if options.retry is None:
+            return call()
+
+        return call_with_retry(
+            call,
+            options.retry,
+            options.retry_budget,
+            build_http_retry_condition(method, options.retry),
+            on_retry=lambda: options.metrics.increment("http.retry", tags)
+        )
+
+    def send_once(self, method: str, url: URL | str, name: str | None, **kwargs) -> Response:
+        """
+        Выполняет одну попытку запроса и, если метрики включены, записывает длительности его фаз.
+
+        :param method: HTTP-метод.
         :param url: URL-адрес эндпоинта.
-        :param json: Данные в формате JSON.
+        :param name: Имя эндпоинта для метрик.
         :return: Объект Response с данными ответа.
         """
-        return self.client.post(url=url, json=json)
+        metrics = self.options.metrics
+        if not metrics.enabled:
+            return self.request(method, url, **kwargs)
+
+        timer = RequestTimer()
+        response = self.request(method, url, extensions={"trace": timer.trace}, **kwargs)
+        record_request_phases(metrics, timer, name or str(url), response.status_code)
+        return response
+
+    def request(self, method: str, url: URL | str, **kwargs) -> Response:
+        """
+        Отправляет запрос через httpx. В режиме discard_body тело ответа читается
+        из сокета и сразу выбрасывается: в Response остаются только статус,
+        заголовки, размер (num_bytes_downloaded) и elapsed.
+
+        :param method: HTTP-метод.
+        :param url: URL-адрес эндпоинта.
+        :return: Объект Response.
+        """
+        if not self.options.discard_body:
+            return self.client.request(method, url, **kwargs)
+
+        with self.client.stream(method, url, **kwargs) as response:
+            for _ in response.iter_raw():
+                pass
+        return response
+
+    @contextmanager
+    def stream(
+            self,
+            method: str,
+            url: URL | str,
+            params: QueryParams | None = None,
+            name: str | None = None
+    ) -> Iterator[Response]:
+        """
+        Выполняет запрос с потоковым чтением тела ответа.
+        Тело не буферизуется целиком: его нужно читать через iter_bytes() внутри with.
+
+        Метрики пишутся так же, как для send(): ttfb — время до заголовков ответа,
+        read и total — по выходу из with, то есть вместе с чтением тела. Запрос учитывается
+        в бюджете повторов, но сам не повторяется: тело уже отдано вызывающему коду.
+
+        :param method: HTTP-метод.
+        :param url: URL-адрес эндпоинта.
+        :param params: GET-параметры запроса.
+        :param name: Имя эндпоинта для метрик; по умолчанию — URL.
+        :return: Контекстный менеджер с объектом Response.
+        """
+        options = self.options
+        if options.retry is not None or options.hedge is not None:
+            options.retry_budget.deposit()
+
+        if not options.metrics.enabled:
+            with self.client.stream(method, url, params=params) as response:
+                yield response
+            return
+
+        timer = RequestTimer()
+        with self.client.stream(method, url, params=params, extensions={"trace": timer.trace}) as response:
+            yield response
+        record_request_phases(options.metrics, timer, name or str(url), response.status_code)
+
+    def decode(self, response: Response) -> Any:
+        """
+        Разбирает JSON-тело ответа кодеком клиента.
+
+        :param response: Объект Response.
+        :return: Разобранное тело ответа; в режиме discard_body — DiscardedResponse.
+        """
+        if self.options.discard_body:
+            return DiscardedResponse.from_response(response)
+        return self.options.codec.decode(response.content)
+
+    def validate(self, response: Response, schema: type[SchemaT]) -> SchemaT:
+        """
+        Валидирует тело ответа pydantic-схемой напрямую из байтов.
+
+        response.text не используется: он декодирует тело в str и кэширует его в ответе,
+        после чего pydantic разбирает строку ещё раз. Из байтов валидатор читает JSON сам,
+        без промежуточной строки.
+
+        :param response: Объект Response.
+        :param schema: Pydantic-схема ответа.
+        :return: Экземпляр схемы; в режиме discard_body — DiscardedResponse.
+        """
+        if self.options.discard_body:
+            return DiscardedResponse.from_response(response)
+        return schema.model_validate_json(response.content)
+
+
+class AsyncHTTPClient:
+    """
+    Базовый асинхронный HTTP API клиент, принимающий объект httpx.AsyncClient.
+
+    Повторяет интерфейс HTTPClient, но методы являются корутинами, поэтому
+    один event loop может держать в полёте тысячи запросов одновременно.
+    :param client: экземпляр httpx.AsyncClient для выполнения HTTP-запросов
+    :param options: настройки клиента (метрики, кодек JSON, повторы и т.д.)
+    """
+
+    def __init__(self, client: AsyncClient, options: HTTPClientOptions | None = None):
+        self.client = client
+        self.options = options or HTTPClientOptions()
+
+    async def get(self, url: URL | str, params: QueryParams | None = None, name: str | None = None) -> Response:
+        """
+        Выполняет асинхронный GET-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param params: GET-параметры запроса (например, ?key=value).
+        :param name: Имя эндпоинта для метрик (например, get_user); по умолчанию — URL.
+        :return: Объект Response с данными ответа.
+        """
+        return await self.send("GET", url, name, params=params)
+
+    async def post(self, url: str, json: Any | None = None, name: str | None = None) -> Response:
+        """
+        Выполняет асинхронный POST-запрос.
+
+        Тело кодируется кодеком клиента и передаётся httpx уже готовыми байтами.
+        :param url: URL-адрес эндпоинта.
+        :param json: Данные для JSON: словарь или pydantic-модель (сериализуется с alias'ами).
+        :param name: Имя эндпоинта для метрик (например, create_user); по умолчанию — URL.
+        :return: Объект Response с данными ответа.
+        """
+        if json is None:
+            return await self.send("POST", url, name)
+
+        codec = self.options.codec
+        return await self.send(
+            "POST", url, name, content=codec.encode(json), headers={"Content-Type": codec.content_type}
+        )
+
+    async def send(self, method: str, url: URL | str, name: str | None, **kwargs) -> Response:
+        """
+        Выполняет асинхронный запрос с учётом политик повторов и хеджирования.
+
+        :param method: HTTP-метод.
+        :param url: URL-адрес эндпоинта.
+        :param name: Имя эндпоинта для метрик.
+        :return: Объект Response с данными ответа.
+        """
+        options = self.options
+        if options.retry is None and options.hedge is None:
+            return await self.send_once(method, url, name, **kwargs)
+
+        tags = {"endpoint": name or str(url)}
+        options.retry_budget.deposit()
+
+        async def call() -> Response:
+            return await self.send_once(method, url, name, **kwargs)
+
+        if options.hedge is not None and method in HEDGED_METHODS:
+            single_call = call
+
+            async def call() -> Response:
+                return await acall_hedged(
+                    single_call,
+                    options.hedge,
+                    options.retry_budget,
+                    on_hedge=lambda: options.metrics.increment("http.hedge", tags)
+                )
+
+        if options.retry is None:
+            return await call()
+
+        return await acall_with_retry(
+            call,
+            options.retry,
+            options.retry_budget,
+            build_http_retry_condition(method, options.retry),
+            on_retry=lambda: options.metrics.increment("http.retry", tags)
+        )
+
+    async def send_once(self, method: str, url: URL | str, name: str | None, **kwargs) -> Response:
+        """
+        Выполняет одну попытку асинхронного запроса и, если метрики включены, записывает длительности его фаз.
+
+        :param method: HTTP-метод.
+        :param url: URL-адрес эндпоинта.
+        :param name: Имя эндпоинта для метрик.
+        :return: Объект Response с данными ответа.
+        """
+        metrics = self.options.metrics
+        if not metrics.enabled:
+            return await self.request(method, url, **kwargs)
+
+        timer = RequestTimer()
+        response = await self.request(method, url, extensions={"trace": timer.atrace}, **kwargs)
+        record_request_phases(metrics, timer, name or str(url), response.status_code)
+        return response
+
+    async def request(self, method: str, url: URL | str, **kwargs) -> Response:
+        """
+        Отправляет асинхронный запрос через httpx. В режиме discard_body тело ответа
+        читается из сокета и сразу выбрасывается.
+
+        :param method: HTTP-метод.
+        :param url: URL-адрес эндпоинта.
+        :return: Объект Response.
+        """
+        if not self.options.discard_body:
+            return await self.client.request(method, url, **kwargs)
+
+        async with self.client.stream(method, url, **kwargs) as response:
+            async for _ in response.aiter_raw():
+                pass
+        return response
+
+    @asynccontextmanager
+    async def stream(
+            self,
+            method: str,
+            url: URL | str,
+            params: QueryParams | None = None,
+            name: str | None = None
+    ) -> AsyncIterator[Response]:
+        """
+        Выполняет асинхронный запрос с потоковым чтением тела ответа.
+        Тело не буферизуется целиком: его нужно читать через aiter_bytes() внутри async with.
+        Метрики и бюджет повторов учитываются так же, как в HTTPClient.stream().
+
+        :param method: HTTP-метод.
+        :param url: URL-адрес эндпоинта.
+        :param params: GET-параметры запроса.
+        :param name: Имя эндпоинта для метрик; по умолчанию — URL.
+        :return: Асинхронный контекстный менеджер с объектом Response.
+        """
+        options = self.options
+        if options.retry is not None or options.hedge is not None:
+            options.retry_budget.deposit()
+
+        if not options.metrics.enabled:
+            async with self.client.stream(method, url, params=params) as response:
+                yield response
+            return
+
+        timer = RequestTimer()
+        async with self.client.stream(method, url, params=params, extensions={"trace": timer.atrace}) as response:
+            yield response
+        record_request_phases(options.metrics, timer, name or str(url), response.status_code)
+
+    def decode(self, response: Response) -> Any:
+        """
+        Разбирает JSON-тело ответа кодеком клиента.
+
+        :param response: Объект Response.
+        :return: Разобранное тело ответа; в режиме discard_body — DiscardedResponse.
+        """
+        if self.options.discard_body:
+            return DiscardedResponse.from_response(response)
+        return self.options.codec.decode(response.content)
+
+    def validate(self, response: Response, schema: type[SchemaT]) -> SchemaT:
+        """
+        Валидирует тело ответа pydantic-схемой напрямую из байтов.
+
+        response.text не используется: он декодирует тело в str и кэширует его в ответе,
+        после чего pydantic разбирает строку ещё раз. Из байтов валидатор читает JSON сам,
+        без промежуточной строки.
+
+        :param response: Объект Response.
+        :param schema: Pydantic-схема ответа.
+        :return: Экземпляр схемы; в режиме discard_body — DiscardedResponse.
+        """
+        if self.options.discard_body:
+            return DiscardedResponse.from_response(response)
+        return schema.model_validate_json(response.content)
+
+    async def aclose(self) -> None:
+        """
+        Закрывает httpx.AsyncClient и освобождает соединения пула.
+        """
+        await self.client.aclose()
+
+
+def build_http_retry_condition(method: str, policy: RetryPolicy) -> RetryCondition:
+    """
+    Условие повтора HTTP-запроса.
+
+    Ошибки установки соединения и ожидания пула повторяются всегда: запрос не ушёл на сервер.
+    Остальные транспортные ошибки и статусы из policy.retry_statuses повторяются только
+    для идемпотентных методов либо при policy.retry_non_idempotent.
+
+    :param method: HTTP-метод.
+    :param policy: Политика повторов.
+    :return: Функция (response, error) -> bool.
+    """
+    repeatable = method in IDEMPOTENT_METHODS or policy.retry_non_idempotent
+
+    def should_retry(response: Response | None, error: BaseException | None) -> bool:
+        if error is not None:
+            if isinstance(error, (ConnectError, ConnectTimeout, PoolTimeout)):
+                return True
+            return repeatable and isinstance(error, TransportError)
+        return repeatable and response.status_code in policy.retry_statuses
+
+    return should_retry
+
+
+def record_request_phases(metrics: MetricsSink, timer: RequestTimer, endpoint: str, status_code: int) -> None:
+    """
+    Отправляет длительности фаз запроса в приёмник метрик как http.request.<фаза>.
+
+    :param metrics: Приёмник метрик.
+    :param timer: Замер запроса.
+    :param endpoint: Имя эндпоинта (тег endpoint).
+    :param status_code: HTTP-статус ответа (тег status).
+    """
+    tags = {"endpoint": endpoint, "status": str(status_code)}
+    for phase, value in timer.phases().items():
+        metrics.timing(f"http.request.{phase}", value, tags)
@@ -0,0 +1,103 @@
+import json
+from typing import Any, Protocol
+
+from pydantic import BaseModel
+
+
+class JSONCodec(Protocol):
+    """
+    Кодек JSON для тел запросов и ответов HTTP API клиентов.
+    """
+    name: str
+    content_type: str
+
+    def encode(self, value: Any) -> bytes:
+        """
+        Сериализует значение в JSON.
+
+        :param value: Словарь/список или pydantic-модель.
+        :return: JSON в виде байтов.
+        """
+        ...
+
+    def decode(self, content: bytes) -> Any:
+        """
+        Разбирает JSON из байтов тела ответа.
+
+        :param content: Тело ответа.
+        :return: Разобранное значение.
+        """
+        ...
+
+
+class StdlibJSONCodec:
+    """
+    Кодек на стандартном модуле json. Pydantic-модели сериализуются
+    собственным (Rust) сериализатором pydantic, минуя промежуточный dict.
+    """
+    name = "stdlib"
+    content_type = "application/json"
+
+    def encode(self, value: Any) -> bytes:
+        if isinstance(value, BaseModel):
+            return encode_model(value)
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+    def decode(self, content: bytes) -> Any:
+        return json.loads(content)
+
+
+class OrjsonJSONCodec:
+    """
+    Кодек на orjson — заметно быстрее stdlib json на кодировании и разборе.
+    Требует установленный пакет orjson.
+    """
+    name = "orjson"
+    content_type = "application/json"
+
+    def __init__(self):
+        import orjson  # необязательная зависимость, нужна только этому кодеку
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+
+    def encode(self, value: Any) -> bytes:
+        if isinstance(value, BaseModel):
+            return encode_model(value)
+        return self._dumps(value)
+
+    def decode(self, content: bytes) -> Any:
+        return self._loads(content)
+
+
+def encode_model(model: BaseModel) -> bytes:
+    """
+    Сериализует pydantic-модель в JSON-байты с учётом alias'ов.
+
+    model_dump_json() возвращает str, полученный декодированием тех же байтов,
+    поэтому сериализатор вызывается напрямую, без лишнего decode/encode.
+
+    :param model: Pydantic-модель.
+    :return: JSON в виде байтов.
+    """
+    return model.__pydantic_serializer__.to_json(model, by_alias=True)
+
+
+JSON_CODECS: dict[str, type[JSONCodec]] = {
+    StdlibJSONCodec.name: StdlibJSONCodec,
+    OrjsonJSONCodec.name: OrjsonJSONCodec,
+}
+
+
+def build_json_codec(name: str) -> JSONCodec:
+    """
+    Создаёт кодек по имени.
+
+    :param name: Имя кодека: stdlib или orjson.
+    :return: Экземпляр кодека.
+    """
+    try:
+        codec = JSON_CODECS[name]
+    except KeyError:
+        raise ValueError(f"Unknown JSON codec {name!r}, expected one of: {', '.join(JSON_CODECS)}") from None
+    return codec()
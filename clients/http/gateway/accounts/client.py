@@ -1,8 +1,12 @@
 from typing import TypedDict
 from httpx import Response, QueryParams
-from clients.http.client import HTTPClient
+from clients.http.client import HTTPClient, AsyncHTTPClient
 from clients.http.gateway.cards.client import CardDict
-from clients.http.gateway.client import build_gateway_http_client  # Импортируем builder
+from clients.http.gateway.client import (  # Импортируем builder
+    build_gateway_http_client,
+    build_gateway_async_http_client,
+    build_gateway_http_client_options,
+)
 
 
 # Добавили описание структуры счета
@@ -103,7 +107,7 @@ class AccountsGatewayHTTPClient(HTTPClient):
         :param query: Словарь с параметрами запроса, например: {'userId': '123'}.
         :return: Объект httpx.Response с данными о счетах.
         """
-        return self.get("/api/v1/accounts", params=QueryParams(**query))
+        return self.get("/api/v1/accounts", params=QueryParams(**query), name="get_accounts")
 
     def open_deposit_account_api(self, request: OpenDepositAccountRequestDict) -> Response:
         """
@@ -111,7 +115,7 @@ class AccountsGatewayHTTPClient(HTTPClient):
         :param request: Словарь с userId.
         :return: Объект httpx.Response с результатом операции.
         """
-        return self.post("/api/v1/accounts/open-deposit-account", json=request)
+        return self.post("/api/v1/accounts/open-deposit-account", json=request, name="open_deposit_account")
 
     def open_savings_account_api(self, request: OpenSavingsAccountRequestDict) -> Response:
         """
@@ -119,7 +123,7 @@ class AccountsGatewayHTTPClient(HTTPClient):
         :param request: Словарь с userId.
         :return: Объект httpx.Response.
         """
-        return self.post("/api/v1/accounts/open-savings-account", json=request)
+        return self.post("/api/v1/accounts/open-savings-account", json=request, name="open_savings_account")
 
     def open_debit_card_account_api(self, request: OpenDebitCardAccountRequestDict) -> Response:
         """
@@ -127,7 +131,7 @@ class AccountsGatewayHTTPClient(HTTPClient):
         :param request: Словарь с userId.
         :return: Объект httpx.Response.
         """
-        return self.post("/api/v1/accounts/open-debit-card-account", json=request)
+        return self.post("/api/v1/accounts/open-debit-card-account", json=request, name="open_debit_card_account")
 
     def open_credit_card_account_api(self, request: OpenCreditCardAccountRequestDict) -> Response:
         """
@@ -135,37 +139,37 @@ class AccountsGatewayHTTPClient(HTTPClient):
         :param request: Словарь с userId.
         :return: Объект httpx.Response.
         """
-        return self.post("/api/v1/accounts/open-credit-card-account", json=request)
+        return self.post("/api/v1/accounts/open-credit-card-account", json=request, name="open_credit_card_account")
 
     # Добавили новый метод
     def get_accounts(self, user_id: str) -> GetAccountsResponseDict:
         query = GetAccountsQueryDict(userId=user_id)
         response = self.get_accounts_api(query)
-        return response.json()
+        return self.decode(response)
 
     # Добавили новый метод
     def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponseDict:
         request = OpenDepositAccountRequestDict(userId=user_id)
         response = self.open_deposit_account_api(request)
-        return response.json()
+        return self.decode(response)
 
     # Добавили новый метод
     def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponseDict:
         request = OpenSavingsAccountRequestDict(userId=user_id)
         response = self.open_savings_account_api(request)
-        return response.json()
+        return self.decode(response)
 
     # Добавили новый метод
     def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponseDict:
         request = OpenDebitCardAccountRequestDict(userId=user_id)
         response = self.open_debit_card_account_api(request)
-        return response.json()
+        return self.decode(response)
 
     # Добавили новый метод
     def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponseDict:
         request = OpenCreditCardAccountRequestDict(userId=user_id)
         response = self.open_credit_card_account_api(request)
-        return response.json()
+        return self.decode(response)
 
 
 # Добавляем builder для AccountsGatewayHTTPClient
@@ -175,4 +179,90 @@ def build_accounts_gateway_http_client() -> AccountsGatewayHTTPClient:
 
     :return: Готовый к использованию AccountsGatewayHTTPClient.
     """
-    return AccountsGatewayHTTPClient(client=build_gateway_http_client())
+    return AccountsGatewayHTTPClient(
+        client=build_gateway_http_client(),
+        options=build_gateway_http_client_options()
+    )
+
+
+class AsyncAccountsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/accounts сервиса http-gateway.
+    """
+
+    async def get_accounts_api(self, query: GetAccountsQueryDict) -> Response:
+        """
+        Выполняет GET-запрос на получение списка счетов пользователя.
+        :param query: Словарь с параметрами запроса, например: {'userId': '123'}.
+        :return: Объект httpx.Response с данными о счетах.
+        """
+        return await self.get("/api/v1/accounts", params=QueryParams(**query), name="get_accounts")
+
+    async def open_deposit_account_api(self, request: OpenDepositAccountRequestDict) -> Response:
+        """
+        Выполняет POST-запрос для открытия депозитного счёта.
+        :param request: Словарь с userId.
+        :return: Объект httpx.Response с результатом операции.
+        """
+        return await self.post("/api/v1/accounts/open-deposit-account", json=request, name="open_deposit_account")
+
+    async def open_savings_account_api(self, request: OpenSavingsAccountRequestDict) -> Response:
+        """
+        Выполняет POST-запрос для открытия сберегательного счёта.
+        :param request: Словарь с userId.
+        :return: Объект httpx.Response.
+        """
+        return await self.post("/api/v1/accounts/open-savings-account", json=request, name="open_savings_account")
+
+    async def open_debit_card_account_api(self, request: OpenDebitCardAccountRequestDict) -> Response:
+        """
+        Выполняет POST-запрос для открытия дебетовой карты.
+        :param request: Словарь с userId.
+        :return: Объект httpx.Response.
+        """
+        return await self.post("/api/v1/accounts/open-debit-card-account", json=request, name="open_debit_card_account")
+
+    async def open_credit_card_account_api(self, request: OpenCreditCardAccountRequestDict) -> Response:
+        """
+        Выполняет POST-запрос для открытия кредитной карты.
+        :param request: Словарь с userId.
+        :return: Объект httpx.Response.
+        """
+        return await self.post("/api/v1/accounts/open-credit-card-account", json=request, name="open_credit_card_account")
+
+    async def get_accounts(self, user_id: str) -> GetAccountsResponseDict:
+        query = GetAccountsQueryDict(userId=user_id)
+        response = await self.get_accounts_api(query)
+        return self.decode(response)
+
+    async def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponseDict:
+        request = OpenDepositAccountRequestDict(userId=user_id)
+        response = await self.open_deposit_account_api(request)
+        return self.decode(response)
+
+    async def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponseDict:
+        request = OpenSavingsAccountRequestDict(userId=user_id)
+        response = await self.open_savings_account_api(request)
+        return self.decode(response)
+
+    async def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponseDict:
+        request = OpenDebitCardAccountRequestDict(userId=user_id)
+        response = await self.open_debit_card_account_api(request)
+        return self.decode(response)
+
+    async def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponseDict:
+        request = OpenCreditCardAccountRequestDict(userId=user_id)
+        response = await self.open_credit_card_account_api(request)
+        return self.decode(response)
+
+
+def build_async_accounts_gateway_http_client() -> AsyncAccountsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncAccountsGatewayHTTPClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncAccountsGatewayHTTPClient.
+    """
+    return AsyncAccountsGatewayHTTPClient(
+        client=build_gateway_async_http_client(),
+        options=build_gateway_http_client_options()
+    )
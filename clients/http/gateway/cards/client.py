@@ -1,7 +1,11 @@
 from typing import TypedDict
 from httpx import Response
-from clients.http.client import HTTPClient
-from clients.http.gateway.client import build_gateway_http_client  # Импортируем builder
+from clients.http.client import HTTPClient, AsyncHTTPClient
+from clients.http.gateway.client import (  # Импортируем builder
+    build_gateway_http_client,
+    build_gateway_async_http_client,
+    build_gateway_http_client_options,
+)
 
 
 # Добавили описание структуры карты
@@ -65,7 +69,7 @@ class CardsGatewayHTTPClient(HTTPClient):
         :param request: Словарь с данными для выпуска виртуальной карты.
         :return: Ответ от сервера (объект httpx.Response).
         """
-        return self.post("/api/v1/cards/issue-virtual-card", json=request)
+        return self.post("/api/v1/cards/issue-virtual-card", json=request, name="issue_virtual_card")
 
     def issue_physical_card_api(self, request: IssuePhysicalCardRequestDict) -> Response:
         """
@@ -74,19 +78,19 @@ class CardsGatewayHTTPClient(HTTPClient):
         :param request: Словарь с данными для выпуска физической карты.
         :return: Ответ от сервера (объект httpx.Response).
         """
-        return self.post("/api/v1/cards/issue-physical-card", json=request)
+        return self.post("/api/v1/cards/issue-physical-card", json=request, name="issue_physical_card")
 
     # Добавили новый метод
     def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponseDict:
         request = IssueVirtualCardRequestDict(userId=user_id, accountId=account_id)
         response = self.issue_virtual_card_api(request)
-        return response.json()
+        return self.decode(response)
 
     # Добавили новый метод
     def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponseDict:
         request = IssuePhysicalCardRequestDict(userId=user_id, accountId=account_id)
         response = self.issue_physical_card_api(request)
-        return response.json()
+        return self.decode(response)
 
 
 # Добавляем builder для CardsGatewayHTTPClient
@@ -96,4 +100,53 @@ def build_cards_gateway_http_client() -> CardsGatewayHTTPClient:
 
     :return: Готовый к использованию CardsGatewayHTTPClient.
     """
-    return CardsGatewayHTTPClient(client=build_gateway_http_client())
+    return CardsGatewayHTTPClient(
+        client=build_gateway_http_client(),
+        options=build_gateway_http_client_options()
+    )
+
+
+class AsyncCardsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/cards сервиса http-gateway.
+    """
+
+    async def issue_virtual_card_api(self, request: IssueVirtualCardRequestDict) -> Response:
+        """
+        Выпуск виртуальной карты.
+
+        :param request: Словарь с данными для выпуска виртуальной карты.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post("/api/v1/cards/issue-virtual-card", json=request, name="issue_virtual_card")
+
+    async def issue_physical_card_api(self, request: IssuePhysicalCardRequestDict) -> Response:
+        """
+        Выпуск физической карты.
+
+        :param request: Словарь с данными для выпуска физической карты.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post("/api/v1/cards/issue-physical-card", json=request, name="issue_physical_card")
+
+    async def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponseDict:
+        request = IssueVirtualCardRequestDict(userId=user_id, accountId=account_id)
+        response = await self.issue_virtual_card_api(request)
+        return self.decode(response)
+
+    async def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponseDict:
+        request = IssuePhysicalCardRequestDict(userId=user_id, accountId=account_id)
+        response = await self.issue_physical_card_api(request)
+        return self.decode(response)
+
+
+def build_async_cards_gateway_http_client() -> AsyncCardsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncCardsGatewayHTTPClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncCardsGatewayHTTPClient.
+    """
+    return AsyncCardsGatewayHTTPClient(
+        client=build_gateway_async_http_client(),
+        options=build_gateway_http_client_options()
+    )
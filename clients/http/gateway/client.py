@@ -1,10 +1,96 @@
-from httpx import Client
+from httpx import Client, AsyncClient, HTTPTransport, AsyncHTTPTransport
+
+from clients.http.client import HTTPClientOptions
+from clients.http.codecs import build_json_codec
+from clients.http.gateway.config import GatewayHTTPConfig, get_gateway_http_config, get_gateway_retry_budget
+from clients.http.transport import TransportRegistry, SharedHTTPTransport, SharedAsyncHTTPTransport
+from clients.metrics import get_metrics_sink
+
+
+def build_gateway_http_transport(config: GatewayHTTPConfig | None = None) -> HTTPTransport:
+    """
+    Создаёт пул соединений к http-gateway с лимитами и версией протокола из GatewayHTTPConfig.
+
+    :param config: Настройки gateway; по умолчанию — настройки процесса.
+    :return: Объект httpx.HTTPTransport.
+    """
+    config = config or get_gateway_http_config()
+    return HTTPTransport(limits=config.to_limits(), **config.to_http_versions())
+
+
+def build_gateway_async_http_transport(config: GatewayHTTPConfig | None = None) -> AsyncHTTPTransport:
+    """
+    Создаёт асинхронный пул соединений к http-gateway с лимитами и версией протокола из GatewayHTTPConfig.
+
+    :param config: Настройки gateway; по умолчанию — настройки процесса.
+    :return: Объект httpx.AsyncHTTPTransport.
+    """
+    config = config or get_gateway_http_config()
+    return AsyncHTTPTransport(limits=config.to_limits(), **config.to_http_versions())
+
+
+# Общие пулы соединений для всех gateway-клиентов процесса.
+# Каждый build_*_gateway_http_client() получает транспорт отсюда, а не создаёт новый пул.
+gateway_transport_registry: TransportRegistry[HTTPTransport] = TransportRegistry(
+    factory=build_gateway_http_transport,
+    scope=get_gateway_http_config().transport_scope
+)
+gateway_async_transport_registry: TransportRegistry[AsyncHTTPTransport] = TransportRegistry(
+    factory=build_gateway_async_http_transport,
+    scope=get_gateway_http_config().transport_scope,
+    per_event_loop=True
+)
 
 
 def build_gateway_http_client() -> Client:
     """
     Функция создаёт экземпляр httpx.Client с базовыми настройками для сервиса http-gateway.
 
+    Адрес и таймауты берутся из GatewayHTTPConfig, пул соединений — общий
+    из gateway_transport_registry.
+
     :return: Готовый к использованию объект httpx.Client.
     """
-    return Client(timeout=100, base_url="http://localhost:8003")
+    config = get_gateway_http_config()
+    transport = SharedHTTPTransport(gateway_transport_registry.get())
+    return Client(timeout=config.to_timeout(), base_url=config.base_url, transport=transport)
+
+
+def build_gateway_async_http_client() -> AsyncClient:
+    """
+    Функция создаёт экземпляр httpx.AsyncClient с базовыми настройками для сервиса http-gateway.
+
+    Адрес и таймауты берутся из GatewayHTTPConfig, пул соединений — общий
+    из gateway_async_transport_registry.
+
+    :return: Готовый к использованию объект httpx.AsyncClient.
+    """
+    config = get_gateway_http_config()
+    transport = SharedAsyncHTTPTransport(gateway_async_transport_registry.get())
+    return AsyncClient(timeout=config.to_timeout(), base_url=config.base_url, transport=transport)
+
+
+def build_gateway_http_client_options() -> HTTPClientOptions:
+    """
+    Функция собирает настройки для gateway HTTP API клиентов.
+
+    Приёмник метрик берётся из clients.metrics на момент создания клиента,
+    поэтому set_metrics_sink() нужно вызывать до построения клиентов.
+    Бюджет повторов общий для всех gateway-клиентов процесса.
+    Действующие настройки записываются в приёмник метрик и попадают в отчёт о прогоне.
+
+    :return: Объект HTTPClientOptions.
+    """
+    config = get_gateway_http_config()
+
+    metrics = get_metrics_sink()
+    metrics.annotate("http.config", config.model_dump(mode="json"))
+
+    return HTTPClientOptions(
+        metrics=metrics,
+        codec=build_json_codec(config.json_codec),
+        retry=config.to_retry_policy(),
+        hedge=config.to_hedge_policy(),
+        retry_budget=get_gateway_retry_budget(),
+        discard_body=config.discard_body,
+    )
@@ -0,0 +1,140 @@
+from functools import lru_cache
+from typing import ClassVar
+
+from httpx import Limits, Timeout
+
+from clients.config import EnvConfig
+from clients.http.transport import TransportScope
+from clients.retry import HedgePolicy, RetryBudget, RetryPolicy
+
+
+class GatewayHTTPConfig(EnvConfig):
+    """
+    Настройки транспорта для подключения к gateway-сервису.
+
+    Значения читаются из переменных окружения с префиксом GATEWAY_HTTP_
+    (например, GATEWAY_HTTP_MAX_CONNECTIONS=2000) и/или из JSON-файла,
+    путь к которому задаётся через GATEWAY_HTTP_CONFIG_FILE.
+
+    :param base_url: Адрес http-gateway.
+    :param max_connections: Максимальное число соединений в пуле.
+    :param max_keepalive_connections: Сколько простаивающих соединений держать открытыми.
+    :param keepalive_expiry: Через сколько секунд простоя закрывать keep-alive соединение.
+    :param connect_timeout: Таймаут установки соединения, секунды.
+    :param read_timeout: Таймаут чтения ответа, секунды.
+    :param write_timeout: Таймаут отправки запроса, секунды.
+    :param pool_timeout: Сколько ждать свободного соединения из пула, секунды.
+    :param transport_scope: Область переиспользования пула соединений.
+    :param http2: Использовать HTTP/2 (мультиплексирование запросов в нескольких соединениях).
+                  Требует пакет h2 (pip install httpx[http2]).
+    :param json_codec: Кодек JSON для тел запросов и ответов: stdlib или orjson.
+    :param retry_max_attempts: Максимум попыток на запрос, включая первую (1 — без повторов).
+    :param retry_backoff_base: Базовая задержка перед повтором, секунды.
+    :param retry_backoff_max: Максимальная задержка перед повтором, секунды.
+    :param retry_non_idempotent: Повторять ли POST/Make*/Create* после ошибок, когда запрос мог дойти до сервера.
+    :param retry_budget_ratio: Доля повторов и хеджей от общего числа запросов процесса.
+    :param hedge_delay: Через сколько секунд отправлять хеджирующий GET; None — без хеджирования.
+    :param hedge_max: Максимум хеджирующих копий одного запроса.
+    :param discard_body: Читать и выбрасывать тела ответов (прогоны на чистую пропускную способность).
+    """
+    env_prefix: ClassVar[str] = "GATEWAY_HTTP_"
+
+    base_url: str = "http://localhost:8003"
+
+    max_connections: int | None = 1000
+    max_keepalive_connections: int | None = 1000
+    keepalive_expiry: float | None = 30.0
+
+    connect_timeout: float | None = 5.0
+    read_timeout: float | None = 30.0
+    write_timeout: float | None = 30.0
+    pool_timeout: float | None = 10.0
+
+    transport_scope: TransportScope = TransportScope.PROCESS
+    http2: bool = False
+    json_codec: str = "stdlib"
+
+    retry_max_attempts: int = 1
+    retry_backoff_base: float = 0.05
+    retry_backoff_max: float = 1.0
+    retry_non_idempotent: bool = False
+    retry_budget_ratio: float = 0.1
+    hedge_delay: float | None = None
+    hedge_max: int = 1
+
+    discard_body: bool = False
+
+    def to_limits(self) -> Limits:
+        """
+        :return: Лимиты пула соединений httpx.
+        """
+        return Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def to_http_versions(self) -> dict[str, bool]:
+        """
+        Параметры http1/http2 для транспорта httpx.
+
+        По https версия протокола согласуется через ALPN. По открытому http://
+        HTTP/2 возможен только с prior knowledge (h2c), поэтому HTTP/1.1 отключается.
+
+        :return: Словарь с ключами http1 и http2.
+        """
+        if not self.http2:
+            return {"http1": True, "http2": False}
+        return {"http1": self.base_url.startswith("https://"), "http2": True}
+
+    def to_retry_policy(self) -> RetryPolicy | None:
+        """
+        :return: Политика повторов или None, если повторы выключены.
+        """
+        if self.retry_max_attempts <= 1:
+            return None
+        return RetryPolicy(
+            max_attempts=self.retry_max_attempts,
+            backoff_base=self.retry_backoff_base,
+            backoff_max=self.retry_backoff_max,
+            retry_non_idempotent=self.retry_non_idempotent,
+        )
+
+    def to_hedge_policy(self) -> HedgePolicy | None:
+        """
+        :return: Политика хеджирования или None, если хеджирование выключено.
+        """
+        if self.hedge_delay is None:
+            return None
+        return HedgePolicy(delay=self.hedge_delay, max_hedges=self.hedge_max)
+
+    def to_timeout(self) -> Timeout:
+        """
+        :return: Таймауты httpx по фазам запроса.
+        """
+        return Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
+
+@lru_cache(maxsize=None)
+def get_gateway_http_config() -> GatewayHTTPConfig:
+    """
+    Возвращает настройки gateway для текущего процесса (читаются один раз).
+
+    :return: Экземпляр GatewayHTTPConfig.
+    """
+    return GatewayHTTPConfig.from_env()
+
+
+@lru_cache(maxsize=None)
+def get_gateway_retry_budget() -> RetryBudget:
+    """
+    Общий бюджет повторов для всех gateway-клиентов процесса, HTTP и gRPC.
+
+    :return: Экземпляр RetryBudget.
+    """
+    return RetryBudget(ratio=get_gateway_http_config().retry_budget_ratio)
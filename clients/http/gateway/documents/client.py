@@ -62,12 +62,16 @@ def build_documents_gateway_http_client() -> DocumentsGatewayHTTPClient:
     return DocumentsGatewayHTTPClient(client=build_gateway_http_client())
 '''
 from httpx import Response
-from clients.http.client import HTTPClient
+from clients.http.client import HTTPClient, AsyncHTTPClient
 from clients.http.gateway.documents.schema import (
     GetTariffDocumentResponseSchema,
     GetContractDocumentResponseSchema,
 )
-from clients.http.gateway.client import build_gateway_http_client
+from clients.http.gateway.client import (
+    build_gateway_http_client,
+    build_gateway_async_http_client,
+    build_gateway_http_client_options,
+)
 
 
 class DocumentsGatewayHTTPClient(HTTPClient):
@@ -82,7 +86,7 @@ class DocumentsGatewayHTTPClient(HTTPClient):
         :param account_id: Идентификатор счета.
         :return: Ответ от сервера (объект httpx.Response).
         """
-        return self.get(f"/api/v1/documents/tariff-document/{account_id}")
+        return self.get(f"/api/v1/documents/tariff-document/{account_id}", name="get_tariff_document")
 
     def get_contract_document_api(self, account_id: str) -> Response:
         """
@@ -91,17 +95,17 @@ class DocumentsGatewayHTTPClient(HTTPClient):
         :param account_id: Идентификатор счета.
         :return: Ответ от сервера (объект httpx.Response).
         """
-        return self.get(f"/api/v1/documents/contract-document/{account_id}")
+        return self.get(f"/api/v1/documents/contract-document/{account_id}", name="get_contract_document")
 
     # Добавили новый метод
     def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponseSchema:
         response = self.get_tariff_document_api(account_id)
-        return GetTariffDocumentResponseSchema.model_validate_json(response.text)
+        return self.validate(response, GetTariffDocumentResponseSchema)
 
     # Добавили новый метод
     def get_contract_document(self, account_id: str) -> GetContractDocumentResponseSchema:
         response = self.get_contract_document_api(account_id)
-        return GetContractDocumentResponseSchema.model_validate_json(response.text)
+        return self.validate(response, GetContractDocumentResponseSchema)
 
 
 # Добавляем builder для DocumentsGatewayHTTPClient
@@ -111,4 +115,51 @@ def build_documents_gateway_http_client() -> DocumentsGatewayHTTPClient:
 
     :return: Готовый к использованию DocumentsGatewayHTTPClient.
     """
-    return DocumentsGatewayHTTPClient(client=build_gateway_http_client())
+    return DocumentsGatewayHTTPClient(
+        client=build_gateway_http_client(),
+        options=build_gateway_http_client_options()
+    )
+
+
+class AsyncDocumentsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/documents сервиса http-gateway.
+    """
+
+    async def get_tariff_document_api(self, account_id: str) -> Response:
+        """
+        Получить тарифа по счету.
+
+        :param account_id: Идентификатор счета.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(f"/api/v1/documents/tariff-document/{account_id}", name="get_tariff_document")
+
+    async def get_contract_document_api(self, account_id: str) -> Response:
+        """
+        Получить контракта по счету.
+
+        :param account_id: Идентификатор счета.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(f"/api/v1/documents/contract-document/{account_id}", name="get_contract_document")
+
+    async def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponseSchema:
+        response = await self.get_tariff_document_api(account_id)
+        return self.validate(response, GetTariffDocumentResponseSchema)
+
+    async def get_contract_document(self, account_id: str) -> GetContractDocumentResponseSchema:
+        response = await self.get_contract_document_api(account_id)
+        return self.validate(response, GetContractDocumentResponseSchema)
+
+
+def build_async_documents_gateway_http_client() -> AsyncDocumentsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncDocumentsGatewayHTTPClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncDocumentsGatewayHTTPClient.
+    """
+    return AsyncDocumentsGatewayHTTPClient(
+        client=build_gateway_async_http_client(),
+        options=build_gateway_http_client_options()
+    )
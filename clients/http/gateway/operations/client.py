@@ -1,7 +1,15 @@
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from typing import AsyncIterator, Iterator
+
 from httpx import Response, QueryParams
-from clients.http.client import HTTPClient
-from clients.http.gateway.client import build_gateway_http_client
+from clients.http.client import HTTPClient, AsyncHTTPClient
+from clients.http.gateway.client import (
+    build_gateway_http_client,
+    build_gateway_async_http_client,
+    build_gateway_http_client_options,
+)
 from clients.http.gateway.operations.schema import *
+from clients.http.streaming import JSONArrayStreamParser
 
 
 class OperationsGatewayHTTPClient(HTTPClient):
@@ -14,7 +22,21 @@ class OperationsGatewayHTTPClient(HTTPClient):
         """
         return self.get(
             "/api/v1/operations",
-            params=QueryParams(**query.model_dump(by_alias=True))
+            params=QueryParams(**query.model_dump(by_alias=True)),
+            name="get_operations"
+        )
+
+    def get_operations_stream_api(self, query: GetOperationsQuerySchema) -> AbstractContextManager[Response]:
+        """
+        Выполняет GET-запрос на получение списка операций с потоковым чтением ответа.
+        :param query: Словарь с параметрами запроса, например: {'accountId': 'ca7d831c-3bcb-4022-a938-be6d002d59f8'}.
+        :return: Контекстный менеджер с объектом httpx.Response, тело которого ещё не прочитано.
+        """
+        return self.stream(
+            "GET",
+            "/api/v1/operations",
+            params=QueryParams(**query.model_dump(by_alias=True)),
+            name="get_operations_stream"
         )
 
     def get_operations_summary_api(self, query: GetOperationsSummaryQuerySchema) -> Response:
@@ -26,7 +48,8 @@ class OperationsGatewayHTTPClient(HTTPClient):
         # return self.get("/api/v1/operations/operations-summary", params=QueryParams(**query))
         return self.get(
             "/api/v1/operations/operations-summary",
-            params=QueryParams(**query.model_dump(by_alias=True))
+            params=QueryParams(**query.model_dump(by_alias=True)),
+            name="get_operations_summary"
         )
 
     def get_operation_receipt_api(self, operation_id: str) -> Response:
@@ -35,7 +58,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :param operation_id: Идентификатор операции.
         :return: Ответ от сервера (объект httpx.Response).
         """
-        return self.get(f"/api/v1/operations/operation-receipt/{operation_id}")
+        return self.get(f"/api/v1/operations/operation-receipt/{operation_id}", name="get_operation_receipt")
 
     def get_operation_api(self, operation_id: str) -> Response:
         """
@@ -43,7 +66,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :param operation_id: Идентификатор операции.
         :return: Ответ от сервера (объект httpx.Response).
         """
-        return self.get(f"/api/v1/operations/{operation_id}")
+        return self.get(f"/api/v1/operations/{operation_id}", name="get_operation")
 
     def make_fee_operation_api(self, request: MakeFeeOperationRequestSchema) -> Response:
         """
@@ -53,7 +76,8 @@ class OperationsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/operations/make-fee-operation",
-            request.model_dump(by_alias=True)
+            request,
+            name="make_fee_operation"
         )
 
     def make_top_up_operation_api(self, request: MakeTopUpOperationRequestSchema) -> Response:
@@ -64,7 +88,8 @@ class OperationsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/operations/make-top-up-operation",
-            request.model_dump(by_alias=True)
+            request,
+            name="make_top_up_operation"
         )
 
     def make_cashback_operation_api(self, request: MakeCashbackOperationRequestSchema) -> Response:
@@ -76,7 +101,8 @@ class OperationsGatewayHTTPClient(HTTPClient):
         # return self.post("/api/v1/operations/make-cashback-operation", json=request)
         return self.post(
             "/api/v1/operations/make-cashback-operation",
-            request.model_dump(by_alias=True)
+            request,
+            name="make_cashback_operation"
         )
 
     def make_transfer_operation_api(self, request: MakeTransferOperationRequestSchema) -> Response:
@@ -87,7 +113,8 @@ class OperationsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/operations/make-transfer-operation",
-            request.model_dump(by_alias=True)
+            request,
+            name="make_transfer_operation"
         )
 
     def make_purchase_operation_api(self, request: MakePurchaseOperationRequestSchema) -> Response:
@@ -98,7 +125,8 @@ class OperationsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/operations/make-purchase-operation",
-            request.model_dump(by_alias=True)
+            request,
+            name="make_purchase_operation"
         )
 
     def make_bill_payment_operation_api(self, request: MakeBillPaymentOperationRequestSchema) -> Response:
@@ -109,7 +137,8 @@ class OperationsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/operations/make-bill-payment-operation",
-            request.model_dump(by_alias=True)
+            request,
+            name="make_bill_payment_operation"
         )
 
     def make_cash_withdrawal_operation_api(self, request: MakeCashWithdrawalOperationRequestSchema) -> Response:
@@ -120,27 +149,46 @@ class OperationsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/operations/make-cash-withdrawal-operation",
-            request.model_dump(by_alias=True)
+            request,
+            name="make_cash_withdrawal_operation"
         )
 
     # Добавляем новые высокоуровнеые методы
     def get_operations(self, account_id: str) -> GetOperationsResponseSchema:
         query = GetOperationsQuerySchema(accountId=account_id)
         response = self.get_operations_api(query)
-        return GetOperationsResponseSchema.model_validate_json(response.text)
+        return self.validate(response, GetOperationsResponseSchema)
+
+    def iter_operations(self, account_id: str) -> Iterator[OperationSchema]:
+        """
+        Возвращает операции счёта по одной, разбирая ответ по мере чтения из сокета.
+        В отличие от get_operations, весь список не держится в памяти, поэтому
+        пиковое потребление памяти не зависит от длины истории операций.
+
+        :param account_id: Идентификатор счета.
+        :return: Генератор OperationSchema.
+        """
+        query = GetOperationsQuerySchema(accountId=account_id)
+        with self.get_operations_stream_api(query) as response:
+            response.raise_for_status()
+            parser = JSONArrayStreamParser("operations")
+            for chunk in response.iter_bytes():
+                for item in parser.feed(chunk):
+                    yield OperationSchema.model_validate(item)
+            parser.close()
 
     def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponseSchema:
         query = GetOperationsSummaryQuerySchema(accountId=account_id)
         response = self.get_operations_summary_api(query)
-        return GetOperationsSummaryResponseSchema.model_validate_json(response.text)
+        return self.validate(response, GetOperationsSummaryResponseSchema)
 
     def get_operation_receipt(self, operation_id: str) -> GetOperationReceiptResponseSchema:
         response = self.get_operation_receipt_api(operation_id)
-        return GetOperationReceiptResponseSchema.model_validate_json(response.text)
+        return self.validate(response, GetOperationReceiptResponseSchema)
 
     def get_operation(self, operation_id: str) -> GetOperationResponseSchema:
         response = self.get_operation_api(operation_id)
-        return GetOperationResponseSchema.model_validate_json(response.text)
+        return self.validate(response, GetOperationResponseSchema)
 
     def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponseSchema:
         request = MakeFeeOperationRequestSchema(
@@ -150,7 +198,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
             accountId=account_id
         )
         response = self.make_fee_operation_api(request)
-        return MakeFeeOperationResponseSchema.model_validate_json(response.text)
+        return self.validate(response, MakeFeeOperationResponseSchema)
 
     def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponseSchema:
         request = MakeTopUpOperationRequestSchema(
@@ -158,7 +206,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
             accountId=account_id
         )
         response = self.make_top_up_operation_api(request)
-        return MakeTopUpOperationResponseSchema.model_validate_json(response.text)
+        return self.validate(response, MakeTopUpOperationResponseSchema)
 
     def make_cashback_operation(self, card_id: str, account_id: str) -> MakeCashbackOperationResponseSchema:
         request = MakeCashbackOperationRequestSchema(
@@ -166,7 +214,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
             accountId=account_id
         )
         response = self.make_cashback_operation_api(request)
-        return MakeCashbackOperationResponseSchema.model_validate_json(response.text)
+        return self.validate(response, MakeCashbackOperationResponseSchema)
 
     def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponseSchema:
         request = MakeTransferOperationRequestSchema(
@@ -174,7 +222,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
             accountId=account_id
         )
         response = self.make_transfer_operation_api(request)
-        return MakeTransferOperationResponseSchema.model_validate_json(response.text)
+        return self.validate(response, MakeTransferOperationResponseSchema)
 
     def make_purchase_operation(self, card_id: str, account_id: str
                                 ) -> MakePurchaseOperationResponseSchema:
@@ -183,7 +231,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
             accountId=account_id
         )
         response = self.make_purchase_operation_api(request)
-        return MakePurchaseOperationResponseSchema.model_validate_json(response.text)
+        return self.validate(response, MakePurchaseOperationResponseSchema)
 
     def make_bill_payment_operation(self, card_id: str, account_id: str) -> MakeBillPaymentOperationResponseSchema:
         request = MakeBillPaymentOperationRequestSchema(
@@ -191,7 +239,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
             accountId=account_id
         )
         response = self.make_bill_payment_operation_api(request)
-        return MakeBillPaymentOperationResponseSchema.model_validate_json(response.text)
+        return self.validate(response, MakeBillPaymentOperationResponseSchema)
 
     def make_cash_withdrawal_operation(self, card_id: str,
                                        account_id: str) -> MakeCashWithdrawalOperationResponseSchema:
@@ -200,7 +248,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
             accountId=account_id
         )
         response = self.make_cash_withdrawal_operation_api(request)
-        return MakeCashWithdrawalOperationResponseSchema.model_validate_json(response.text)
+        return self.validate(response, MakeCashWithdrawalOperationResponseSchema)
 
 
 # Добавляем builder для OperationsGatewayHTTPClient
@@ -210,4 +258,257 @@ def build_operations_gateway_http_client() -> OperationsGatewayHTTPClient:
 
     :return: Готовый к использованию OperationsGatewayHTTPClient
     """
-    return OperationsGatewayHTTPClient(client=build_gateway_http_client())
+    return OperationsGatewayHTTPClient(
+        client=build_gateway_http_client(),
+        options=build_gateway_http_client_options()
+    )
+
+
+class AsyncOperationsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/operations сервиса http-gateway.
+    """
+
+    async def get_operations_api(self, query: GetOperationsQuerySchema) -> Response:
+        """
+        Выполняет GET-запрос на получение списка операций для определенного счета.
+        :param query: Словарь с параметрами запроса, например: {'accountId': 'ca7d831c-3bcb-4022-a938-be6d002d59f8'}.
+        :return: Объект httpx.Response с данными об операции.
+        """
+        return await self.get(
+            "/api/v1/operations",
+            params=QueryParams(**query.model_dump(by_alias=True)),
+            name="get_operations"
+        )
+
+    def get_operations_stream_api(self, query: GetOperationsQuerySchema) -> AbstractAsyncContextManager[Response]:
+        """
+        Выполняет GET-запрос на получение списка операций с потоковым чтением ответа.
+        :param query: Словарь с параметрами запроса, например: {'accountId': 'ca7d831c-3bcb-4022-a938-be6d002d59f8'}.
+        :return: Контекстный менеджер с объектом httpx.Response, тело которого ещё не прочитано.
+        """
+        return self.stream(
+            "GET",
+            "/api/v1/operations",
+            params=QueryParams(**query.model_dump(by_alias=True)),
+            name="get_operations_stream"
+        )
+
+    async def get_operations_summary_api(self, query: GetOperationsSummaryQuerySchema) -> Response:
+        """
+        Выполняет GET-запрос на получение статистики по операциям для определенного счета.
+        :param query: Словарь с параметрами запроса, например: {'accountId': 'ca7d831c-3bcb-4022-a938-be6d002d59f8'}.
+        :return: Объект httpx.Response с данными об операции.
+        """
+        return await self.get(
+            "/api/v1/operations/operations-summary",
+            params=QueryParams(**query.model_dump(by_alias=True)),
+            name="get_operations_summary"
+        )
+
+    async def get_operation_receipt_api(self, operation_id: str) -> Response:
+        """
+        Получить чек по операции по operation_id.
+        :param operation_id: Идентификатор операции.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(f"/api/v1/operations/operation-receipt/{operation_id}", name="get_operation_receipt")
+
+    async def get_operation_api(self, operation_id: str) -> Response:
+        """
+        Получить информацию об операции по operation_id.
+        :param operation_id: Идентификатор операции.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(f"/api/v1/operations/{operation_id}", name="get_operation")
+
+    async def make_fee_operation_api(self, request: MakeFeeOperationRequestSchema) -> Response:
+        """
+        Создание операции комиссии.
+        :param request: Словарь с данными по операции.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(
+            "/api/v1/operations/make-fee-operation",
+            request,
+            name="make_fee_operation"
+        )
+
+    async def make_top_up_operation_api(self, request: MakeTopUpOperationRequestSchema) -> Response:
+        """
+        Создание операции пополнения.
+        :param request: Словарь с данными по операции.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(
+            "/api/v1/operations/make-top-up-operation",
+            request,
+            name="make_top_up_operation"
+        )
+
+    async def make_cashback_operation_api(self, request: MakeCashbackOperationRequestSchema) -> Response:
+        """
+        Создание операции кэшбэка.
+        :param request: Словарь с данными по операции.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(
+            "/api/v1/operations/make-cashback-operation",
+            request,
+            name="make_cashback_operation"
+        )
+
+    async def make_transfer_operation_api(self, request: MakeTransferOperationRequestSchema) -> Response:
+        """
+        Создание операции перевода.
+        :param request: Словарь с данными по операции.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(
+            "/api/v1/operations/make-transfer-operation",
+            request,
+            name="make_transfer_operation"
+        )
+
+    async def make_purchase_operation_api(self, request: MakePurchaseOperationRequestSchema) -> Response:
+        """
+        Создание операции покупки.
+        :param request: Словарь с данными по операции.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(
+            "/api/v1/operations/make-purchase-operation",
+            request,
+            name="make_purchase_operation"
+        )
+
+    async def make_bill_payment_operation_api(self, request: MakeBillPaymentOperationRequestSchema) -> Response:
+        """
+        Создание операции оплаты по счету.
+        :param request: Словарь с данными по операции.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(
+            "/api/v1/operations/make-bill-payment-operation",
+            request,
+            name="make_bill_payment_operation"
+        )
+
+    async def make_cash_withdrawal_operation_api(self, request: MakeCashWithdrawalOperationRequestSchema) -> Response:
+        """
+        Создание операции по снятию наличных денег.
+        :param request: Словарь с данными по операции.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(
+            "/api/v1/operations/make-cash-withdrawal-operation",
+            request,
+            name="make_cash_withdrawal_operation"
+        )
+
+    async def get_operations(self, account_id: str) -> GetOperationsResponseSchema:
+        query = GetOperationsQuerySchema(accountId=account_id)
+        response = await self.get_operations_api(query)
+        return self.validate(response, GetOperationsResponseSchema)
+
+    async def iter_operations(self, account_id: str) -> AsyncIterator[OperationSchema]:
+        """
+        Возвращает операции счёта по одной, разбирая ответ по мере чтения из сокета.
+        В отличие от get_operations, весь список не держится в памяти.
+
+        :param account_id: Идентификатор счета.
+        :return: Асинхронный генератор OperationSchema.
+        """
+        query = GetOperationsQuerySchema(accountId=account_id)
+        async with self.get_operations_stream_api(query) as response:
+            response.raise_for_status()
+            parser = JSONArrayStreamParser("operations")
+            async for chunk in response.aiter_bytes():
+                for item in parser.feed(chunk):
+                    yield OperationSchema.model_validate(item)
+            parser.close()
+
+    async def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponseSchema:
+        query = GetOperationsSummaryQuerySchema(accountId=account_id)
+        response = await self.get_operations_summary_api(query)
+        return self.validate(response, GetOperationsSummaryResponseSchema)
+
+    async def get_operation_receipt(self, operation_id: str) -> GetOperationReceiptResponseSchema:
+        response = await self.get_operation_receipt_api(operation_id)
+        return self.validate(response, GetOperationReceiptResponseSchema)
+
+    async def get_operation(self, operation_id: str) -> GetOperationResponseSchema:
+        response = await self.get_operation_api(operation_id)
+        return self.validate(response, GetOperationResponseSchema)
+
+    async def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponseSchema:
+        request = MakeFeeOperationRequestSchema(
+            # status="COMPLETED",
+            # amount=55.77,
+            cardId=card_id,
+            accountId=account_id
+        )
+        response = await self.make_fee_operation_api(request)
+        return self.validate(response, MakeFeeOperationResponseSchema)
+
+    async def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponseSchema:
+        request = MakeTopUpOperationRequestSchema(
+            cardId=card_id,
+            accountId=account_id
+        )
+        response = await self.make_top_up_operation_api(request)
+        return self.validate(response, MakeTopUpOperationResponseSchema)
+
+    async def make_cashback_operation(self, card_id: str, account_id: str) -> MakeCashbackOperationResponseSchema:
+        request = MakeCashbackOperationRequestSchema(
+            cardId=card_id,
+            accountId=account_id
+        )
+        response = await self.make_cashback_operation_api(request)
+        return self.validate(response, MakeCashbackOperationResponseSchema)
+
+    async def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponseSchema:
+        request = MakeTransferOperationRequestSchema(
+            cardId=card_id,
+            accountId=account_id
+        )
+        response = await self.make_transfer_operation_api(request)
+        return self.validate(response, MakeTransferOperationResponseSchema)
+
+    async def make_purchase_operation(self, card_id: str, account_id: str
+                                ) -> MakePurchaseOperationResponseSchema:
+        request = MakePurchaseOperationRequestSchema(
+            cardId=card_id,
+            accountId=account_id
+        )
+        response = await self.make_purchase_operation_api(request)
+        return self.validate(response, MakePurchaseOperationResponseSchema)
+
+    async def make_bill_payment_operation(self, card_id: str, account_id: str) -> MakeBillPaymentOperationResponseSchema:
+        request = MakeBillPaymentOperationRequestSchema(
+            cardId=card_id,
+            accountId=account_id
+        )
+        response = await self.make_bill_payment_operation_api(request)
+        return self.validate(response, MakeBillPaymentOperationResponseSchema)
+
+    async def make_cash_withdrawal_operation(self, card_id: str,
+                                       account_id: str) -> MakeCashWithdrawalOperationResponseSchema:
+        request = MakeCashWithdrawalOperationRequestSchema(
+            cardId=card_id,
+            accountId=account_id
+        )
+        response = await self.make_cash_withdrawal_operation_api(request)
+        return self.validate(response, MakeCashWithdrawalOperationResponseSchema)
+
+
+def build_async_operations_gateway_http_client() -> AsyncOperationsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncOperationsGatewayHTTPClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncOperationsGatewayHTTPClient
+    """
+    return AsyncOperationsGatewayHTTPClient(
+        client=build_gateway_async_http_client(),
+        options=build_gateway_http_client_options()
+    )
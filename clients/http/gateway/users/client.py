@@ -1,8 +1,12 @@
-import time
 from httpx import Response
-from clients.http.client import HTTPClient
+from clients.http.client import HTTPClient, AsyncHTTPClient
 from typing import TypedDict
-from clients.http.gateway.client import build_gateway_http_client # Импортируем builder
+from clients.http.gateway.client import (  # Импортируем builder
+    build_gateway_http_client,
+    build_gateway_async_http_client,
+    build_gateway_http_client_options,
+)
+from tools.fakers import fake
 
 
 # Добавили описание структуры пользователя
@@ -57,7 +61,7 @@ class UsersGatewayHTTPClient(HTTPClient):
         :param user_id: Идентификатор пользователя.
         :return: Ответ от сервера (объект httpx.Response).
         """
-        return self.get(f"/api/v1/users/{user_id}")
+        return self.get(f"/api/v1/users/{user_id}", name="get_user")
 
     def create_user_api(self, request: CreateUserRequestDict) -> Response:
         """
@@ -66,24 +70,24 @@ class UsersGatewayHTTPClient(HTTPClient):
         :param request: Словарь с данными нового пользователя.
         :return: Ответ от сервера (объект httpx.Response).
         """
-        return self.post("/api/v1/users", json=request)
+        return self.post("/api/v1/users", json=request, name="create_user")
 
     # Добавили новый метод
     def get_user(self, user_id: str) -> GetUserResponseDict:
         response = self.get_user_api(user_id)
-        return response.json()
+        return self.decode(response)
 
     # Добавили новый метод
     def create_user(self) -> CreateUserResponseDict:
         request = CreateUserRequestDict(
-            email=f"user.{time.time()}@example.com",
+            email=fake.email(),
             lastName="string",
             firstName="string",
             middleName="string",
             phoneNumber="string"
         )
         response = self.create_user_api(request)
-        return response.json()
+        return self.decode(response)
 
     # Добавляем builder для UsersGatewayHTTPClient
 
@@ -94,4 +98,58 @@ def build_users_gateway_http_client() -> UsersGatewayHTTPClient:
 
     :return: Готовый к использованию UsersGatewayHTTPClient.
     """
-    return UsersGatewayHTTPClient(client=build_gateway_http_client())
+    return UsersGatewayHTTPClient(
+        client=build_gateway_http_client(),
+        options=build_gateway_http_client_options()
+    )
+
+
+class AsyncUsersGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/users сервиса http-gateway.
+    """
+
+    async def get_user_api(self, user_id: str) -> Response:
+        """
+        Получить данные пользователя по его user_id.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(f"/api/v1/users/{user_id}", name="get_user")
+
+    async def create_user_api(self, request: CreateUserRequestDict) -> Response:
+        """
+        Создание нового пользователя.
+
+        :param request: Словарь с данными нового пользователя.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post("/api/v1/users", json=request, name="create_user")
+
+    async def get_user(self, user_id: str) -> GetUserResponseDict:
+        response = await self.get_user_api(user_id)
+        return self.decode(response)
+
+    async def create_user(self) -> CreateUserResponseDict:
+        request = CreateUserRequestDict(
+            email=fake.email(),
+            lastName="string",
+            firstName="string",
+            middleName="string",
+            phoneNumber="string"
+        )
+        response = await self.create_user_api(request)
+        return self.decode(response)
+
+
+def build_async_users_gateway_http_client() -> AsyncUsersGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncUsersGatewayHTTPClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncUsersGatewayHTTPClient.
+    """
+    return AsyncUsersGatewayHTTPClient(
+        client=build_gateway_async_http_client(),
+        options=build_gateway_http_client_options()
+    )
@@ -0,0 +1,74 @@
+import codecs
+import json
+import re
+from typing import Any
+
+
+class JSONArrayStreamParser:
+    """
+    Инкрементальный разбор массива в JSON-ответе вида {"<key>": [{...}, {...}, ...]}.
+
+    Тело подаётся кусками через feed() по мере чтения из сокета, а парсер возвращает
+    элементы массива, которые уже полностью пришли. В памяти держится только
+    необработанный хвост буфера, поэтому пиковое потребление не зависит от длины
+    массива. Каждый элемент разбирается json.JSONDecoder.raw_decode (C-ускоренный).
+    """
+    _SEPARATORS = re.compile(r"[\s,]*")
+
+    def __init__(self, key: str):
+        """
+        :param key: Ключ верхнеуровневого объекта, под которым лежит массив, например operations.
+        """
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._array_start = re.compile(r'"%s"\s*:\s*\[' % re.escape(key))
+        self._buffer = ""
+        self._in_array = False
+        self.finished = False
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """
+        Добавляет очередной кусок тела ответа.
+
+        :param chunk: Байты из потока ответа (могут обрываться посреди символа или элемента).
+        :return: Список полностью полученных элементов массива (может быть пустым).
+        """
+        if self.finished:
+            return []
+
+        buffer = self._buffer + self._utf8.decode(chunk)
+        if not self._in_array:
+            match = self._array_start.search(buffer)
+            if match is None:
+                self._buffer = buffer
+                return []
+            buffer = buffer[match.end():]
+            self._in_array = True
+
+        items = []
+        position = 0
+        while True:
+            position = self._SEPARATORS.match(buffer, position).end()
+            if position >= len(buffer):
+                break
+            if buffer[position] == "]":
+                self.finished = True
+                position += 1
+                break
+            try:
+                item, position = self._decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                break  # элемент пришёл не полностью — ждём следующий кусок
+            items.append(item)
+
+        self._buffer = buffer[position:]
+        return items
+
+    def close(self) -> None:
+        """
+        Проверяет, что массив был прочитан до конца.
+
+        :raises ValueError: Если поток закончился раньше закрывающей скобки массива.
+        """
+        if not self.finished:
+            raise ValueError("JSON stream ended before the array was closed")
@@ -0,0 +1,69 @@
+from time import perf_counter
+from typing import Any
+
+
+class RequestTimer:
+    """
+    Замер фаз одного HTTP-запроса через trace-расширение httpx (httpcore).
+
+    httpcore вызывает trace-колбэк на границах фаз: connection.connect_tcp.started,
+    http11.send_request_headers.started, http11.receive_response_headers.complete и т.д.
+    В колбэке сохраняется только пара (событие, время), разбор выполняется один раз
+    после получения ответа — так замер стоит единицы микросекунд.
+    """
+    __slots__ = ("started", "events")
+
+    def __init__(self):
+        self.started = perf_counter()
+        self.events: list[tuple[str, float]] = []
+
+    def trace(self, event: str, info: dict[str, Any]) -> None:
+        """
+        Колбэк для синхронного httpx.Client (extensions={"trace": timer.trace}).
+        """
+        self.events.append((event, perf_counter()))
+
+    async def atrace(self, event: str, info: dict[str, Any]) -> None:
+        """
+        Колбэк для httpx.AsyncClient: httpcore требует корутину в асинхронном режиме.
+        """
+        self.events.append((event, perf_counter()))
+
+    def phases(self) -> dict[str, float]:
+        """
+        Длительности фаз запроса в секундах.
+
+        pool_wait — ожидание свободного соединения в пуле;
+        connect — установка TCP (и TLS) соединения, 0 для переиспользованного;
+        write — отправка заголовков и тела запроса;
+        ttfb — от отправки запроса до получения заголовков ответа;
+        read — чтение тела ответа;
+        total — полное время запроса.
+
+        :return: Словарь {фаза: длительность}.
+        """
+        finished = perf_counter()
+        total = finished - self.started
+        if not self.events:
+            return {"total": total}
+
+        # Префикс (connection/http11/http2) отбрасываем: фазы одинаковы для HTTP/1.1 и HTTP/2
+        marks = {event.partition(".")[2]: moment for event, moment in self.events}
+
+        phases = {"pool_wait": self.events[0][1] - self.started, "total": total}
+
+        connect_started = marks.get("connect_tcp.started")
+        connect_finished = marks.get("start_tls.complete", marks.get("connect_tcp.complete"))
+        phases["connect"] = connect_finished - connect_started if connect_started and connect_finished else 0.0
+
+        write_started = marks.get("send_request_headers.started")
+        write_finished = marks.get("send_request_body.complete")
+        headers_received = marks.get("receive_response_headers.complete")
+        if write_started and write_finished:
+            phases["write"] = write_finished - write_started
+        if write_finished and headers_received:
+            phases["ttfb"] = headers_received - write_finished
+        if headers_received:
+            phases["read"] = finished - headers_received
+
+        return phases
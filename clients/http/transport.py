@@ -0,0 +1,241 @@
+import asyncio
+import os
+import threading
+import weakref
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Callable, Generic, TypeVar
+
+from httpx import AsyncBaseTransport, AsyncHTTPTransport, BaseTransport, HTTPTransport, Request, Response
+
+TransportT = TypeVar("TransportT", HTTPTransport, AsyncHTTPTransport)
+
+
+class TransportScope(StrEnum):
+    """
+    Область, в пределах которой переиспользуется один транспорт (пул соединений).
+
+    PROCESS — один пул на процесс, его используют все клиенты и все greenlet'ы процесса.
+    GREENLET — отдельный пул на каждый greenlet (виртуального пользователя).
+    """
+    PROCESS = "process"
+    GREENLET = "greenlet"
+
+
+@dataclass
+class TransportStats:
+    """
+    Статистика переиспользования транспортов реестра.
+
+    :param created: Сколько транспортов (пулов соединений) было создано.
+    :param reused: Сколько раз клиенту был выдан уже существующий транспорт.
+    """
+    created: int = 0
+    reused: int = 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        """
+        Доля выдач, обслуженных уже существующим пулом.
+        """
+        total = self.created + self.reused
+        return self.reused / total if total else 0.0
+
+
+class SharedHTTPTransport(BaseTransport):
+    """
+    Обёртка над общим HTTPTransport, которую получает каждый httpx.Client.
+
+    httpx.Client.close() закрывает свой транспорт, поэтому обёртка игнорирует close():
+    закрытие одного клиента не должно рвать соединения остальных. Реальный пул
+    закрывается только через TransportRegistry.close().
+    """
+
+    def __init__(self, transport: HTTPTransport):
+        self.transport = transport
+
+    def handle_request(self, request: Request) -> Response:
+        return self.transport.handle_request(request)
+
+    def close(self) -> None:
+        pass
+
+
+class SharedAsyncHTTPTransport(AsyncBaseTransport):
+    """
+    Асинхронный аналог SharedHTTPTransport для httpx.AsyncClient.
+    """
+
+    def __init__(self, transport: AsyncHTTPTransport):
+        self.transport = transport
+
+    async def handle_async_request(self, request: Request) -> Response:
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+def get_running_loop() -> asyncio.AbstractEventLoop | None:
+    """
+    :return: Работающий event loop текущего потока; None, если вызов не из корутины.
+    """
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def count_open_connections(transport: HTTPTransport | AsyncHTTPTransport) -> int | None:
+    """
+    Число соединений в пуле транспорта.
+
+    httpx не даёт публичного доступа к пулу: соединения считаются по внутреннему пулу
+    httpcore (_pool.connections). Если во внутренностях httpx что-то поменяется,
+    счётчик просто станет недоступен, а снимок статистики продолжит работать.
+
+    :param transport: Транспорт httpx.
+    :return: Число открытых соединений; None, если пул недоступен.
+    """
+    connections = getattr(getattr(transport, "_pool", None), "connections", None)
+    return len(connections) if connections is not None else None
+
+
+class TransportRegistry(Generic[TransportT]):
+    """
+    Реестр общих транспортов httpx для всех gateway-клиентов.
+
+    Вместо того чтобы каждый httpx.Client открывал собственный пул соединений,
+    клиенты получают транспорт из реестра. Сценарий «создать пользователя → открыть
+    счёт → пополнить» в рамках одного виртуального пользователя использует один пул.
+
+    Транспорт привязан к PID: после fork дочерний процесс создаёт свой пул,
+    сокеты родителя не разделяются между процессами.
+
+    Асинхронный пул привязан ещё и к event loop, в котором открыты его соединения.
+    С per_event_loop=True транспорт области PROCESS выдаётся отдельно для каждого
+    работающего loop'а, а записи закрытых loop'ов отбрасываются: следующий asyncio.run()
+    получает новый пул, а не пул с соединениями закрытого loop'а.
+    """
+
+    def __init__(
+            self,
+            factory: Callable[[], TransportT],
+            scope: TransportScope = TransportScope.PROCESS,
+            per_event_loop: bool = False
+    ):
+        """
+        :param factory: Функция, создающая новый транспорт (пул соединений).
+        :param scope: Область переиспользования транспорта.
+        :param per_event_loop: Отдельный транспорт для каждого event loop (для асинхронных транспортов).
+        """
+        self.factory = factory
+        self.scope = scope
+        self.per_event_loop = per_event_loop
+        self.stats = TransportStats()
+
+        self._lock = threading.Lock()
+        self._pid: int | None = None
+        self._process_transport: TransportT | None = None
+        self._greenlet_transports: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._loop_transports: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def get(self) -> TransportT:
+        """
+        Возвращает транспорт для текущей области, создавая его при первом обращении.
+
+        :return: Общий транспорт httpx.
+        """
+        with self._lock:
+            pid = os.getpid()
+            if pid != self._pid:
+                self._reset(pid)
+
+            if self.scope == TransportScope.GREENLET:
+                from greenlet import getcurrent  # greenlet нужен только в этом режиме
+
+                key = getcurrent()
+                transport = self._greenlet_transports.get(key)
+                if transport is None:
+                    transport = self._greenlet_transports[key] = self._create()
+                else:
+                    self.stats.reused += 1
+                return transport
+
+            loop = get_running_loop() if self.per_event_loop else None
+            if loop is not None:
+                self._drop_closed_loops()
+                transport = self._loop_transports.get(loop)
+                if transport is None:
+                    transport = self._loop_transports[loop] = self._create()
+                else:
+                    self.stats.reused += 1
+                return transport
+
+            if self._process_transport is None:
+                self._process_transport = self._create()
+            else:
+                self.stats.reused += 1
+            return self._process_transport
+
+    def transports(self) -> list[TransportT]:
+        """
+        :return: Список транспортов, созданных в текущем процессе.
+        """
+        transports = [*self._greenlet_transports.values(), *self._loop_transports.values()]
+        if self._process_transport is not None:
+            transports.append(self._process_transport)
+        return transports
+
+    def snapshot(self) -> dict:
+        """
+        Снимок статистики реестра для отчёта о прогоне.
+
+        :return: Словарь с количеством созданных/переиспользованных пулов и открытых соединений
+                 (open_connections — None, если пул httpx недоступен).
+        """
+        counts = [count_open_connections(transport) for transport in self.transports()]
+        connections = None if None in counts else sum(counts)
+        return {
+            "scope": str(self.scope),
+            "created": self.stats.created,
+            "reused": self.stats.reused,
+            "reuse_ratio": round(self.stats.reuse_ratio, 4),
+            "open_connections": connections,
+        }
+
+    def close(self) -> None:
+        """
+        Закрывает все синхронные транспорты реестра.
+        """
+        with self._lock:
+            for transport in self.transports():
+                transport.close()
+            self._reset(self._pid)
+
+    async def aclose(self) -> None:
+        """
+        Закрывает все асинхронные транспорты реестра.
+        Транспорты уже закрытых event loop'ов только отбрасываются: закрыть их соединения нельзя.
+        """
+        with self._lock:
+            self._drop_closed_loops()
+        for transport in self.transports():
+            await transport.aclose()
+        with self._lock:
+            self._reset(self._pid)
+
+    def _create(self) -> TransportT:
+        self.stats.created += 1
+        return self.factory()
+
+    def _drop_closed_loops(self) -> None:
+        for loop in [loop for loop in self._loop_transports if loop.is_closed()]:
+            del self._loop_transports[loop]
+
+    def _reset(self, pid: int | None) -> None:
+        self._pid = pid
+        self._process_transport = None
+        self._greenlet_transports = weakref.WeakKeyDictionary()
+        self._loop_transports = weakref.WeakKeyDictionary()
+        self.stats = TransportStats()
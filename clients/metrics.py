@@ -0,0 +1,131 @@
+import statistics
+from collections import defaultdict
+from typing import Any, Mapping, Protocol
+
+Tags = Mapping[str, str]
+
+
+class MetricsSink(Protocol):
+    """
+    Приёмник метрик, общий для HTTP- и gRPC-клиентов.
+
+    Реализация может складывать значения в память, отправлять их в StatsD/Prometheus
+    или в события Locust — клиенты знают только этот интерфейс.
+    """
+    enabled: bool
+
+    def timing(self, name: str, value: float, tags: Tags) -> None:
+        """
+        Записывает длительность.
+
+        :param name: Имя метрики, например http.request.ttfb.
+        :param value: Длительность в секундах.
+        :param tags: Теги метрики, например {"endpoint": "get_user"}.
+        """
+        ...
+
+    def increment(self, name: str, tags: Tags, value: int = 1) -> None:
+        """
+        Увеличивает счётчик.
+
+        :param name: Имя счётчика.
+        :param tags: Теги счётчика.
+        :param value: На сколько увеличить.
+        """
+        ...
+
+    def annotate(self, name: str, value: Any) -> None:
+        """
+        Сохраняет описание прогона, например действующие настройки клиентов.
+        Повторная запись с тем же именем заменяет значение.
+
+        :param name: Имя аннотации, например grpc.config.
+        :param value: JSON-совместимое значение.
+        """
+        ...
+
+
+class NullMetricsSink:
+    """
+    Приёмник, который ничего не делает. Клиенты проверяют enabled и
+    при выключенных метриках не тратят время даже на замеры.
+    """
+    enabled = False
+
+    def timing(self, name: str, value: float, tags: Tags) -> None:
+        pass
+
+    def increment(self, name: str, tags: Tags, value: int = 1) -> None:
+        pass
+
+    def annotate(self, name: str, value: Any) -> None:
+        pass
+
+
+class InMemoryMetricsSink:
+    """
+    Приёмник, накапливающий метрики в памяти процесса.
+    Удобен для бенчмарков и итогового отчёта по прогону.
+    """
+    enabled = True
+
+    def __init__(self):
+        self.timings: defaultdict[tuple, list[float]] = defaultdict(list)
+        self.counters: defaultdict[tuple, int] = defaultdict(int)
+        self.annotations: dict[str, Any] = {}
+
+    def timing(self, name: str, value: float, tags: Tags) -> None:
+        self.timings[(name, tuple(tags.items()))].append(value)
+
+    def increment(self, name: str, tags: Tags, value: int = 1) -> None:
+        self.counters[(name, tuple(tags.items()))] += value
+
+    def annotate(self, name: str, value: Any) -> None:
+        self.annotations[name] = value
+
+    def summary(self) -> dict:
+        """
+        Сводка по накопленным метрикам.
+
+        :return: Словарь {"timings": [...], "counters": [...], "annotations": {...}};
+                 тайминги — count/mean/p50/p99/max в миллисекундах.
+        """
+        timings = []
+        for (name, tags), values in sorted(self.timings.items()):
+            percentiles = statistics.quantiles(values, n=100) if len(values) > 1 else values * 99
+            timings.append({
+                "name": name,
+                "tags": dict(tags),
+                "count": len(values),
+                "mean_ms": statistics.fmean(values) * 1000,
+                "p50_ms": percentiles[49] * 1000,
+                "p99_ms": percentiles[98] * 1000,
+                "max_ms": max(values) * 1000,
+            })
+
+        counters = [
+            {"name": name, "tags": dict(tags), "value": value}
+            for (name, tags), value in sorted(self.counters.items())
+        ]
+        return {"timings": timings, "counters": counters, "annotations": dict(self.annotations)}
+
+
+_metrics_sink: MetricsSink = NullMetricsSink()
+
+
+def get_metrics_sink() -> MetricsSink:
+    """
+    :return: Приёмник метрик процесса.
+    """
+    return _metrics_sink
+
+
+def set_metrics_sink(sink: MetricsSink) -> None:
+    """
+    Устанавливает приёмник метрик процесса. Вызывается при старте нагрузочного прогона,
+    до создания клиентов.
+
+    :param sink: Приёмник метрик.
+    """
+    global _metrics_sink
+    _metrics_sink = sink
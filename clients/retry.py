@@ -0,0 +1,299 @@
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Awaitable, Callable, TypeVar
+
+ResultT = TypeVar("ResultT")
+
+# Решает, нужно ли повторить вызов: получает результат (или None) и исключение (или None)
+RetryCondition = Callable[[ResultT | None, BaseException | None], bool]
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Политика повторов с экспоненциальной задержкой и полным джиттером.
+
+    :param max_attempts: Максимум попыток, включая первую (1 — без повторов).
+    :param backoff_base: Базовая задержка перед первым повтором, секунды.
+    :param backoff_max: Верхняя граница задержки, секунды.
+    :param retry_statuses: HTTP-статусы, после которых запрос повторяется.
+    :param retry_codes: Имена кодов gRPC (grpc.StatusCode), после которых вызов повторяется.
+    :param retry_non_idempotent: Повторять ли неидемпотентные вызовы (POST, Make*/Create*)
+                                 после ошибок, когда запрос мог дойти до сервера.
+                                 Ошибки установки соединения повторяются всегда.
+    """
+    max_attempts: int = 3
+    backoff_base: float = 0.05
+    backoff_max: float = 1.0
+    retry_statuses: frozenset[int] = frozenset({502, 503, 504})
+    retry_codes: frozenset[str] = frozenset({"UNAVAILABLE"})
+    retry_non_idempotent: bool = False
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Задержка перед повтором номер attempt (full jitter): случайное значение
+        от 0 до min(backoff_max, backoff_base * 2^(attempt - 1)). Джиттер разносит
+        повторы тысяч виртуальных пользователей во времени.
+
+        :param attempt: Номер уже выполненной попытки, начиная с 1.
+        :return: Задержка в секундах.
+        """
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """
+    Политика хеджирования идемпотентных запросов: если ответа нет за delay секунд,
+    параллельно отправляется ещё одна копия запроса и берётся первый успешный ответ.
+
+    :param delay: Сколько ждать ответа перед отправкой хеджирующего запроса, секунды.
+                  Обычно выбирается около p95 задержки эндпоинта.
+    :param max_hedges: Максимум дополнительных копий запроса.
+    """
+    delay: float = 0.05
+    max_hedges: int = 1
+
+
+class RetryBudget:
+    """
+    Бюджет повторов как доля от общего трафика (token bucket).
+
+    Каждый исходный запрос добавляет в бюджет ratio токенов, каждый повтор или хедж
+    забирает один токен. При ratio=0.1 повторов не может быть больше ~10% запросов,
+    поэтому при перегрузке gateway повторы не умножают нагрузку. min_per_second
+    гарантирует небольшой поток повторов при низком трафике.
+
+    Бюджет общий для всех клиентов, которые получили один и тот же экземпляр.
+    """
+
+    def __init__(self, ratio: float = 0.1, min_per_second: float = 10.0, max_tokens: float = 1000.0):
+        """
+        :param ratio: Доля повторов от числа запросов.
+        :param min_per_second: Сколько повторов в секунду разрешено независимо от трафика.
+        :param max_tokens: Максимальный запас токенов.
+        """
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+
+        self._lock = threading.Lock()
+        self._tokens = min(min_per_second, max_tokens)
+        self._updated = time.monotonic()
+
+    def deposit(self) -> None:
+        """
+        Учитывает исходный запрос.
+        """
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """
+        Пытается потратить токен на повтор или хедж.
+
+        :return: True, если повтор разрешён.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.max_tokens, self._tokens + (now - self._updated) * self.min_per_second)
+            self._updated = now
+
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+def call_with_retry(
+        call: Callable[[], ResultT],
+        policy: RetryPolicy,
+        budget: RetryBudget,
+        should_retry: RetryCondition,
+        on_retry: Callable[[], None] | None = None,
+) -> ResultT:
+    """
+    Выполняет call, повторяя его по политике, пока это разрешает бюджет.
+    Исходный запрос учитывает вызывающий код через budget.deposit().
+
+    :param call: Вызов без аргументов.
+    :param policy: Политика повторов.
+    :param budget: Общий бюджет повторов.
+    :param should_retry: Условие повтора по результату/исключению.
+    :param on_retry: Колбэк перед каждым повтором (для метрик).
+    :return: Результат последней попытки; исключение последней попытки пробрасывается.
+    """
+    attempt = 0
+    while True:
+        result, error = None, None
+        try:
+            result = call()
+        except Exception as exc:
+            error = exc
+
+        attempt += 1
+        if attempt >= policy.max_attempts or not should_retry(result, error) or not budget.withdraw():
+            if error is not None:
+                raise error
+            return result
+
+        if on_retry is not None:
+            on_retry()
+        time.sleep(policy.backoff(attempt))
+
+
+async def acall_with_retry(
+        call: Callable[[], Awaitable[ResultT]],
+        policy: RetryPolicy,
+        budget: RetryBudget,
+        should_retry: RetryCondition,
+        on_retry: Callable[[], None] | None = None,
+) -> ResultT:
+    """
+    Асинхронный аналог call_with_retry.
+    """
+    attempt = 0
+    while True:
+        result, error = None, None
+        try:
+            result = await call()
+        except Exception as exc:
+            error = exc
+
+        attempt += 1
+        if attempt >= policy.max_attempts or not should_retry(result, error) or not budget.withdraw():
+            if error is not None:
+                raise error
+            return result
+
+        if on_retry is not None:
+            on_retry()
+        await asyncio.sleep(policy.backoff(attempt))
+
+
+_hedge_executor: ThreadPoolExecutor | None = None
+_hedge_executor_lock = threading.Lock()
+
+
+def get_hedge_executor() -> ThreadPoolExecutor:
+    """
+    Пул потоков для хеджирующих вызовов синхронных клиентов (до 256 потоков на процесс).
+
+    Без gevent это настоящие потоки ОС: каждая копия запроса, включая исходную, занимает
+    поток пула до своего завершения. Под gevent (monkey.patch_all до импорта клиентов)
+    потоки пула становятся greenlet'ами. Прервать уже отправленный синхронный запрос
+    нельзя, поэтому проигравшая копия дорабатывает в своём потоке, см. call_hedged.
+    """
+    global _hedge_executor
+    with _hedge_executor_lock:
+        if _hedge_executor is None:
+            _hedge_executor = ThreadPoolExecutor(max_workers=256, thread_name_prefix="hedge")
+        return _hedge_executor
+
+
+def call_hedged(
+        call: Callable[[], ResultT],
+        policy: HedgePolicy,
+        budget: RetryBudget,
+        on_hedge: Callable[[], None] | None = None,
+        discard: Callable[[ResultT], None] | None = None,
+) -> ResultT:
+    """
+    Выполняет идемпотентный call с хеджированием: если ответа нет за policy.delay,
+    запускается ещё одна копия (пока позволяют max_hedges и бюджет).
+    Возвращается первый успешный результат; если все копии упали — последняя ошибка.
+
+    Копии выполняются в пуле get_hedge_executor(). После победы ещё не начатые копии
+    отменяются, а уже отправленные дорабатывают в фоне, и их результат передаётся
+    в discard (например, чтобы закрыть HTTP-ответ и вернуть соединение в пул).
+
+    :param call: Идемпотентный вызов без аргументов.
+    :param policy: Политика хеджирования.
+    :param budget: Общий бюджет повторов (хеджи расходуют его так же, как повторы).
+    :param on_hedge: Колбэк при отправке каждого хеджа (для метрик).
+    :param discard: Освобождает результат проигравшей копии; None — результат просто отбрасывается.
+    :return: Результат первого успешного вызова.
+    """
+    executor = get_hedge_executor()
+    pending: set[Future] = {executor.submit(call)}
+    hedges = 0
+    error: BaseException | None = None
+
+    while pending:
+        can_hedge = hedges < policy.max_hedges
+        done, pending = wait(pending, timeout=policy.delay if can_hedge else None, return_when=FIRST_COMPLETED)
+
+        for future in done:
+            if future.exception() is None:
+                release_hedges(pending | (done - {future}), discard)
+                return future.result()
+            error = future.exception()
+
+        if not done and can_hedge and budget.withdraw():
+            hedges += 1
+            if on_hedge is not None:
+                on_hedge()
+            pending.add(executor.submit(call))
+        elif not done and can_hedge:
+            hedges = policy.max_hedges  # бюджет исчерпан — просто ждём исходный вызов
+
+    raise error
+
+
+def release_hedges(futures: set[Future], discard: Callable[[ResultT], None] | None) -> None:
+    """
+    Отменяет ещё не начатые копии, а результаты остальных передаёт в discard по мере завершения.
+
+    :param futures: Копии, проигравшие гонку.
+    :param discard: Освобождает результат копии; None — ничего не делать с результатом.
+    """
+    def release(future: Future) -> None:
+        if not future.cancelled() and future.exception() is None:
+            discard(future.result())
+
+    for future in futures:
+        if not future.cancel() and discard is not None:
+            future.add_done_callback(release)
+
+
+async def acall_hedged(
+        call: Callable[[], Awaitable[ResultT]],
+        policy: HedgePolicy,
+        budget: RetryBudget,
+        on_hedge: Callable[[], None] | None = None,
+) -> ResultT:
+    """
+    Асинхронный аналог call_hedged. Проигравшие копии отменяются.
+    """
+    pending: set[asyncio.Task] = {asyncio.ensure_future(call())}
+    hedges = 0
+    error: BaseException | None = None
+
+    try:
+        while pending:
+            can_hedge = hedges < policy.max_hedges
+            done, pending = await asyncio.wait(
+                pending, timeout=policy.delay if can_hedge else None, return_when=asyncio.FIRST_COMPLETED
+            )
+
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+
+            if not done and can_hedge and budget.withdraw():
+                hedges += 1
+                if on_hedge is not None:
+                    on_hedge()
+                pending.add(asyncio.ensure_future(call()))
+            elif not done and can_hedge:
+                hedges = policy.max_hedges
+    finally:
+        for task in pending:
+            task.cancel()
+
+    raise error
@@ -0,0 +1,31 @@
+from tools.batches import BatchBuffer, BatchSampler
+
+
+def test_buffer_refills_in_blocks():
+    blocks = []
+
+    def refill(size: int) -> list[int]:
+        blocks.append(size)
+        return list(range(len(blocks) * 100, len(blocks) * 100 + size))
+
+    buffer = BatchBuffer(refill, size=3)
+
+    assert [buffer.next() for _ in range(7)] == [100, 101, 102, 200, 201, 202, 300]
+    assert blocks == [3, 3, 3]
+
+
+def test_sampler_values_are_in_range():
+    sampler = BatchSampler(seed=1, use_numpy=False)
+
+    amounts = sampler.uniform(1, 1000, 1000)
+    choices = sampler.choices(["a", "b", "c"], 1000)
+
+    assert all(1 <= amount <= 1000 and round(amount, 2) == amount for amount in amounts)
+    assert set(choices) == {"a", "b", "c"}
+
+
+def test_seeded_sampler_is_deterministic():
+    first, second = BatchSampler(seed=42, use_numpy=False), BatchSampler(seed=42, use_numpy=False)
+
+    assert first.uniform(1, 100, 50) == second.uniform(1, 100, 50)
+    assert first.choices(range(10), 50) == second.choices(range(10), 50)
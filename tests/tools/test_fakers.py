@@ -0,0 +1,146 @@
+import enum
+import os
+
+from tools.fakers import CATEGORIES, Fake, FakePool, build_faker, build_worker_seed, fake
+from tools.unique import UniqueIdGenerator
+
+
+class Color(enum.Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+class Status:
+    """
+    Заменяет protobuf-перечисление: Fake.proto_enum использует только values().
+    """
+
+    @staticmethod
+    def values() -> list[int]:
+        return [0, 1, 2]
+
+
+def test_default_instances_share_unique_ids():
+    first, second = Fake(), Fake()
+
+    assert first.unique is second.unique
+    assert len({first.unique_id(), second.unique_id(), first.email(), Fake(seed=7).email()}) == 4
+
+
+def test_child_streams_do_not_overlap():
+    parent = UniqueIdGenerator("run-1-")
+    children = [parent.child(f"u{index}") for index in range(3)]
+
+    values = [generator.next() for generator in [parent, *children] for _ in range(100)]
+
+    assert len(set(values)) == len(values)
+
+
+def test_unique_ids_after_fork():
+    before = fake.unique_id()
+    read, write = os.pipe()
+
+    pid = os.fork()
+    if pid == 0:
+        os.close(read)
+        os.write(write, f"{fake.unique_id()} {Fake().unique_id()}".encode())
+        os._exit(0)
+
+    os.close(write)
+    child = os.read(read, 1024).decode().split()
+    os.close(read)
+    os.waitpid(pid, 0)
+
+    assert len({before, fake.unique_id(), *child}) == 4
+
+
+def test_pool_is_loaded_from_file_without_faker(tmp_path):
+    path = tmp_path / "pool.json"
+    generated = FakePool.load_or_generate(build_faker, path, size=20)
+
+    def fail() -> None:
+        raise AssertionError("Faker must not be built when the pool file exists")
+
+    loaded = FakePool.load_or_generate(fail, path, size=20)
+
+    assert loaded.values == generated.values
+    assert len(loaded.values["email"]) == 20
+
+
+def test_pool_mode_uses_pool_values():
+    pool = FakePool({
+        "email": ["user@example.com"],
+        "last_name": ["Smith"],
+        "first_name": ["Anna"],
+        "phone_number": ["+100"],
+        "amount": [12.5],
+    })
+    instance = Fake(pool=pool)
+
+    assert (instance.last_name(), instance.first_name(), instance.phone_number(), instance.amount()) == (
+        "Smith", "Anna", "+100", 12.5
+    )
+    local, _, domain = instance.email().partition("@")
+    assert local.startswith("user.") and domain == "example.com"
+    assert instance._faker is None
+
+
+def test_batches_generate_valid_values():
+    instance = Fake(seed=3)
+    instance.use_batches(8)
+
+    amounts = [instance.amount() for _ in range(20)]
+    categories = {instance.category() for _ in range(200)}
+
+    assert all(1 <= amount <= 1000 for amount in amounts)
+    assert categories <= set(CATEGORIES) and len(categories) > 1
+
+
+def draw(instance: Fake) -> list:
+    return [
+        instance.last_name(),
+        instance.first_name(),
+        instance.amount(),
+        instance.category(),
+        instance.enum(Color),
+        instance.proto_enum(Status),
+    ]
+
+
+def test_same_seed_gives_same_stream():
+    assert draw(Fake(seed=11)) == draw(Fake(seed=11))
+    assert draw(Fake(seed=11).for_user(5)) == draw(Fake(seed=11).for_user(5))
+    assert draw(Fake(seed=11).for_user(5)) != draw(Fake(seed=11).for_user(6))
+
+
+def test_proto_enum_skips_unspecified():
+    instance = Fake(seed=1)
+
+    assert {instance.proto_enum(Status) for _ in range(200)} == {1, 2}
+
+
+def test_worker_seed_accepts_string_ids(monkeypatch):
+    monkeypatch.setenv("FAKE_SEED", "7")
+
+    assert build_worker_seed(3) == build_worker_seed("3")
+    assert build_worker_seed("host-a") != build_worker_seed("host-b")
+
+
+def email_parts(instance: Fake, count: int) -> list[tuple[str, str]]:
+    """
+    :return: Email'ы без уникального суффикса: (локальная часть, домен).
+    """
+    parts = []
+    for _ in range(count):
+        local, _, domain = instance.email().partition("@")
+        parts.append((local.rsplit(".", 1)[0], domain))
+    return parts
+
+
+def test_user_emails_do_not_depend_on_other_users():
+    alone = email_parts(Fake(seed=5).for_user(1), 5)
+
+    root = Fake(seed=5)
+    email_parts(root.for_user(2), 1200)
+
+    assert email_parts(root.for_user(1), 5) == alone
@@ -0,0 +1,85 @@
+import random
+from typing import Any, Callable, Generic, Sequence, TypeVar
+
+ValueT = TypeVar("ValueT")
+
+_EMPTY = object()
+
+
+class BatchSampler:
+    """
+    Векторизованная выборка случайных значений блоками.
+
+    Если установлен NumPy, блок генерируется одним вызовом numpy.random.Generator,
+    иначе — random.choices из стандартной библиотеки (цикл выборки тоже на C).
+    В обоих случаях стоимость одного значения — доли микросекунды против
+    десятков микросекунд у провайдеров Faker.
+    """
+
+    def __init__(self, seed: int | None = None, use_numpy: bool | None = None):
+        """
+        :param seed: Зерно генератора; None — случайное.
+        :param use_numpy: Использовать NumPy; None — если он установлен.
+        """
+        self.random = random.Random(seed)
+        self.numpy = None
+
+        if use_numpy is not False:
+            try:
+                import numpy  # необязательная зависимость, нужна только для векторизованной выборки
+            except ImportError:
+                if use_numpy:
+                    raise
+            else:
+                self.numpy = numpy.random.default_rng(seed)
+
+    def uniform(self, start: float, end: float, size: int, digits: int = 2) -> list[float]:
+        """
+        :param start: Начало диапазона.
+        :param end: Конец диапазона.
+        :param size: Размер блока.
+        :param digits: Знаков после запятой.
+        :return: Блок равномерно распределённых чисел с округлением до digits знаков.
+        """
+        if self.numpy is not None:
+            return self.numpy.uniform(start, end, size).round(digits).tolist()
+
+        scale = 10 ** digits
+        units = self.random.choices(range(round(start * scale), round(end * scale) + 1), k=size)
+        return [unit / scale for unit in units]
+
+    def choices(self, population: Sequence[ValueT], size: int) -> list[ValueT]:
+        """
+        :param population: Из чего выбирать.
+        :param size: Размер блока.
+        :return: Блок значений, выбранных равновероятно с возвращением.
+        """
+        if self.numpy is not None:
+            return [population[index] for index in self.numpy.integers(0, len(population), size).tolist()]
+        return self.random.choices(population, k=size)
+
+
+class BatchBuffer(Generic[ValueT]):
+    """
+    Буфер значений, которые генерируются блоками и выдаются по одному.
+    """
+
+    def __init__(self, refill: Callable[[int], list[ValueT]], size: int = 4096):
+        """
+        :param refill: Функция, генерирующая блок заданного размера.
+        :param size: Размер блока.
+        """
+        self.refill = refill
+        self.size = size
+
+        self._values = iter(())
+
+    def next(self) -> ValueT:
+        """
+        :return: Очередное значение; при исчерпании буфера генерируется новый блок.
+        """
+        value: Any = next(self._values, _EMPTY)
+        if value is _EMPTY:
+            self._values = iter(self.refill(self.size))
+            value = next(self._values)
+        return value
@@ -1,18 +1,370 @@
-import time
-from faker import Faker
-from faker.providers.python import TEnum
+import hashlib
+import json
+import os
+import random
+import threading
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
+
+from tools.batches import BatchBuffer, BatchSampler
+from tools.unique import UniqueIdGenerator, build_run_id, build_unique_ids
+
+# Faker и protobuf нужны здесь только для аннотаций: импорт Faker откладывается до build_faker()
+if TYPE_CHECKING:
+    from faker import Faker
+    from google.protobuf.internal.enum_type_wrapper import EnumTypeWrapper
+
+TEnum = TypeVar("TEnum", bound=Enum)
+
+
+def derive_seed(seed: int, *keys: Any) -> int:
+    """
+    Выводит независимое зерно для подпотока из зерна прогона.
+
+    Используется стабильный хеш (а не hash(), который рандомизируется между процессами),
+    поэтому один и тот же (seed, keys) даёт одно и то же зерно в любом процессе.
+
+    :param seed: Зерно прогона (или родительского потока).
+    :param keys: Путь подпотока, например ("worker", 3) или ("user", 42).
+    :return: 64-битное зерно.
+    """
+    digest = hashlib.blake2b(repr((seed, *keys)).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def build_faker(locale: str | None = None) -> "Faker":
+    """
+    Создаёт Faker только с провайдерами из FAKER_PROVIDERS.
+
+    Faker() по умолчанию импортирует и создаёт все стандартные провайдеры, что заметно
+    увеличивает время старта каждого процесса-воркера. Пакет faker импортируется здесь,
+    а не при импорте модуля.
+
+    :param locale: Локаль Faker; None — локаль по умолчанию.
+    :return: Экземпляр Faker.
+    """
+    from faker import Faker
+
+    return Faker(locale, providers=list(FAKER_PROVIDERS))
+
+
+CATEGORIES = [
+    "gas",
+    "taxi",
+    "tolls",
+    "water",
+    "beauty",
+    "mobile",
+    "travel",
+    "parking",
+    "catalog",
+    "internet",
+    "satellite",
+    "education",
+    "government",
+    "healthcare",
+    "restaurants",
+    "electricity",
+    "supermarkets",
+]
+
+def proto_enum_values(value: "EnumTypeWrapper") -> list[int]:
+    """
+    :param value: Перечисление из сгенерированного *_pb2 модуля.
+    :return: Числовые значения элементов без нулевого (*_UNSPECIFIED), если есть другие.
+    """
+    return [number for number in value.values() if number != 0] or value.values()
+
+
+# Провайдеры Faker, которые использует Fake: person (имена), internet и company (email
+# и домены), phone_number, python (pyfloat, enum). Остальные ~20 провайдеров не загружаются
+FAKER_PROVIDERS = (
+    "faker.providers.person",
+    "faker.providers.company",
+    "faker.providers.internet",
+    "faker.providers.phone_number",
+    "faker.providers.python",
+)
+
+# Сколько email'ов генерирует Faker для набора локальных частей и доменов, если пула нет.
+# Набор строится один раз на процесс при первом email'е, поэтому размер ограничивает стоимость старта
+EMAIL_PARTS_SIZE = 256
+
+
+class FakePool:
+    """
+    Заранее сгенерированные массивы значений для Fake.
+
+    Генерация через провайдеры Faker стоит десятки микросекунд на поле, а создание
+    одного пользователя — это пять полей. Пул генерирует (или загружает из файла)
+    большие массивы один раз при старте, после чего значение выдаётся за O(1)
+    выбором случайного индекса — Faker в горячем пути запроса не участвует.
+    """
+    FIELDS = ("email", "last_name", "first_name", "phone_number", "amount")
+
+    def __init__(self, values: dict[str, list[Any]]):
+        """
+        :param values: Массивы значений по именам полей из FIELDS.
+        """
+        self.values = values
+
+    @classmethod
+    def generate(cls, faker: "Faker", size: int = 10_000) -> "FakePool":
+        """
+        Генерирует массивы значений через Faker.
+
+        :param faker: Экземпляр Faker.
+        :param size: Количество значений каждого поля.
+        :return: Новый пул.
+        """
+        return cls({
+            "email": [faker.email() for _ in range(size)],
+            "last_name": [faker.last_name() for _ in range(size)],
+            "first_name": [faker.first_name() for _ in range(size)],
+            "phone_number": [faker.phone_number() for _ in range(size)],
+            "amount": [faker.pyfloat(min_value=1, max_value=1000, right_digits=2) for _ in range(size)],
+        })
+
+    @classmethod
+    def load(cls, path: str | Path) -> "FakePool":
+        """
+        :param path: Путь к JSON-файлу, сохранённому через dump().
+        :return: Пул из файла.
+        """
+        return cls(json.loads(Path(path).read_text(encoding="utf-8")))
+
+    def dump(self, path: str | Path) -> None:
+        """
+        Сохраняет пул в JSON-файл, чтобы следующие запуски не тратили время на генерацию.
+
+        :param path: Путь к файлу.
+        """
+        Path(path).write_text(json.dumps(self.values, ensure_ascii=False), encoding="utf-8")
+
+    @classmethod
+    def load_or_generate(
+            cls,
+            faker: Callable[[], "Faker"],
+            path: str | Path | None = None,
+            size: int = 10_000
+    ) -> "FakePool":
+        """
+        Загружает пул из файла, если он есть и содержит все поля, иначе генерирует и сохраняет.
+        Faker запрашивается только для генерации: при загрузке из файла он не создаётся.
+
+        :param faker: Функция, возвращающая экземпляр Faker для генерации.
+        :param path: Путь к файлу кэша; None — без файла.
+        :param size: Количество значений каждого поля при генерации.
+        :return: Пул.
+        """
+        if path is not None and Path(path).exists():
+            pool = cls.load(path)
+            if all(pool.values.get(field) for field in cls.FIELDS):
+                return pool
+
+        pool = cls.generate(faker(), size)
+        if path is not None:
+            pool.dump(path)
+        return pool
+
+    def get(self, field: str, rng: random.Random) -> Any:
+        """
+        :param field: Имя поля из FIELDS.
+        :param rng: Генератор случайных чисел потока, который выбирает индекс.
+        :return: Случайное значение из массива поля.
+        """
+        values = self.values[field]
+        return values[int(rng.random() * len(values))]
+
+
+class EmailParts:
+    """
+    Набор пар (локальная часть, домен) для email'ов.
+
+    Строится один раз при первом обращении — из email'ов пула или, без пула, отдельным
+    экземпляром Faker с зерном, выведенным из зерна потока, — и дальше только читается.
+    Поэтому набор можно разделять между потоками виртуальных пользователей: email'ы
+    одного пользователя не зависят от того, сколько email'ов уже выбрали другие.
+    """
+
+    def __init__(self, pool: FakePool | None, seed: int | None):
+        """
+        :param pool: Пул значений или None.
+        :param seed: Зерно потока, из которого выводится зерно набора; None — случайный набор.
+        """
+        self.pool = pool
+        self.seed = seed
+
+        self._lock = threading.Lock()
+        self._parts: list[tuple[str, str]] | None = None
+
+    def get(self) -> list[tuple[str, str]]:
+        """
+        :return: Список пар (локальная часть, домен).
+        """
+        if self._parts is None:
+            with self._lock:
+                if self._parts is None:
+                    self._parts = self._build()
+        return self._parts
+
+    def _build(self) -> list[tuple[str, str]]:
+        if self.pool is not None:
+            emails = self.pool.values["email"]
+        else:
+            faker = build_faker()
+            if self.seed is not None:
+                faker.seed_instance(derive_seed(self.seed, "email_parts"))
+            emails = [faker.email() for _ in range(EMAIL_PARTS_SIZE)]
+        return [tuple(email.rsplit("@", 1)) for email in emails]
 
 
 class Fake:
     """
     Класс для генерации случайных тестовых данных с использованием библиотеки Faker.
+
+    В режиме пула (use_pool) имена, телефоны, email'ы и суммы берутся из FakePool,
+    а категории и значения enum выбираются напрямую, без провайдеров Faker.
+    В пакетном режиме (use_batches) суммы, категории и значения enum генерируются
+    блоками векторизованной выборкой (BatchSampler) и выдаются из буфера.
+
+    С зерном (seed) все методы берут случайность только из генераторов, выведенных
+    из него: Faker, выбор из пула и пакетная выборка. Тогда прогон с тем же зерном
+    отправляет те же данные. for_user() выдаёт независимый поток для виртуального пользователя.
+    В email'ы и unique_id() дополнительно входят идентификаторы прогона и воркера
+    (см. build_process_unique_ids), поэтому для побайтового повтора они тоже должны совпадать.
+
+    Faker создаётся (через build_faker) при первом обращении к нему: в режиме пула,
+    загруженного из файла, он может не понадобиться вовсе.
+
+    Уникальность email'ов и unique_id() обеспечивает UniqueIdGenerator (прогон, воркер,
+    счётчик), а не время или случайность: значения не повторяются между процессами прогона.
     """
 
-    def __init__(self, faker: Faker):
+    def __init__(
+            self,
+            faker: "Faker | None" = None,
+            pool: FakePool | None = None,
+            seed: int | None = None,
+            unique: UniqueIdGenerator | None = None
+    ):
+        """
+        :param faker: Экземпляр класса Faker, который будет использоваться для генерации данных;
+                      None — создаётся через build_faker() при первом обращении.
+        :param pool: Пул заранее сгенерированных значений; None — каждое значение генерируется Faker.
+        :param seed: Зерно потока данных; None — без детерминизма.
+        :param unique: Генератор уникальных идентификаторов; по умолчанию — общий генератор
+                       процесса (get_process_unique_ids). Собственный поток — через unique.child().
+        """
+        self.pool = pool
+        self.seed: int | None = None
+        self.random = random.Random()
+        self.unique = unique or get_process_unique_ids()
+
+        self._faker = faker
+
+        self._email_parts: EmailParts | None = None
+        self._enum_members: dict[type, list] = {}
+        self._batches: dict[Any, BatchBuffer] | None = None
+        self._sampler: BatchSampler | None = None
+        self._batch_size = 0
+
+        self.reseed(seed)
+
+    @property
+    def faker(self) -> "Faker":
+        """
+        :return: Экземпляр Faker; создаётся и засеивается зерном экземпляра при первом обращении.
+        """
+        if self._faker is None:
+            self._faker = build_faker()
+            self._seed_faker()
+        return self._faker
+
+    def _seed_faker(self) -> None:
+        self._faker.seed_instance(self.seed if self.seed is not None else self.random.getrandbits(64))
+
+    def reseed(self, seed: int | None) -> None:
+        """
+        Переводит экземпляр на поток с новым зерном (например, в воркере после fork).
+        Буферы пакетного режима генерируются заново из нового потока.
+
+        :param seed: Зерно потока; None — случайное.
+        """
+        self.seed = seed
+        self.random.seed(seed)
+        self._email_parts = EmailParts(self.pool, seed)
+        if self._faker is not None:
+            self._seed_faker()
+        if self._batches is not None:
+            self.use_batches(self._batch_size)
+
+    def for_user(self, user_id: int | str) -> "Fake":
+        """
+        Создаёт независимый поток данных для виртуального пользователя.
+
+        Зерно выводится из зерна этого экземпляра и user_id, поэтому потоки разных
+        пользователей не пересекаются, а при повторе прогона совпадают. Пул значений
+        и набор EmailParts общие (набор только читается), режим пакетов наследуется,
+        уникальные идентификаторы берутся из дочернего потока unique. Свой Faker ребёнок
+        создаёт лениво, только если он понадобится.
+
+        :param user_id: Номер (или идентификатор) виртуального пользователя.
+        :return: Новый экземпляр Fake.
+        """
+        seed = derive_seed(self.seed, "user", user_id) if self.seed is not None else None
+        child = Fake(pool=self.pool, seed=seed, unique=self.unique.child(f"u{user_id}"))
+        child._email_parts = self._email_parts
+        if self._batches is not None:
+            child.use_batches(self._batch_size)
+        return child
+
+    def use_pool(self, pool: FakePool | None) -> None:
+        """
+        Включает (или выключает, если pool=None) режим пула. Вызывается при старте прогона.
+
+        :param pool: Пул значений.
+        """
+        self.pool = pool
+        self._email_parts = EmailParts(pool, self.seed)
+
+    def use_batches(self, size: int | None = 4096, sampler: BatchSampler | None = None) -> None:
+        """
+        Включает (или выключает, если size=None) пакетный режим для сумм, категорий и enum.
+
+        :param size: Сколько значений генерировать за один блок.
+        :param sampler: Генератор блоков; по умолчанию BatchSampler с NumPy, если он установлен,
+                        и с зерном, выведенным из зерна экземпляра.
+        """
+        if size is None:
+            self._batches = None
+            return
+
+        self._sampler = sampler or BatchSampler(
+            seed=derive_seed(self.seed, "batches") if self.seed is not None else None
+        )
+        self._batch_size = size
+        self._batches = {
+            "amount": BatchBuffer(lambda count: self._sampler.uniform(1, 1000, count), size),
+            "category": BatchBuffer(lambda count: self._sampler.choices(CATEGORIES, count), size),
+        }
+
+    def batched_choice(self, key: Any, population: Callable[[], list]) -> Any:
         """
-        :param faker: Экземпляр класса Faker, который будет использоваться для генерации данных.
+        Значение из буфера выбора для key; буфер создаётся при первом обращении.
+
+        :param key: Ключ буфера, например enum-класс.
+        :param population: Функция, возвращающая варианты выбора (вызывается один раз).
+        :return: Случайный вариант.
         """
-        self.faker = faker
+        buffer = self._batches.get(key)
+        if buffer is None:
+            members = population()
+            buffer = self._batches[key] = BatchBuffer(
+                lambda count: self._sampler.choices(members, count), self._batch_size
+            )
+        return buffer.next()
 
     def enum(self, value: type[TEnum]) -> TEnum:
         """
@@ -21,16 +373,66 @@ class Fake:
         :param value: Enum-класс для генерации значения.
         :return: Случайное значение из перечисления.
         """
-        return self.faker.enum(value)
+        if self._batches is not None:
+            return self.batched_choice(value, lambda: list(value))
+        if self.pool is None:
+            return self.faker.enum(value)
+
+        members = self._enum_members.get(value)
+        if members is None:
+            members = self._enum_members[value] = list(value)
+        return self.random.choice(members)
+
+    def proto_enum(self, value: "EnumTypeWrapper") -> int:
+        """
+        Выбирает случайное значение из protobuf-перечисления.
+
+        Нулевой элемент (*_UNSPECIFIED) не выбирается: в proto3 это значение по умолчанию,
+        а не допустимый статус или тип, и сервис отклоняет такие запросы.
+
+        :param value: Перечисление из сгенерированного *_pb2 модуля, например OperationStatus.
+        :return: Числовое значение случайного элемента перечисления.
+        """
+        if self._batches is not None:
+            return self.batched_choice(value, lambda: proto_enum_values(value))
+
+        members = self._enum_members.get(value)
+        if members is None:
+            members = self._enum_members[value] = proto_enum_values(value)
+        if self.pool is None:
+            return self.faker.random_element(members)
+        return self.random.choice(members)
+
+    def email_part(self) -> tuple[str, str]:
+        """
+        Случайная пара (локальная часть, домен) для email'а.
+
+        Пара выбирается генератором потока из общего набора EmailParts.
+
+        :return: Пара (локальная часть, домен).
+        """
+        return self.random.choice(self._email_parts.get())
+
+    def unique_id(self) -> str:
+        """
+        Генерирует уникальный идентификатор для полей с ограничением уникальности.
+
+        :return: Идентификатор вида <прогон>-<воркер>-<счётчик>, не повторяющийся в пределах прогона.
+        """
+        return self.unique.next()
 
     def email(self) -> str:
         """
-        Генерирует случайный email.
+        Генерирует уникальный email.
 
-        Если не указан, будет использован случайный домен.
-        :return: Случайный email.
+        Локальная часть и домен выбираются из заранее подготовленного набора, уникальность
+        даёт суффикс unique_id(): он не зависит от часов, поэтому email'ы не совпадают,
+        даже если пользователей одновременно создают несколько процессов.
+
+        :return: Email вида <локальная часть>.<уникальный идентификатор>@<домен>.
         """
-        return f"{time.time()}.{self.faker.email()}"
+        local, domain = self.email_part()
+        return f"{local}.{self.unique.next()}@{domain}"
 
     def category(self) -> str:
         """
@@ -41,25 +443,11 @@ class Fake:
 
         :return: Случайная категория (например, 'gas', 'taxi', 'supermarkets' и т.д.).
         """
-        return self.faker.random_element([
-            "gas",
-            "taxi",
-            "tolls",
-            "water",
-            "beauty",
-            "mobile",
-            "travel",
-            "parking",
-            "catalog",
-            "internet",
-            "satellite",
-            "education",
-            "government",
-            "healthcare",
-            "restaurants",
-            "electricity",
-            "supermarkets",
-        ])
+        if self._batches is not None:
+            return self._batches["category"].next()
+        if self.pool is None:
+            return self.faker.random_element(CATEGORIES)
+        return self.random.choice(CATEGORIES)
 
     def last_name(self) -> str:
         """
@@ -67,7 +455,9 @@ class Fake:
 
         :return: Случайная фамилия.
         """
-        return self.faker.last_name()
+        if self.pool is None:
+            return self.faker.last_name()
+        return self.pool.get("last_name", self.random)
 
     def first_name(self) -> str:
         """
@@ -75,7 +465,9 @@ class Fake:
 
         :return: Случайное имя.
         """
-        return self.faker.first_name()
+        if self.pool is None:
+            return self.faker.first_name()
+        return self.pool.get("first_name", self.random)
 
     def middle_name(self) -> str:
         """
@@ -83,7 +475,9 @@ class Fake:
 
         :return: Случайное отчество.
         """
-        return self.faker.first_name()
+        if self.pool is None:
+            return self.faker.first_name()
+        return self.pool.get("first_name", self.random)
 
     def phone_number(self) -> str:
         """
@@ -91,7 +485,9 @@ class Fake:
 
         :return: Случайный номер телефона.
         """
-        return self.faker.phone_number()
+        if self.pool is None:
+            return self.faker.phone_number()
+        return self.pool.get("phone_number", self.random)
 
     def float(self, start: int = 1, end: int = 100) -> float:
         """
@@ -109,8 +505,117 @@ class Fake:
 
         :return: Сумма от 1 до 1000.
         """
-        return self.float(1, 1000)
+        if self._batches is not None:
+            return self._batches["amount"].next()
+        if self.pool is None:
+            return self.float(1, 1000)
+        return self.pool.get("amount", self.random)
+
+
+def build_worker_seed(worker_id: int | str) -> int | None:
+    """
+    :param worker_id: Номер (или строковый идентификатор) воркера генератора нагрузки.
+                      Сравнивается как строка: 3 и "3" дают одно и то же зерно.
+    :return: Зерно потока воркера, выведенное из FAKE_SEED; None, если зерно прогона не задано.
+    """
+    seed = os.environ.get("FAKE_SEED")
+    return derive_seed(int(seed), "worker", str(worker_id)) if seed is not None else None
+
+
+# Идентификатор прогона вычисляется при импорте, поэтому процессы, созданные fork, его наследуют
+RUN_ID = build_run_id()
+
+
+def build_process_unique_ids(worker_id: int | str | None = None) -> UniqueIdGenerator:
+    """
+    Генератор уникальных идентификаторов процесса: прогон (FAKE_RUN_ID или время старта)
+    и воркер — переданный номер, FAKE_WORKER_ID или, если он не задан, PID процесса.
+
+    Номер воркера должен быть уникален в пределах прогона: при запуске воркеров на разных
+    машинах задайте FAKE_WORKER_ID (или общий FAKE_RUN_ID и разные FAKE_WORKER_ID).
+
+    :param worker_id: Номер воркера; None — из окружения.
+    :return: Генератор.
+    """
+    if worker_id is None:
+        worker_id = os.environ.get("FAKE_WORKER_ID") or f"p{os.getpid()}"
+    return build_unique_ids(RUN_ID, worker_id)
+
+
+_process_unique_ids: UniqueIdGenerator | None = None
+_process_unique_ids_lock = threading.Lock()
+
+
+def get_process_unique_ids() -> UniqueIdGenerator:
+    """
+    Общий генератор уникальных идентификаторов процесса, создаётся при первом обращении.
+    Его используют все экземпляры Fake без явного unique, поэтому их unique_id()
+    и email'ы не повторяются. После fork генератор переходит на префикс с PID ребёнка.
+
+    :return: Генератор.
+    """
+    global _process_unique_ids
+    if _process_unique_ids is None:
+        with _process_unique_ids_lock:
+            if _process_unique_ids is None:
+                _process_unique_ids = build_process_unique_ids()
+    return _process_unique_ids
+
+
+def build_fake() -> Fake:
+    """
+    Создаёт общий экземпляр Fake.
+
+    Режим пула включается переменными окружения: FAKE_POOL_SIZE — размер массивов,
+    FAKE_POOL_FILE — файл кэша (загружается, если существует, иначе создаётся).
+    Пакетный режим включается FAKE_BATCH_SIZE — размером блока.
+    Без них значения генерируются Faker на каждый вызов, как раньше.
+    FAKE_SEED задаёт зерно прогона, FAKE_WORKER_ID — номер или строковый идентификатор
+    воркера (для зерна по умолчанию 0): поток процесса выводится из пары (зерно, воркер).
+    FAKE_RUN_ID задаёт идентификатор прогона в уникальных email'ах (по умолчанию — время старта).
+
+    FAKE_SEED сам по себе не воспроизводит прогон побайтово: в email'ы входят
+    идентификатор прогона и воркер (без FAKE_WORKER_ID — PID процесса). Для точного
+    повтора задайте те же FAKE_SEED, FAKE_RUN_ID и FAKE_WORKER_ID. Без FAKE_RUN_ID
+    повторный прогон получает новые email'ы и не конфликтует с уже созданными пользователями.
+
+    Faker при этом не создаётся: с заранее сохранённым FAKE_POOL_FILE воркер стартует,
+    не импортируя faker, пока не понадобится генерация вне пула.
+
+    :return: Экземпляр Fake.
+    """
+    fake = Fake(seed=build_worker_seed(os.environ.get("FAKE_WORKER_ID", "0")))
+
+    size = os.environ.get("FAKE_POOL_SIZE")
+    path = os.environ.get("FAKE_POOL_FILE")
+    if size is not None or path is not None:
+        fake.use_pool(FakePool.load_or_generate(lambda: fake.faker, path, int(size or 10_000)))
+
+    batch_size = os.environ.get("FAKE_BATCH_SIZE")
+    if batch_size is not None:
+        fake.use_batches(int(batch_size))
+
+    return fake
 
 
 # Создаем экземпляр класса Fake с использованием Faker
-fake = Fake(faker=Faker())
+fake = build_fake()
+
+
+def configure_fake_worker(worker_id: int | str) -> None:
+    """
+    Переводит общий fake на поток воркера. Вызывается в каждом процессе-воркере
+    при старте (или после fork), чтобы параллельные воркеры генерировали
+    непересекающиеся потоки данных.
+
+    :param worker_id: Номер воркера.
+    """
+    global _process_unique_ids
+
+    fake.reseed(build_worker_seed(worker_id))
+    with _process_unique_ids_lock:
+        unique = build_process_unique_ids(worker_id)
+        # Повторная настройка тем же воркером не должна начинать счётчик того же префикса заново
+        if _process_unique_ids is None or _process_unique_ids.prefix != unique.prefix:
+            _process_unique_ids = unique
+    fake.unique = _process_unique_ids
@@ -0,0 +1,105 @@
+import itertools
+import os
+import time
+import weakref
+
+DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+
+def to_base36(value: int) -> str:
+    """
+    :return: Неотрицательное число в base36 (короткие уникальные токены для email и других полей).
+    """
+    if value == 0:
+        return "0"
+    digits = []
+    while value:
+        value, remainder = divmod(value, 36)
+        digits.append(DIGITS[remainder])
+    return "".join(reversed(digits))
+
+
+class UniqueIdGenerator:
+    """
+    Генератор уникальных идентификаторов вида <префикс><счётчик>.
+
+    Префикс однозначно задаёт поток (прогон, воркер, виртуальный пользователь), счётчик
+    монотонен внутри потока, поэтому значения не повторяются ни внутри процесса, ни между
+    процессами с разными префиксами — без обращения к часам и без случайности.
+    next() потокобезопасен: itertools.count атомарен в CPython.
+
+    Два генератора с одинаковым префиксом выдают одинаковые значения, поэтому независимые
+    потоки создаются только через child(). После fork дочерний процесс унаследовал бы
+    счётчики родителя — все генераторы процесса переходят на префикс с PID ребёнка.
+    """
+
+    def __init__(self, prefix: str):
+        """
+        :param prefix: Префикс потока, например «<прогон>-<воркер>-».
+        """
+        self.prefix = prefix
+        self._counter = itertools.count()
+        _generators.add(self)
+
+    def next(self) -> str:
+        """
+        :return: Очередной уникальный идентификатор.
+        """
+        return f"{self.prefix}{to_base36(next(self._counter))}"
+
+    def child(self, key: int | str) -> "UniqueIdGenerator":
+        """
+        Дочерний поток со своим счётчиком, например для виртуального пользователя.
+        Значения дочерних потоков с разными key не пересекаются между собой и с родителем.
+
+        :param key: Ключ потока, уникальный в пределах родителя.
+        :return: Новый генератор.
+        """
+        return UniqueIdGenerator(f"{self.prefix}{key}-")
+
+    def rebase(self, prefix: str) -> None:
+        """
+        Переводит генератор на новый префикс и начинает счётчик заново.
+
+        :param prefix: Новый префикс; он не должен совпадать ни с одним уже использованным.
+        """
+        self.prefix = prefix
+        self._counter = itertools.count()
+
+
+# Все генераторы процесса — чтобы после fork перевести их на префиксы дочернего процесса
+_generators: "weakref.WeakSet[UniqueIdGenerator]" = weakref.WeakSet()
+
+
+def rebase_after_fork() -> None:
+    """
+    Добавляет PID дочернего процесса к префиксам всех генераторов: значения ребёнка
+    не пересекаются ни с родителем, ни с другими дочерними процессами.
+    """
+    pid = os.getpid()
+    for generator in list(_generators):
+        generator.rebase(f"{generator.prefix}p{pid}-")
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=rebase_after_fork)
+
+
+def build_run_id() -> str:
+    """
+    Идентификатор прогона: FAKE_RUN_ID из окружения, иначе время старта процесса в миллисекундах.
+    Повторный прогон (даже с тем же FAKE_SEED) получает новый идентификатор и не пересекается
+    с пользователями, созданными ранее; для точного воспроизведения задайте FAKE_RUN_ID.
+
+    :return: Короткая строка base36.
+    """
+    return os.environ.get("FAKE_RUN_ID") or to_base36(time.time_ns() // 1_000_000)
+
+
+def build_unique_ids(run_id: str, worker_id: int | str) -> UniqueIdGenerator:
+    """
+    :param run_id: Идентификатор прогона.
+    :param worker_id: Номер воркера, уникальный в пределах прогона.
+    :return: Генератор уникальных идентификаторов процесса.
+    """
+    return UniqueIdGenerator(f"{run_id}-{worker_id}-")